@@ -1,30 +1,64 @@
 #!/usr/bin/env python3
-"""Standalone OpenSearch documentation search script (no external dependencies)."""
+"""Standalone OpenSearch documentation search script (no external dependencies).
+
+Inside the opensearch-feature-explorer checkout, results are cached on disk
+through the repository's search_cache module (shared with mcp_server.py).
+Elsewhere the script works the same without a cache.
+"""
 
 import argparse
 import json
 import sys
 import urllib.parse
 import urllib.request
+from pathlib import Path
+
+
+def _load_cache():
+    """The repository's shared search cache module, when this script runs inside the checkout."""
+    parents = Path(__file__).resolve().parents
+    if len(parents) < 5 or not (parents[4] / "search_cache.py").exists():
+        return None
+    sys.path.insert(0, str(parents[4]))
+    try:
+        import search_cache
+    except ImportError:
+        return None
+    finally:
+        sys.path.pop(0)
+    return search_cache
+
+
+_search_cache = _load_cache()
+_cache = _search_cache.open_cache() if _search_cache else None
+
+
+def _cached(query: str, version: str, types: str, fetch):
+    if not _cache:
+        return fetch()
+    return _cache.get_or_fetch(_search_cache.search_key(query, version, types), fetch)
 
 
 def _fetch_docs(query: str, version: str, types: str) -> list:
-    encoded = urllib.parse.quote(query)
-    url = f"https://search-api.opensearch.org/search?q={encoded}&v={version}&t={types}"
-    with urllib.request.urlopen(url, timeout=10) as resp:
-        return json.loads(resp.read().decode()).get("results", [])
+    def fetch() -> list:
+        encoded = urllib.parse.quote(query)
+        url = f"https://search-api.opensearch.org/search?q={encoded}&v={version}&t={types}"
+        with urllib.request.urlopen(url, timeout=10) as resp:
+            return json.loads(resp.read().decode()).get("results", [])
+    return _cached(query, version, types, fetch)
 
 
 def _fetch_forum(query: str) -> tuple:
-    encoded = urllib.parse.quote(query)
-    url = f"https://forum.opensearch.org/search/query?term={encoded}"
-    req = urllib.request.Request(url, headers={"Accept": "application/json"})
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read().decode())
-    posts = data.get("posts", [])
-    topics = {t["id"]: t for t in data.get("topics", [])}
-    has_more = data.get("grouped_search_result", {}).get("more_posts", False)
-    return posts, topics, has_more
+    def fetch() -> list:
+        encoded = urllib.parse.quote(query)
+        url = f"https://forum.opensearch.org/search/query?term={encoded}"
+        req = urllib.request.Request(url, headers={"Accept": "application/json"})
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            data = json.loads(resp.read().decode())
+        has_more = data.get("grouped_search_result", {}).get("more_posts", False)
+        return [data.get("posts", []), data.get("topics", []), has_more]
+    posts, topics, has_more = _cached(query, "", "forum", fetch)
+    return posts, {t["id"]: t for t in topics}, has_more
 
 
 def search_docs(query: str, version: str = "latest", limit: int = 10, offset: int = 0) -> dict:
@@ -80,6 +114,10 @@ def main():
 
     json.dump(result, sys.stdout, indent=2)
     print()
+    sys.stdout.flush()
+    if _cache:
+        # Let a stale-while-revalidate refresh finish before exiting
+        _cache.wait(timeout=10)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Run a subprocess under wall-clock and inactivity timeouts.
+
+The child starts in its own session (process group), so on expiry the whole
+tree it spawned (kiro-cli and its tool processes) is terminated, then killed
+after a grace period. Output is relayed through a pipe to the caller's file
+or terminal; any output resets the inactivity timer. The last few KB of
+output are kept so callers can classify failures.
+
+Because children do not receive the terminal's SIGINT, live process groups
+are registered; `stop_all` (called from the main thread's SIGINT handler,
+see `install_interrupt_handler`) terminates every one of them, including
+those started from worker threads, and refuses to start new ones.
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import BinaryIO
+
+# Seconds between SIGTERM and SIGKILL of a timed-out process group
+KILL_GRACE = 10
+TAIL_BYTES = 8192
+# Exit code reported for runs interrupted (or refused) by stop_all
+INTERRUPTED_EXIT = 130
+
+_live = set()
+# Reentrant: the SIGINT handler (stop_all) runs on the main thread, possibly
+# while run_watched on that same thread holds the lock around Popen
+_live_lock = threading.RLock()
+_stopping = threading.Event()
+
+
+class WatchedResult:
+    def __init__(self, returncode: int, timed_out: str | None, tail: str):
+        self.returncode = returncode
+        # "wall" or "idle" when the watchdog killed the process, else None
+        self.timed_out = timed_out
+        self.tail = tail
+
+
+def _kill_group(proc: subprocess.Popen):
+    """SIGTERM the process group, then SIGKILL whatever is left after KILL_GRACE."""
+    for sig, grace in ((signal.SIGTERM, KILL_GRACE), (signal.SIGKILL, None)):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            return
+        if grace is None:
+            break
+        try:
+            proc.wait(timeout=grace)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+    proc.wait()
+
+
+def stopping() -> bool:
+    """True once stop_all was called; callers should not start or retry runs."""
+    return _stopping.is_set()
+
+
+def stop_all():
+    """SIGTERM every live process group and refuse new runs.
+
+    Safe to call from the main thread's signal handler: it does not wait, and
+    _live_lock is reentrant, so interrupting run_watched while it holds the lock
+    cannot deadlock. Each run_watched loop notices the stop and escalates to
+    SIGKILL after KILL_GRACE.
+    """
+    _stopping.set()
+    with _live_lock:
+        procs = list(_live)
+    for proc in procs:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def install_interrupt_handler():
+    """Make Ctrl-C stop every watched process group, then raise KeyboardInterrupt as usual."""
+    def on_interrupt(signum, frame):
+        stop_all()
+        signal.default_int_handler(signum, frame)
+
+    signal.signal(signal.SIGINT, on_interrupt)
+
+
+def run_watched(cmd: list[str], output: BinaryIO, cwd=None, wall_timeout: float | None = None,
+                idle_timeout: float | None = None, poll_interval: float = 1.0) -> WatchedResult:
+    """Run `cmd` with stdout/stderr relayed to `output` (a binary file object).
+
+    A timeout of None or 0 disables that limit. KeyboardInterrupt kills the
+    process group before propagating, since the child no longer shares the
+    terminal's process group. After stop_all, nothing is started and the
+    result has INTERRUPTED_EXIT.
+    """
+    with _live_lock:
+        if _stopping.is_set():
+            return WatchedResult(INTERRUPTED_EXIT, None, "")
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                cwd=cwd, start_new_session=True)
+        _live.add(proc)
+    last_output = time.monotonic()
+    tail = bytearray()
+
+    def relay():
+        nonlocal last_output
+        for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+            last_output = time.monotonic()
+            output.write(chunk)
+            output.flush()
+            tail.extend(chunk)
+            del tail[:-TAIL_BYTES]
+
+    reader = threading.Thread(target=relay, daemon=True)
+    reader.start()
+    start = time.monotonic()
+    timed_out = None
+    try:
+        while True:
+            try:
+                proc.wait(timeout=poll_interval)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if _stopping.is_set():
+                _kill_group(proc)
+                break
+            now = time.monotonic()
+            if wall_timeout and now - start > wall_timeout:
+                timed_out = "wall"
+            elif idle_timeout and now - last_output > idle_timeout:
+                timed_out = "idle"
+            if timed_out:
+                _kill_group(proc)
+                break
+    except KeyboardInterrupt:
+        _kill_group(proc)
+        raise
+    finally:
+        with _live_lock:
+            _live.discard(proc)
+        reader.join(timeout=KILL_GRACE)
+        proc.stdout.close()
+    if _stopping.is_set() and not timed_out and proc.returncode != 0:
+        return WatchedResult(INTERRUPTED_EXIT, None, tail.decode(errors="replace"))
+    return WatchedResult(proc.returncode, timed_out, tail.decode(errors="replace"))
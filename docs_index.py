@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Full-text index of the reports under docs/features and docs/releases.
+
+Documents are ranked with BM25. Term frequencies are weighted by field
+(FIELD_WEIGHTS): a term in the `# Title` counts more than one in a `##`
+heading, which counts more than one in the body. Frontmatter `tags` are kept
+per document for filtering.
+
+The index is one binary file, .cache/docs-index.bin, opened with mmap so a
+new process can answer queries without parsing it:
+
+    header      MAGIC, then meta length, term count, terms length, posting count (uint32)
+    meta        JSON: signature, avgdl, documents [path, title, tags, length]
+    term_ends   uint32 per term: end offset of the term in `terms`
+    terms       sorted UTF-8 terms, concatenated (padded to 4 bytes)
+    starts      uint32 per term + 1: first posting of the term
+    doc_ids     uint32 per posting
+    weights     float32 per posting: field-weighted term frequency
+
+`load_index` rebuilds the file when a Markdown file under the source
+directories was added, removed or changed since the last build.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+DOCS_DIR = SCRIPT_DIR / "docs"
+SOURCES = ("features", "releases")
+INDEX_FILE = SCRIPT_DIR / ".cache" / "docs-index.bin"
+
+MAGIC = b"OSFEIDX1"
+HEADER = struct.Struct("<8s4I")
+FIELD_WEIGHTS = {"title": 5.0, "heading": 2.0, "body": 1.0}
+K1 = 1.2
+B = 0.75
+SNIPPET_CHARS = 300
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
+TAG_LINE_RE = re.compile(r"^\s+-\s+(\S+)\s*$")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*$")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to was were with".split())
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def parse_document(text: str) -> tuple[list[str], str, dict[str, str]]:
+    """(tags, title, {field: text}) of a report. The title is its first `#` heading."""
+    tags = []
+    match = FRONTMATTER_RE.match(text)
+    if match:
+        in_tags = False
+        for line in match.group(1).splitlines():
+            if line.startswith("tags:"):
+                in_tags = True
+            elif in_tags and TAG_LINE_RE.match(line):
+                tags.append(TAG_LINE_RE.match(line).group(1))
+            elif line.strip():
+                in_tags = False
+        text = text[match.end():]
+
+    title = ""
+    fields = {"title": [], "heading": [], "body": []}
+    in_code = False
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        heading = None if in_code else HEADING_RE.match(line)
+        if heading and len(heading.group(1)) == 1 and not title:
+            title = heading.group(2)
+            fields["title"].append(title)
+        elif heading:
+            fields["heading"].append(heading.group(2))
+        else:
+            fields["body"].append(line)
+    return tags, title, {field: "\n".join(lines) for field, lines in fields.items()}
+
+
+def source_files(docs_dir: Path = DOCS_DIR) -> list[Path]:
+    return sorted(path for source in SOURCES for path in (docs_dir / source).rglob("*.md"))
+
+
+def signature(files: list[Path]) -> str:
+    """Fingerprint of the source files' names, sizes and modification times."""
+    digest = hashlib.sha256()
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+# -- building ----------------------------------------------------------------
+
+def build_index(index_file: Path = INDEX_FILE, docs_dir: Path = DOCS_DIR) -> int:
+    """Index every report under docs_dir/{features,releases}. Returns the number of documents."""
+    files = source_files(docs_dir)
+    documents = []
+    postings = defaultdict(list)
+    for doc_id, path in enumerate(files):
+        tags, title, fields = parse_document(path.read_text(encoding="utf-8", errors="replace"))
+        weights = Counter()
+        length = 0
+        for field, text in fields.items():
+            tokens = tokenize(text)
+            length += len(tokens)
+            for token in tokens:
+                weights[token] += FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            postings[token].append((doc_id, weight))
+        documents.append([path.relative_to(docs_dir).as_posix(), title or path.stem, tags, length])
+
+    meta = json.dumps({
+        "signature": signature(files),
+        "avgdl": sum(doc[3] for doc in documents) / len(documents) if documents else 0.0,
+        "documents": documents,
+    }).encode()
+    terms = sorted(postings, key=lambda t: t.encode())
+    term_ends, starts, doc_ids, weights = array("I"), array("I", [0]), array("I"), array("f")
+    blob = bytearray()
+    for term in terms:
+        blob += term.encode()
+        term_ends.append(len(blob))
+        for doc_id, weight in postings[term]:
+            doc_ids.append(doc_id)
+            weights.append(weight)
+        starts.append(len(doc_ids))
+
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    # Written to a temporary file and renamed, so processes that have the old index mapped keep it
+    fd, tmp = tempfile.mkstemp(dir=index_file.parent, prefix=index_file.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(meta), len(terms), len(blob), len(doc_ids)))
+            f.write(meta + b" " * (-len(meta) % 4))
+            f.write(term_ends.tobytes())
+            f.write(bytes(blob) + b"\0" * (-len(blob) % 4))
+            f.write(starts.tobytes())
+            f.write(doc_ids.tobytes())
+            f.write(weights.tobytes())
+        os.replace(tmp, index_file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return len(documents)
+
+
+# -- querying ----------------------------------------------------------------
+
+class _Terms:
+    """Sorted term list over the mapped blob, for bisect."""
+
+    def __init__(self, blob: memoryview, ends: memoryview):
+        self.blob = blob
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def __getitem__(self, i: int) -> bytes:
+        return bytes(self.blob[self.ends[i - 1] if i else 0:self.ends[i]])
+
+
+class DocsIndex:
+    """Read-only view of an index file."""
+
+    def __init__(self, index_file: Path = INDEX_FILE, docs_dir: Path = DOCS_DIR):
+        self.docs_dir = docs_dir
+        with open(index_file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, meta_len, term_count, blob_len, posting_count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{index_file} is not a docs index")
+        view = memoryview(self._map)
+        offset = HEADER.size
+
+        def take(size: int, fmt: str | None = None) -> memoryview:
+            nonlocal offset
+            part = view[offset:offset + size]
+            offset += size + (-size % 4)
+            return part.cast(fmt) if fmt else part
+
+        meta = json.loads(bytes(take(meta_len)))
+        self.signature = meta["signature"]
+        self.avgdl = meta["avgdl"] or 1.0
+        self.documents = meta["documents"]
+        term_ends = take(4 * term_count, "I")
+        self._terms = _Terms(take(blob_len), term_ends)
+        self._starts = take(4 * (term_count + 1), "I")
+        self._doc_ids = take(4 * posting_count, "I")
+        self._weights = take(4 * posting_count, "f")
+
+    def _postings(self, term: str) -> tuple[memoryview, memoryview]:
+        key = term.encode()
+        i = bisect.bisect_left(self._terms, key)
+        if i == len(self._terms) or self._terms[i] != key:
+            return memoryview(b"").cast("I"), memoryview(b"").cast("f")
+        start, end = self._starts[i], self._starts[i + 1]
+        return self._doc_ids[start:end], self._weights[start:end]
+
+    def _matches(self, doc: list, tags: list[str], path: str) -> bool:
+        in_path = not path or doc[0] == path or doc[0].startswith(path + "/")
+        return in_path and all(tag in doc[2] for tag in tags)
+
+    def search(self, query: str, tags: list[str] | None = None, path: str = "",
+               limit: int = 10, offset: int = 0) -> dict:
+        """BM25 search. Only documents carrying every tag in `tags` and under `path` are returned."""
+        tags = tags or []
+        path = path.strip("/").removeprefix("docs/")
+        count = len(self.documents)
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            doc_ids, weights = self._postings(term)
+            if not doc_ids:
+                continue
+            idf = math.log(1 + (count - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            for doc_id, tf in zip(doc_ids, weights):
+                norm = K1 * (1 - B + B * self.documents[doc_id][3] / self.avgdl)
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted((doc_id for doc_id in scores if self._matches(self.documents[doc_id], tags, path)),
+                        key=lambda doc_id: (-scores[doc_id], doc_id))
+        results = []
+        for doc_id in ranked[offset:offset + limit]:
+            doc_path, title, doc_tags, _ = self.documents[doc_id]
+            results.append({
+                "title": title,
+                "path": f"docs/{doc_path}",
+                "tags": doc_tags,
+                "score": round(scores[doc_id], 3),
+                "snippet": self.snippet(doc_path, query),
+            })
+        return {
+            "query": query,
+            "tags": tags,
+            "path": path,
+            "total": len(ranked),
+            "offset": offset,
+            "limit": limit,
+            "hasMore": offset + limit < len(ranked),
+            "results": results,
+        }
+
+    def snippet(self, doc_path: str, query: str) -> str:
+        """First body paragraph containing a query term, else the first paragraph."""
+        try:
+            text = (self.docs_dir / doc_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return ""
+        paragraphs = [p.strip() for p in parse_document(text)[2]["body"].split("\n\n")]
+        paragraphs = [p for p in paragraphs if p and not p.startswith(("```", "|"))]
+        terms = set(tokenize(query))
+        for paragraph in paragraphs:
+            if terms & set(tokenize(paragraph)):
+                return paragraph[:SNIPPET_CHARS]
+        return paragraphs[0][:SNIPPET_CHARS] if paragraphs else ""
+
+
+_load_lock = threading.Lock()
+
+
+def load_index(index_file: Path = INDEX_FILE, docs_dir: Path = DOCS_DIR,
+               current: DocsIndex | None = None) -> DocsIndex:
+    """`current` if still up to date, else the index file, (re)built first when missing or stale."""
+    with _load_lock:
+        expected = signature(source_files(docs_dir))
+        if current is not None and current.signature == expected:
+            return current
+        try:
+            index = DocsIndex(index_file, docs_dir)
+            if index.signature == expected:
+                return index
+        except (OSError, ValueError, struct.error):
+            pass
+        print(f"Building docs index {index_file}...", file=sys.stderr)
+        build_index(index_file, docs_dir)
+        return DocsIndex(index_file, docs_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the local docs index")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("build", help="Rebuild the index")
+    search_parser = subparsers.add_parser("search", help="Search the index")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--tag", action="append", default=[], help="Required frontmatter tag (repeatable)")
+    search_parser.add_argument("--path", default="", help="Path prefix under docs/, e.g. features/k-nn")
+    search_parser.add_argument("-l", "--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = build_index()
+        print(f"Indexed {count} documents into {INDEX_FILE}")
+    else:
+        result = load_index().search(args.query, tags=args.tag, path=args.path, limit=args.limit)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
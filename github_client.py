@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Pooled GitHub API client.
+
+Replaces per-call `gh` subprocess spawns with in-process HTTP requests over
+keep-alive connections. The auth token is looked up once per process
+(GH_TOKEN / GITHUB_TOKEN, falling back to `gh auth token`).
+
+The API base URL defaults to https://api.github.com and can be overridden
+with GITHUB_API_URL (e.g. to point at a local stand-in server for tests).
+"""
+
+import http.client
+import json
+import os
+import queue
+import re
+import subprocess
+import threading
+import urllib.parse
+
+import metrics
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_REPO = ("tkykenmt", "opensearch-feature-explorer")
+
+# Idle keep-alive connections retained per client
+POOL_SIZE = 8
+TIMEOUT = 30
+
+
+class GitHubError(Exception):
+    """GitHub API request failed."""
+
+    def __init__(self, status: int, message: str, body=None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+        self.body = body
+
+    @property
+    def rate_limited(self) -> bool:
+        """True for primary/secondary rate limit responses."""
+        return self.status == 429 or (self.status == 403 and "rate limit" in self.message.lower())
+
+
+class GitHubClient:
+    """Thread-safe GitHub REST/GraphQL client with a keep-alive connection pool."""
+
+    def __init__(self, base_url: str | None = None, token: str | None = None,
+                 pool_size: int = POOL_SIZE, timeout: float = TIMEOUT):
+        self.base_url = (base_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL).rstrip("/")
+        parsed = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._prefix = parsed.path.rstrip("/")
+        self._timeout = timeout
+        self._token = token
+        self._token_lock = threading.Lock()
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    # -- auth --------------------------------------------------------------
+
+    def token(self) -> str | None:
+        """Resolve the auth token once and cache it."""
+        if self._token is not None:
+            return self._token or None
+        with self._token_lock:
+            if self._token is None:
+                token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+                if not token:
+                    try:
+                        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+                        token = result.stdout.strip() if result.returncode == 0 else ""
+                    except FileNotFoundError:
+                        token = ""
+                self._token = token
+        return self._token or None
+
+    # -- connection pool ---------------------------------------------------
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "http":
+            return http.client.HTTPConnection(self._netloc, timeout=self._timeout)
+        return http.client.HTTPSConnection(self._netloc, timeout=self._timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    # -- requests ----------------------------------------------------------
+
+    def _url(self, path: str, params: dict | None = None) -> str:
+        if path.startswith(("http://", "https://")):
+            # Absolute URLs (e.g. pagination links) must stay on the same host
+            parsed = urllib.parse.urlsplit(path)
+            url = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        else:
+            url = f"{self._prefix}/{path.lstrip('/')}"
+        if params:
+            sep = "&" if "?" in url else "?"
+            url += sep + urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        return url
+
+    def request_raw(self, method: str, path: str, params: dict | None = None,
+                    body=None, headers: dict | None = None) -> tuple[int, dict, bytes]:
+        """Send a request and return (status, headers, raw body) without raising on HTTP errors."""
+        # Metrics are grouped by endpoint: numbers (issue/PR ids) and the query string are dropped
+        endpoint = re.sub(r"/\d+(?=/|$)", "/{n}", urllib.parse.urlsplit(self._url(path)).path)
+        with metrics.timed("github", f"{method} {endpoint}") as fields:
+            status, resp_headers, data = self._send(method, path, params, body, headers)
+            fields.update(status=status, output_bytes=len(data))
+        return status, resp_headers, data
+
+    def _send(self, method: str, path: str, params: dict | None, body, headers: dict | None) -> tuple[int, dict, bytes]:
+        url = self._url(path, params)
+        send_headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "opensearch-feature-explorer",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        token = self.token()
+        if token:
+            send_headers["Authorization"] = f"Bearer {token}"
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            send_headers["Content-Type"] = "application/json"
+        if headers:
+            send_headers.update(headers)
+
+        # A pooled connection may have been closed by the server; retry once on a fresh one
+        for attempt in range(2):
+            conn = self._acquire() if attempt == 0 else self._new_connection()
+            try:
+                conn.request(method, url, body=payload, headers=send_headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt == 1:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+        raise RuntimeError("unreachable")
+
+    def request(self, method: str, path: str, params: dict | None = None, body=None,
+                headers: dict | None = None):
+        """Send a request and return the decoded JSON body. Raises GitHubError on HTTP errors."""
+        status, _, data = self.request_raw(method, path, params, body, headers)
+        return self._decode(status, data)
+
+    @staticmethod
+    def _decode(status: int, data: bytes):
+        decoded = None
+        if data:
+            try:
+                decoded = json.loads(data)
+            except ValueError:
+                decoded = data.decode("utf-8", errors="replace")
+        if status >= 400:
+            message = decoded.get("message", "") if isinstance(decoded, dict) else str(decoded or "")
+            raise GitHubError(status, message, decoded)
+        return decoded
+
+    def get(self, path: str, params: dict | None = None):
+        return self.request("GET", path, params)
+
+    def get_conditional(self, path: str, etag: str | None = None) -> tuple[object, str | None, bool]:
+        """GET with If-None-Match. Returns (data, etag, modified); data is None when unchanged (HTTP 304)."""
+        headers = {"If-None-Match": etag} if etag else None
+        status, resp_headers, data = self.request_raw("GET", path, headers=headers)
+        if status == 304:
+            return None, etag, False
+        return self._decode(status, data), resp_headers.get("etag"), True
+
+    def post(self, path: str, body=None):
+        return self.request("POST", path, body=body)
+
+    def patch(self, path: str, body=None):
+        return self.request("PATCH", path, body=body)
+
+    def delete(self, path: str):
+        return self.request("DELETE", path)
+
+    def paginate(self, path: str, params: dict | None = None, limit: int | None = None, keep=None) -> list:
+        """GET a list endpoint, following Link headers until exhausted or `limit` items.
+
+        Items for which `keep(item)` is false are dropped and do not count towards `limit`.
+        """
+        params = dict(params or {})
+        params.setdefault("per_page", 100)
+        results = []
+        next_path, next_params = path, params
+        while next_path:
+            status, headers, data = self.request_raw("GET", next_path, next_params)
+            page = self._decode(status, data) or []
+            results.extend(item for item in page if keep is None or keep(item))
+            if limit and len(results) >= limit:
+                return results[:limit]
+            match = re.search(r'<([^>]+)>;\s*rel="next"', headers.get("link", ""))
+            next_path, next_params = (match.group(1), None) if match else (None, None)
+        return results
+
+    def graphql(self, query: str, variables: dict | None = None, partial: bool = False) -> dict:
+        """Run a GraphQL query. Raises GitHubError if the response contains errors.
+
+        With `partial`, errors are tolerated when data is returned (e.g. NOT_FOUND
+        for some aliased lookups); the failed fields are null.
+        """
+        body = {"query": query}
+        if variables:
+            body["variables"] = variables
+        data = self.post("graphql", body)
+        if data.get("errors") and not (partial and data.get("data")):
+            raise GitHubError(200, "; ".join(e.get("message", "") for e in data["errors"]), data)
+        return data["data"]
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> GitHubClient:
+    """Return the process-wide shared client."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GitHubClient()
+    return _client
+
+
+def current_repo() -> tuple[str, str]:
+    """Return (owner, repo) of this checkout from GITHUB_REPOSITORY or the origin remote."""
+    env_repo = os.environ.get("GITHUB_REPOSITORY")
+    if env_repo and "/" in env_repo:
+        owner, repo = env_repo.split("/", 1)
+        return owner, repo
+    result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True)
+    match = re.search(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$", result.stdout.strip())
+    if result.returncode != 0 or not match:
+        return DEFAULT_REPO
+    return match.group(1), match.group(2)
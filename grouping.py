@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Local (non-LLM) helpers for release item grouping.
+
+Batching: items are packed into agent batches by estimated token size so
+each call is as full as the budget allows.
+
+Merging: partial groups.json results from concurrent group-release workers are
+combined in a fixed order, reconciling groups that share a name.
+
+Pre-clustering: items are grouped deterministically by bracketed feature
+prefix (`[Star Tree] ...`) and, within a repository, by MinHash/Jaccard
+similarity of their names. Items that fall into no cluster are left for the
+group-release agent to adjudicate, ordered by repository.
+"""
+
+import itertools
+import re
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+PREFIX_RE = re.compile(r"^\s*\[([^\]]+)\]")
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9\-_.]*[a-z0-9]|[a-z0-9]")
+VERSION_TOKEN_RE = re.compile(r"^v?\d")
+
+# Bracketed prefixes that label the kind of change rather than a feature
+GENERIC_PREFIX_RE = re.compile(
+    r"^(v?\d[\dx.]*|release.*|backport.*|bug|bugfix|fix|feature|enhancement|auto|docs?|ci|tests?|"
+    r"refactor|chore|maintenance|integration|cypress.*|cve-.*|testid-.*)$",
+    re.IGNORECASE,
+)
+
+# Tokens too common in release notes to indicate a shared feature
+STOPWORDS = frozenset("""
+a an and as at be by for from in into of on or the to with without when while via
+add added adds adding fix fixed fixes fixing update updated updates updating bump bumps
+remove removed removes support supports supported allow allows use using make makes
+change changed changes improve improved improves introduce introduced new set default
+enable enabled disable disabled move moved refactor deprecate deprecated pr issue
+""".split())
+
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.4
+_PRIME = (1 << 61) - 1
+# Fixed coefficients keep signatures identical across runs (no hash randomization)
+_PERMS = [((i * 0x9E3779B97F4A7C15 + 1) % _PRIME | 1, (i * 0xC2B2AE3D27D4EB4F + 7) % _PRIME)
+          for i in range(1, NUM_PERM + 1)]
+
+# Rough token estimate for batch packing: ~4 characters per token, plus the
+# JSON keys and punctuation each item carries in batch.json
+CHARS_PER_TOKEN = 4
+ITEM_OVERHEAD_TOKENS = 24
+TOKEN_BUDGET = 4000
+
+
+def feature_prefix(name: str) -> str | None:
+    """Return the `[Feature Name]` prefix of an item name, ignoring generic tags."""
+    match = PREFIX_RE.match(name)
+    if not match:
+        return None
+    prefix = match.group(1).strip()
+    if not prefix or GENERIC_PREFIX_RE.match(prefix):
+        return None
+    return prefix
+
+
+def name_tokens(name: str) -> frozenset:
+    """Informative lowercase tokens of an item name (prefix and stopwords removed)."""
+    name = PREFIX_RE.sub("", name).lower()
+    # Version strings ("3.0.0-alpha1", "v2.19") say nothing about the feature
+    return frozenset(t for t in TOKEN_RE.findall(name)
+                     if t not in STOPWORDS and not VERSION_TOKEN_RE.match(t))
+
+
+def minhash(tokens: frozenset) -> tuple:
+    hashes = [zlib.crc32(t.encode("utf-8")) for t in tokens]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def estimate_tokens(item: dict) -> int:
+    """Estimated tokens an item adds to a batch (name + description + repository)."""
+    chars = sum(len(item.get(key) or "") for key in ("name", "description", "repository"))
+    return ITEM_OVERHEAD_TOKENS + -(-chars // CHARS_PER_TOKEN)
+
+
+def batch_length(sizes: Iterable[int], budget: int = TOKEN_BUDGET, max_items: int | None = None) -> int:
+    """Number of leading items (by token estimate) that fit in `budget`.
+
+    At least one item is always taken so an oversized item still gets a batch.
+    """
+    used = count = 0
+    for size in sizes:
+        if count and (used + size > budget or count == max_items):
+            break
+        used += size
+        count += 1
+    return count
+
+
+def count_batches(items: list[dict], budget: int = TOKEN_BUDGET, max_items: int | None = None) -> int:
+    sizes = [estimate_tokens(item) for item in items]
+    batches = position = 0
+    while position < len(sizes):
+        position += batch_length(itertools.islice(sizes, position, None), budget, max_items)
+        batches += 1
+    return batches
+
+
+def _find(parent: list, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def similarity_clusters(items: list[dict], threshold: float = SIMILARITY_THRESHOLD) -> list[list[int]]:
+    """Cluster item indices whose names are similar (Jaccard >= threshold) within one repository.
+
+    Candidate pairs come from MinHash LSH banding and are verified with exact Jaccard.
+    """
+    tokens = [name_tokens(item["name"]) for item in items]
+    parent = list(range(len(items)))
+    buckets = {}
+    for i, item in enumerate(items):
+        if len(tokens[i]) < 2:
+            continue
+        signature = minhash(tokens[i])
+        for band in range(BANDS):
+            key = (item["repository"], band, signature[band * ROWS:(band + 1) * ROWS])
+            buckets.setdefault(key, []).append(i)
+
+    for members in buckets.values():
+        for n, a in enumerate(members):
+            for b in members[n + 1:]:
+                ra, rb = _find(parent, a), _find(parent, b)
+                if ra != rb and jaccard(tokens[a], tokens[b]) >= threshold:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+    clusters = {}
+    for i in range(len(items)):
+        clusters.setdefault(_find(parent, i), []).append(i)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def cluster_name(items: list[dict]) -> str:
+    """Name a similarity cluster after the words most of its items share."""
+    counts = Counter(t for item in items for t in name_tokens(item["name"]))
+    shared = {t for t, c in counts.items() if c * 2 >= len(items)}
+    words = [w for w in PREFIX_RE.sub("", items[0]["name"]).split()
+             if w.lower().strip("()[]`'\".,:;") in shared]
+    return " ".join(words) or items[0]["name"]
+
+
+def _group(name: str, items: list[dict], basis: str) -> dict:
+    repositories = list(dict.fromkeys(item["repository"] for item in items))
+    return {
+        "name": name,
+        "repositories": repositories,
+        "items": [{"pr": i["pr"], "name": i["name"], "category": i["category"], "repository": i["repository"]}
+                  for i in items],
+        "basis": basis,
+    }
+
+
+def precluster(items: list[dict]) -> dict:
+    """Split items into candidate groups and the ambiguous remainder.
+
+    Returns {"groups": [...], "ambiguous": [...], "stats": {...}}. Groups keep
+    the groups.json item shape plus a `basis` of "prefix" or "similarity", and
+    their names are unique (groups are keyed by name when Issues are created).
+    """
+    by_prefix = {}
+    rest = []
+    for item in items:
+        prefix = feature_prefix(item["name"])
+        if prefix:
+            by_prefix.setdefault(prefix.lower(), (prefix, []))[1].append(item)
+        else:
+            rest.append(item)
+
+    groups = [_group(prefix, members, "prefix") for prefix, members in by_prefix.values()]
+    clustered = set()
+    similar = []
+    for members in similarity_clusters(rest):
+        cluster_items = [rest[i] for i in members]
+        similar.append(_group(cluster_name(cluster_items), cluster_items, "similarity"))
+        clustered.update(members)
+
+    # Similarity clusters are per repository, so generic names ("Increment version")
+    # recur; qualify those by repository, and merge whatever still shares a name
+    taken = Counter(normalize_name(g["name"]) for g in groups + similar)
+    for group in similar:
+        if taken[normalize_name(group["name"])] > 1:
+            group["name"] = f"{group['name']} ({group['repositories'][0]})"
+    groups = merge_groups([], groups + similar)
+    similarity_groups = sum(1 for g in groups if g["basis"] == "similarity")
+
+    # Keep each repository's items together so agent batches stay coherent
+    ambiguous = sorted((item for i, item in enumerate(rest) if i not in clustered),
+                       key=lambda item: item["repository"])
+
+    return {
+        "groups": groups,
+        "ambiguous": ambiguous,
+        "stats": {
+            "items": len(items),
+            "prefix_groups": len(groups) - similarity_groups,
+            "similarity_groups": similarity_groups,
+            "clustered_items": len(items) - len(ambiguous),
+            "ambiguous_items": len(ambiguous),
+        },
+    }
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a release item or group name and collapse punctuation/whitespace.
+
+    The single notion of "same name" for group merging, precluster renames and
+    item dedupe in run.py.
+    """
+    return re.sub(r"[^a-z0-9]+", " ", name.lower()).strip()
+
+
+def merge_groups(groups: list[dict], new_groups: list[dict]) -> list[dict]:
+    """Merge `new_groups` into `groups`, combining groups whose names match after normalization.
+
+    Order is deterministic: existing groups keep their position and unmatched new
+    groups are appended in input order. Items already present are not duplicated.
+    """
+    merged = [dict(g, items=list(g["items"]), repositories=list(g.get("repositories", []))) for g in groups]
+    by_name = {normalize_name(g["name"]): g for g in merged}
+    for group in new_groups:
+        target = by_name.get(normalize_name(group["name"]))
+        if target is None:
+            target = dict(group, items=[], repositories=[])
+            merged.append(target)
+            by_name[normalize_name(group["name"])] = target
+        seen = {(i.get("pr"), i.get("repository"), i.get("name")) for i in target["items"]}
+        for item in group["items"]:
+            key = (item.get("pr"), item.get("repository"), item.get("name"))
+            if key not in seen:
+                seen.add(key)
+                target["items"].append(item)
+        for repository in list(group.get("repositories", [])) + [i["repository"] for i in group["items"]]:
+            if repository not in target["repositories"]:
+                target["repositories"].append(repository)
+    return merged
@@ -1,22 +1,125 @@
 #!/usr/bin/env python3
-"""OpenSearch Documentation MCP Server."""
+"""OpenSearch Documentation MCP Server.
 
+Requests are read from stdin as they arrive and handled concurrently:
+each `tools/call` runs in a worker thread (at most MAX_UPSTREAM_REQUESTS
+upstream searches in flight) and its response is written as soon as it
+completes, so responses may come back out of order (clients match them by id).
+A JSON-RPC batch (an array of requests) is answered with one array: its
+members run concurrently and their responses keep the order of the batch.
+
+The upstream API returns the full result list for a query, so lists are kept
+in an LRU cache (CACHE_SIZE queries, CACHE_TTL seconds) keyed by normalized
+(query, version, types) and every page of a query is sliced from one fetch.
+Misses go to the on-disk cache shared with other processes (search_cache.py)
+before the upstream API.
+
+`search_local` searches this repository's own reports (docs/features and
+docs/releases) through the memory-mapped BM25 index of docs_index.py, which
+is rebuilt when the reports change.
+"""
+
+import asyncio
 import json
 import sys
+import threading
+import time
 import urllib.request
 import urllib.parse
+from collections import OrderedDict
 
+from docs_index import load_index
+from search_cache import open_cache, search_key
 
-def search(query: str, version: str = "3.0", types: str = "docs,blogs", 
-           limit: int = 10, offset: int = 0) -> dict:
-    """Search OpenSearch docs and blogs."""
+# Upstream search requests in flight at once
+MAX_UPSTREAM_REQUESTS = 4
+CACHE_SIZE = 256
+CACHE_TTL = 600
+# Seconds between checks that the local docs index is still up to date
+INDEX_CHECK_INTERVAL = 30
+
+
+class SearchCache:
+    """Thread-safe LRU cache with TTL. Concurrent misses for one key share a single fetch."""
+    
+    def __init__(self, size: int = CACHE_SIZE, ttl: float = CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+    
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def get_or_fetch(self, key, fetch) -> tuple[object, bool]:
+        """Return (value, cached)."""
+        value = self._get(key)
+        if value is not None:
+            return value, True
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # Another thread may have fetched it while this one waited
+                value = self._get(key)
+                if value is not None:
+                    return value, True
+                value = fetch()
+                with self._lock:
+                    self.misses += 1
+                    self._entries[key] = (time.monotonic(), value)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.size:
+                        self._entries.popitem(last=False)
+        finally:
+            # Also on a failed fetch, so keys that keep failing don't accumulate locks
+            with self._lock:
+                if self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+        return value, False
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_cache = SearchCache()
+_disk_cache = open_cache()
+_upstream = threading.BoundedSemaphore(MAX_UPSTREAM_REQUESTS)
+_docs_index = None
+_docs_index_checked = 0.0
+
+
+def fetch_results(query: str, version: str, types: str) -> list[dict]:
+    """Full result list of a query from search-api.opensearch.org."""
     encoded = urllib.parse.quote(query)
     url = f"https://search-api.opensearch.org/search?q={encoded}&v={version}&t={types}"
     
-    with urllib.request.urlopen(url, timeout=10) as resp:
+    with _upstream, urllib.request.urlopen(url, timeout=10) as resp:
         data = json.loads(resp.read().decode())
+    return data.get("results", [])
+
+
+def search(query: str, version: str = "3.0", types: str = "docs,blogs", 
+           limit: int = 10, offset: int = 0) -> dict:
+    """Search OpenSearch docs and blogs."""
+    key = search_key(query, version, types)
+    
+    def fetch() -> list[dict]:
+        if _disk_cache is None:
+            return fetch_results(query, version, types)
+        return _disk_cache.get_or_fetch(key, lambda: fetch_results(query, version, types))
     
-    all_results = data.get("results", [])
+    all_results, cached = _cache.get_or_fetch(key, fetch)
     total = len(all_results)
     page_results = all_results[offset:offset + limit]
     
@@ -39,10 +142,21 @@ def search(query: str, version: str = "3.0", types: str = "docs,blogs",
         "offset": offset,
         "limit": limit,
         "hasMore": offset + limit < total,
+        "cached": cached,
         "results": results
     }
 
 
+def search_local(query: str, tags: list[str] | None = None, path: str = "",
+                 limit: int = 10, offset: int = 0) -> dict:
+    """Search the local feature and release reports."""
+    global _docs_index, _docs_index_checked
+    if _docs_index is None or time.monotonic() - _docs_index_checked > INDEX_CHECK_INTERVAL:
+        _docs_index = load_index(current=_docs_index)
+        _docs_index_checked = time.monotonic()
+    return _docs_index.search(query, tags=tags, path=path, limit=limit, offset=offset)
+
+
 def handle_request(request: dict) -> dict:
     """Handle JSON-RPC request."""
     method = request.get("method")
@@ -79,6 +193,23 @@ def handle_request(request: dict) -> dict:
                         },
                         "required": ["query"]
                     }
+                }, {
+                    "name": "search_local",
+                    "description": "Search this repository's feature and release reports (docs/features, docs/releases) "
+                                   "ranked by BM25, with title and heading matches weighted higher. "
+                                   "Use offset for pagination.",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "Search query"},
+                            "tags": {"type": "array", "items": {"type": "string"},
+                                     "description": "Only reports with all of these frontmatter tags, e.g. [\"k-nn\", \"domain/search\"]"},
+                            "path": {"type": "string", "description": "Only reports under this path, e.g. docs/features/k-nn or docs/releases/v3.0.0"},
+                            "limit": {"type": "integer", "description": "Max results per page (default: 10)"},
+                            "offset": {"type": "integer", "description": "Skip first N results for pagination (default: 0)"}
+                        },
+                        "required": ["query"]
+                    }
                 }]
             }
         }
@@ -87,15 +218,24 @@ def handle_request(request: dict) -> dict:
         tool_name = params.get("name")
         args = params.get("arguments", {})
         
-        if tool_name == "search":
+        if tool_name in ("search", "search_local"):
             try:
-                result = search(
-                    query=args["query"],
-                    version=args.get("version", "3.0"),
-                    types=args.get("types", "docs,blogs"),
-                    limit=args.get("limit", 10),
-                    offset=args.get("offset", 0)
-                )
+                if tool_name == "search":
+                    result = search(
+                        query=args["query"],
+                        version=args.get("version", "3.0"),
+                        types=args.get("types", "docs,blogs"),
+                        limit=args.get("limit", 10),
+                        offset=args.get("offset", 0)
+                    )
+                else:
+                    result = search_local(
+                        query=args["query"],
+                        tags=args.get("tags"),
+                        path=args.get("path", ""),
+                        limit=args.get("limit", 10),
+                        offset=args.get("offset", 0)
+                    )
                 return {
                     "jsonrpc": "2.0",
                     "id": req_id,
@@ -114,19 +254,85 @@ def handle_request(request: dict) -> dict:
     return {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32601, "message": "Method not found"}}
 
 
-def main():
-    """Run MCP server over stdio."""
-    for line in sys.stdin:
+async def handle_request_async(request: dict) -> dict | None:
+    """Handle a JSON-RPC request; tool calls run in a worker thread."""
+    if request.get("method") == "tools/call":
+        return await asyncio.to_thread(handle_request, request)
+    return handle_request(request)
+
+
+def error_response(req_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+async def answer(request) -> dict | None:
+    """Response to one request, or None for a notification (a request without id)."""
+    if not isinstance(request, dict):
+        return error_response(None, -32600, "Invalid Request")
+    try:
+        response = await handle_request_async(request)
+    except Exception as e:
+        response = error_response(request.get("id"), -32603, f"Internal error: {e}")
+    return response if "id" in request else None
+
+
+async def answer_batch(requests: list) -> list | dict | None:
+    """Responses to a batch in request order, or None if it held only notifications."""
+    if not requests:
+        return error_response(None, -32600, "Invalid Request")
+    responses = await asyncio.gather(*(answer(request) for request in requests))
+    return [response for response in responses if response is not None] or None
+
+
+def write_response(response: dict | list):
+    # Only called from the event loop thread, so lines never interleave
+    sys.stdout.write(json.dumps(response) + "\n")
+    sys.stdout.flush()
+
+
+async def serve():
+    """Read requests from stdin and answer each one as soon as it completes."""
+    loop = asyncio.get_running_loop()
+    pending = set()
+    
+    async def respond(message):
+        if isinstance(message, list):
+            response = await answer_batch(message)
+        else:
+            response = await answer(message)
+        if response:
+            write_response(response)
+    
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
         line = line.strip()
         if not line:
             continue
         try:
-            request = json.loads(line)
-            response = handle_request(request)
-            if response:
-                print(json.dumps(response), flush=True)
+            message = json.loads(line)
         except json.JSONDecodeError:
-            pass
+            continue
+        task = asyncio.create_task(respond(message))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    
+    # stdin closed: finish the calls still in flight
+    if pending:
+        await asyncio.gather(*pending)
+    stats = _cache.stats()
+    print(f"search cache: {stats['hits']} hits, {stats['misses']} misses", file=sys.stderr)
+    if _disk_cache:
+        stats = _disk_cache.stats()
+        print(f"disk search cache: {stats['hits']} hits, {stats['stale_hits']} stale hits, "
+              f"{stats['misses']} misses", file=sys.stderr)
+        _disk_cache.wait(timeout=10)
+
+
+def main():
+    """Run MCP server over stdio."""
+    asyncio.run(serve())
 
 
 if __name__ == "__main__":
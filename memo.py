@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Opt-in memoization of agent runs.
+
+A run is keyed by the agent config (its JSON plus the resource files it
+loads), the prompt, and the content of the input files the mode declares.
+After a successful run, files that changed under the declared output paths
+are stored; a later run with the same key restores them instead of invoking
+kiro-cli. Only files are replayed: git or GitHub side effects of the
+original run are not repeated.
+
+Layout under .cache/memo/:
+    entries/{key}.json   # mode, prompt, inputs, outputs ({path: sha256 or null if deleted})
+    blobs/{sha256}       # output file contents
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class Memo:
+    """Memo store rooted at `root` for paths relative to `base_dir`."""
+
+    def __init__(self, base_dir: Path, root: Path | None = None):
+        self.base_dir = base_dir
+        self.root = root or base_dir / ".cache" / "memo"
+        self.entries_dir = self.root / "entries"
+        self.blobs_dir = self.root / "blobs"
+
+    # -- hashing -----------------------------------------------------------
+
+    def _rel(self, path: Path) -> str:
+        return path.resolve().relative_to(self.base_dir.resolve()).as_posix()
+
+    def file_hashes(self, paths: list[Path]) -> dict:
+        """sha256 of every file under `paths` (directories are walked); missing paths map to None."""
+        hashes = {}
+        for path in paths:
+            if path.is_dir():
+                for file in sorted(p for p in path.rglob("*") if p.is_file()):
+                    hashes[self._rel(file)] = hashlib.sha256(file.read_bytes()).hexdigest()
+            elif path.is_file():
+                hashes[self._rel(path)] = hashlib.sha256(path.read_bytes()).hexdigest()
+            else:
+                hashes[self._rel(path)] = None
+        return hashes
+
+    def agent_hash(self, agent_file: Path) -> str:
+        """Hash of the agent JSON and every local resource it references."""
+        digest = hashlib.sha256(agent_file.read_bytes())
+        config = json.loads(agent_file.read_text())
+        for resource in config.get("resources", []):
+            if resource.startswith("file://"):
+                for file in sorted(self.base_dir.glob(resource[len("file://"):])):
+                    if file.is_file():
+                        digest.update(self._rel(file).encode() + b"\0" + file.read_bytes())
+        return digest.hexdigest()
+
+    def key(self, agent_file: Path, prompt: str, inputs: list[Path]) -> str:
+        payload = json.dumps({
+            "agent": self.agent_hash(agent_file),
+            "prompt": prompt,
+            "inputs": self.file_hashes(inputs),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # -- record / replay ---------------------------------------------------
+
+    def record(self, key: str, mode: str, prompt: str, inputs: list[Path], before: dict, outputs: list[Path]) -> int:
+        """Store files under `outputs` that differ from the `before` snapshot. Returns the count."""
+        after = self.file_hashes(outputs)
+        changed = {path: sha for path, sha in after.items() if before.get(path) != sha}
+        # Files that existed before the run but are gone now
+        changed.update({path: None for path, sha in before.items() if sha and path not in after})
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        for path, sha in changed.items():
+            if sha and not (self.blobs_dir / sha).exists():
+                (self.blobs_dir / sha).write_bytes((self.base_dir / path).read_bytes())
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "mode": mode,
+            "prompt": prompt,
+            "inputs": sorted(self._rel(p) for p in inputs),
+            "outputs": changed,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with open(self.entries_dir / f"{key}.json", "w") as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False)
+        return len(changed)
+
+    def replay(self, key: str) -> int | None:
+        """Restore the outputs of a memoized run. Returns the file count, or None on a miss."""
+        entry_file = self.entries_dir / f"{key}.json"
+        if not entry_file.exists():
+            return None
+        with open(entry_file) as f:
+            entry = json.load(f)
+        if any(sha and not (self.blobs_dir / sha).exists() for sha in entry["outputs"].values()):
+            return None
+        for path, sha in entry["outputs"].items():
+            target = self.base_dir / path
+            if sha is None:
+                target.unlink(missing_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes((self.blobs_dir / sha).read_bytes())
+        return len(entry["outputs"])
+
+    # -- maintenance -------------------------------------------------------
+
+    def entries(self) -> list[tuple[str, dict]]:
+        result = []
+        for entry_file in sorted(self.entries_dir.glob("*.json")):
+            with open(entry_file) as f:
+                result.append((entry_file.stem, json.load(f)))
+        return result
+
+    def invalidate(self, mode: str | None = None, path: str | None = None) -> int:
+        """Drop entries (optionally only for `mode` and/or those reading or writing under `path`).
+
+        Blobs no longer referenced by any entry are removed. Returns the number of entries dropped.
+        """
+        dropped = 0
+        for key, entry in self.entries():
+            if mode and entry["mode"] != mode:
+                continue
+            if path and not any(p == path or p.startswith(path.rstrip("/") + "/")
+                                for p in entry["inputs"] + list(entry["outputs"])):
+                continue
+            (self.entries_dir / f"{key}.json").unlink()
+            dropped += 1
+        referenced = {sha for _, entry in self.entries() for sha in entry["outputs"].values() if sha}
+        for blob in self.blobs_dir.glob("*") if self.blobs_dir.exists() else []:
+            if blob.name not in referenced:
+                blob.unlink()
+        return dropped
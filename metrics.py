@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Lightweight call instrumentation.
+
+Each timed call appends one JSON line to .cache/metrics.jsonl:
+
+    {"ts": ..., "kind": "agent", "name": "investigate", "seconds": 812.4,
+     "exit_code": 0, "output_bytes": 48213, "issue": 124}
+
+GitHub requests carry the HTTP `status` instead of an exit code.
+
+`kind` is "agent" (kiro-cli runs), "github" (API requests), "stage"
+(release-investigate stages) or "call" (other instrumented functions).
+Set OSFE_METRICS=0 to disable recording.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+METRICS_FILE = Path(__file__).parent / ".cache" / "metrics.jsonl"
+
+_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return os.environ.get("OSFE_METRICS", "1") != "0"
+
+
+def record(kind: str, name: str, seconds: float, **fields):
+    """Append one metrics record. Fields that are None are omitted."""
+    if not enabled():
+        return
+    entry = {"ts": datetime.now(timezone.utc).isoformat(), "kind": kind, "name": name, "seconds": round(seconds, 3)}
+    entry.update({k: v for k, v in fields.items() if v is not None})
+    line = json.dumps(entry) + "\n"
+    with _lock:
+        METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(METRICS_FILE, "a") as f:
+            f.write(line)
+
+
+@contextmanager
+def timed(kind: str, name: str, **fields):
+    """Time the block and record it. The yielded dict can be updated with more fields (exit_code, output_bytes, ...).
+
+    An exception escaping the block is recorded as `error` and re-raised.
+    """
+    start = time.monotonic()
+    extra = dict(fields)
+    try:
+        yield extra
+    except BaseException as e:
+        extra.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        record(kind, name, time.monotonic() - start, **extra)
+
+
+def load(path: Path = METRICS_FILE, since: datetime | None = None) -> list[dict]:
+    if not path.exists():
+        return []
+    records = []
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if since and datetime.fromisoformat(entry["ts"]) < since:
+                continue
+            records.append(entry)
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def failed(entry: dict) -> bool:
+    return entry.get("exit_code") not in (None, 0) or entry.get("status", 0) >= 400 or "error" in entry
+
+
+def aggregate(records: list[dict]) -> list[dict]:
+    """Per (kind, name) latency percentiles, failure count and throughput, slowest total first."""
+    by_key = {}
+    for entry in records:
+        by_key.setdefault((entry["kind"], entry["name"]), []).append(entry)
+    rows = []
+    for (kind, name), entries in by_key.items():
+        seconds = [e["seconds"] for e in entries]
+        times = [datetime.fromisoformat(e["ts"]) for e in entries]
+        # Window from the first call's start to the last call's end
+        span = (max(times) - min(times)).total_seconds() + seconds[times.index(min(times))]
+        rows.append({
+            "kind": kind,
+            "name": name,
+            "calls": len(entries),
+            "failed": sum(1 for e in entries if failed(e)),
+            "total": sum(seconds),
+            "p50": percentile(seconds, 50),
+            "p90": percentile(seconds, 90),
+            "p99": percentile(seconds, 99),
+            "max": max(seconds),
+            "per_hour": len(entries) / span * 3600 if span > 0 else None,
+            "output_bytes": sum(e.get("output_bytes", 0) for e in entries),
+        })
+    return sorted(rows, key=lambda r: r["total"], reverse=True)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Bulk prefetch of GitHub context for investigation Issues.
+
+For a set of investigation Issues (in this repository), every PR and Issue
+they reference is resolved with batched GraphQL queries (one aliased
+`issueOrPullRequest` lookup per reference, BATCH_SIZE per query, queries run
+concurrently), followed by the Issues those PRs close. Results are written
+under .cache/releases/v{version}/:
+
+    prs/{number}.json         # Merged PRs only (immutable, reused by later runs)
+    issues/{number}.json      # Closed Issues only
+    context/{issue}.json      # Compact bundle per investigation Issue
+
+References come from the Issue body (`PR: #N` lines with its `Repository:`,
+and github.com URLs) plus, when the plan stage recorded it, every item of
+the Issue's group in groups.json.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from github_client import GitHubError, current_repo, get_client
+
+SCRIPT_DIR = Path(__file__).parent
+CONFIG_FILE = SCRIPT_DIR / "config.json"
+DEFAULT_OWNER = "opensearch-project"
+
+# References resolved per GraphQL query, and queries in flight
+BATCH_SIZE = 25
+WORKERS = 4
+# Truncation limits that keep bundles compact
+BODY_CHARS = 6000
+COMMENT_CHARS = 1500
+MAX_COMMENTS = 20
+MAX_FILES = 100
+
+URL_RE = re.compile(r"github\.com/([\w.-]+)/([\w.-]+)/(?:pull|issues)/(\d+)")
+PR_LINE_RE = re.compile(r"^\s*[-*]\s*PRs?:\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+REPOSITORY_LINE_RE = re.compile(r"^\s*[-*]\s*Repository:\s*([\w.-]+)", re.MULTILINE | re.IGNORECASE)
+NUMBER_RE = re.compile(r"#(\d+)")
+VERSION_RE = re.compile(r"\(v(\d+\.\d+\.\d+)\)")
+HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+ISSUE_FIELDS = f"""
+  __typename number title url state createdAt closedAt
+  body author {{ login }}
+  labels(first: 20) {{ nodes {{ name }} }}
+  comments(first: {MAX_COMMENTS}) {{ nodes {{ author {{ login }} createdAt body }} }}
+"""
+PR_FIELDS = f"""
+  __typename number title url state merged mergedAt createdAt
+  body author {{ login }} baseRefName additions deletions
+  labels(first: 20) {{ nodes {{ name }} }}
+  milestone {{ title }}
+  files(first: {MAX_FILES}) {{ nodes {{ path additions deletions }} }}
+  closingIssuesReferences(first: 10) {{ nodes {{ number repository {{ nameWithOwner }} }} }}
+  comments(first: {MAX_COMMENTS}) {{ nodes {{ author {{ login }} createdAt body }} }}
+"""
+
+
+def repository_names() -> dict:
+    """Map release-note repository keys (lowercase) to "owner/repo" from config.json."""
+    with open(CONFIG_FILE) as f:
+        config = json.load(f)
+    return {key.lower(): f"{repo['owner']}/{repo['repo']}" for key, repo in config.get("repositories", {}).items()}
+
+
+def full_name(repository: str, names: dict) -> str:
+    """Lowercase "owner/repo" of a repository key such as "k-nn" (GitHub names are case-insensitive)."""
+    if "/" not in repository:
+        repository = names.get(repository.lower(), f"{DEFAULT_OWNER}/{repository}")
+    return repository.lower()
+
+
+def parse_refs(body: str, names: dict) -> list[tuple[str, int]]:
+    """(owner/repo, number) references in an investigation Issue body, in order of appearance."""
+    refs = [(full_name(f"{owner}/{repo}", names), int(number)) for owner, repo, number in URL_RE.findall(body)]
+    repository = REPOSITORY_LINE_RE.search(body)
+    if repository:
+        for line in PR_LINE_RE.findall(body):
+            refs.extend((full_name(repository.group(1), names), int(n)) for n in NUMBER_RE.findall(URL_RE.sub("", line)))
+    return list(dict.fromkeys(refs))
+
+
+def issue_version(issue: dict) -> str | None:
+    for label in issue["labels"]:
+        if label.startswith("release/v"):
+            return label[len("release/v"):]
+    match = VERSION_RE.search(issue["title"])
+    return match.group(1) if match else None
+
+
+def _text(text: str | None, limit: int) -> str:
+    text = HTML_COMMENT_RE.sub("", text or "")
+    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    return text if len(text) <= limit else text[:limit] + "\n[truncated]"
+
+
+def compact(node: dict, repository: str) -> dict:
+    """Drop GraphQL nesting and bulky text from an Issue or PullRequest node."""
+    entry = {
+        "repository": repository,
+        "number": node["number"],
+        "type": "pr" if node["__typename"] == "PullRequest" else "issue",
+        "title": node["title"],
+        "url": node["url"],
+        "state": node["state"].lower(),
+        "author": (node.get("author") or {}).get("login"),
+        "labels": [label["name"] for label in node["labels"]["nodes"]],
+        "body": _text(node.get("body"), BODY_CHARS),
+        "comments": [{"author": (c.get("author") or {}).get("login"), "body": _text(c["body"], COMMENT_CHARS)}
+                     for c in node["comments"]["nodes"]],
+    }
+    if entry["type"] == "pr":
+        entry.update({
+            "merged": node["merged"],
+            "merged_at": node["mergedAt"],
+            "base": node["baseRefName"],
+            "milestone": (node.get("milestone") or {}).get("title"),
+            "additions": node["additions"],
+            "deletions": node["deletions"],
+            "files": [{"path": f["path"], "additions": f["additions"], "deletions": f["deletions"]}
+                      for f in node["files"]["nodes"]],
+            "closes": [f"{i['repository']['nameWithOwner'].lower()}#{i['number']}"
+                       for i in node["closingIssuesReferences"]["nodes"]],
+        })
+    else:
+        entry["closed_at"] = node.get("closedAt")
+    return entry
+
+
+def _query(refs: list[tuple[str, int]]) -> str:
+    lookups = []
+    for i, (repository, number) in enumerate(refs):
+        owner, name = repository.split("/", 1)
+        lookups.append(f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ "
+                       f"issueOrPullRequest(number: {number}) {{ ... on Issue {{ {ISSUE_FIELDS} }} "
+                       f"... on PullRequest {{ {PR_FIELDS} }} }} }}")
+    return "query {\n" + "\n".join(lookups) + "\n}"
+
+
+def fetch_refs(refs: list[tuple[str, int]], workers: int = WORKERS) -> dict:
+    """Resolve references with concurrent batched queries. Returns {(repo, number): compact entry}.
+
+    References that do not exist (or a batch that fails) are left out.
+    """
+    batches = [refs[i:i + BATCH_SIZE] for i in range(0, len(refs), BATCH_SIZE)]
+
+    def run(batch: list[tuple[str, int]]) -> dict:
+        try:
+            data = get_client().graphql(_query(batch), partial=True)
+        except (GitHubError, OSError) as e:
+            print(f"  Prefetch batch of {len(batch)} failed: {e}")
+            return {}
+        found = {}
+        for i, ref in enumerate(batch):
+            node = (data.get(f"r{i}") or {}).get("issueOrPullRequest")
+            if node:
+                found[ref] = compact(node, ref[0])
+        return found
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for found in executor.map(run, batches):
+            results.update(found)
+    return results
+
+
+class ContextCache:
+    """prs/ and issues/ of one release cache directory, holding only immutable (merged/closed) entries."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def path(self, entry_type: str, repository: str, number: int) -> Path:
+        folder = self.cache_dir / ("prs" if entry_type == "pr" else "issues")
+        path = folder / f"{number}.json"
+        # Numbers are only unique per repository; a clash goes to a qualified name
+        if path.exists() and json.loads(path.read_text()).get("repository", repository) != repository:
+            path = folder / f"{repository.split('/')[-1].lower()}-{number}.json"
+        return path
+
+    def get(self, repository: str, number: int) -> dict | None:
+        for entry_type in ("pr", "issue"):
+            path = self.path(entry_type, repository, number)
+            if path.exists():
+                entry = json.loads(path.read_text())
+                if entry.get("repository") == repository:
+                    return entry
+        return None
+
+    def put(self, entry: dict):
+        if not (entry.get("merged") if entry["type"] == "pr" else entry["state"] == "closed"):
+            return
+        path = self.path(entry["type"], entry["repository"], entry["number"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False)
+
+
+def _linked_refs(entry: dict) -> list[tuple[str, int]]:
+    """Issues a PR entry closes."""
+    refs = []
+    for closes in entry.get("closes", []):
+        repository, number = closes.split("#")
+        refs.append((repository, int(number)))
+    return refs
+
+
+def _resolve(wanted: list[tuple[Path, tuple[str, int]]], entries: dict, workers: int):
+    """Add entries for (cache dir, ref) pairs: from the cache when present, else fetched in bulk."""
+    missing = []
+    for cache_dir, ref in wanted:
+        if ref in entries or ref in missing:
+            continue
+        cached = ContextCache(cache_dir).get(*ref)
+        if cached:
+            entries[ref] = cached
+        else:
+            missing.append(ref)
+    entries.update(fetch_refs(missing, workers))
+
+
+def group_refs(cache_dir: Path, number: int, names: dict) -> list[tuple[str, int]]:
+    """PRs of the group whose Issue is `number`, from groups.json (set by the plan stage)."""
+    groups_file = cache_dir / "groups.json"
+    if not groups_file.exists():
+        return []
+    with open(groups_file) as f:
+        groups = json.load(f).get("groups", [])
+    return [(full_name(item["repository"], names), item["pr"])
+            for group in groups if group.get("issue_number") == number
+            for item in group["items"] if item.get("pr")]
+
+
+def prefetch_context(numbers: list[int], cache_root: Path, workers: int = WORKERS) -> dict:
+    """Write context bundles for investigation Issues. Returns {issue number: bundle path}.
+
+    `cache_root` is the directory holding releases/v{version}/ (normally .cache).
+    Issues whose version cannot be determined are skipped.
+    """
+    names = repository_names()
+    own_repo = "/".join(current_repo()).lower()
+    issues = fetch_refs([(own_repo, n) for n in numbers], workers)
+
+    # References per investigation Issue, served from the cache where possible
+    wanted = {}
+    for number in numbers:
+        issue = issues.get((own_repo, number))
+        version = issue and issue_version(issue)
+        if not version:
+            continue
+        cache_dir = cache_root / "releases" / f"v{version}"
+        refs = parse_refs(issue["body"], names) + group_refs(cache_dir, number, names)
+        wanted[number] = (issue, cache_dir, list(dict.fromkeys(refs)))
+
+    entries = {}
+    _resolve([(cache_dir, ref) for _, cache_dir, refs in wanted.values() for ref in refs], entries, workers)
+    # Then the Issues closed by the referenced PRs
+    _resolve([(cache_dir, linked) for _, cache_dir, refs in wanted.values() for ref in refs
+              for linked in _linked_refs(entries.get(ref, {}))], entries, workers)
+
+    bundles = {}
+    for number, (issue, cache_dir, refs) in wanted.items():
+        cache = ContextCache(cache_dir)
+        prs, related = [], []
+        for ref in refs:
+            entry = entries.get(ref)
+            if not entry:
+                continue
+            cache.put(entry)
+            (prs if entry["type"] == "pr" else related).append(entry)
+        for pr in prs:
+            for linked in _linked_refs(pr):
+                entry = entries.get(linked)
+                if entry and entry not in related:
+                    cache.put(entry)
+                    related.append(entry)
+        bundle = {
+            "issue": {key: issue[key] for key in ("number", "title", "url", "labels", "body")},
+            "prs": prs,
+            "issues": related,
+            "unresolved": [f"{repo}#{n}" for repo, n in refs if (repo, n) not in entries],
+        }
+        path = cache_dir / "context" / f"{number}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(bundle, f, indent=2, ensure_ascii=False)
+        bundles[number] = path
+    return bundles
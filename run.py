@@ -2,15 +2,53 @@
 """OpenSearch Feature Explorer - Kiro CLI wrapper script."""
 
 import argparse
+import base64
+import io
+import itertools
 import json
+import os
+import random
 import re
+import shutil
 import subprocess
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from agent_watchdog import install_interrupt_handler, run_watched, stopping
+from github_client import GitHubError, current_repo, get_client
+from grouping import TOKEN_BUDGET, batch_length, count_batches, estimate_tokens, merge_groups, normalize_name, precluster
+from memo import Memo
+import metrics
+from prefetch import prefetch_context
+from stages import Stage, StageScheduler
+from workqueue import WorkQueue, worker_id
+from worktrees import WorktreePool
+
 SCRIPT_DIR = Path(__file__).parent
 AGENTS_DIR = SCRIPT_DIR / ".kiro" / "agents"
+CONFIG_FILE = SCRIPT_DIR / "config.json"
+LOG_DIR = SCRIPT_DIR / ".cache" / "logs"
+QUEUE_FILE = SCRIPT_DIR / ".cache" / "queue.db"
+
+# Max concurrent release-note downloads
+FETCH_WORKERS = 8
+RELEASE_STAGES = ["fetch", "group", "plan", "investigate", "summarize"]
+# Seconds between checks for new upstream output in streaming release-investigate stages
+STAGE_POLL_INTERVAL = 10
+# Watchdog limits for non-interactive agent runs; config.json "agents" overrides per mode
+AGENT_LIMITS = {"timeout": 3600, "idleTimeout": 900, "retries": 2, "retryBackoff": 30}
+# Exit code of an agent run killed by the watchdog (as with coreutils timeout)
+TIMEOUT_EXIT = 124
+# Agent output of a failed run that marks the failure as worth retrying
+TRANSIENT_RE = re.compile(
+    r"rate.?limit|throttl|too many requests|service unavailable|bad gateway|gateway timeout|overloaded"
+    r"|temporarily unavailable|connection (?:reset|refused|closed)|ECONNRESET|ETIMEDOUT",
+    re.IGNORECASE)
 
 AGENTS = {
     "dev": "dev.json",
@@ -28,30 +66,135 @@ AGENTS = {
 }
 
 
-def fetch_release_notes(version: str) -> dict:
-    """Fetch and parse release notes from GitHub."""
-    sources = [
-        ("opensearch-project", "opensearch-build", f"release-notes/opensearch-release-notes-{version}.md"),
-        ("opensearch-project", "OpenSearch", f"release-notes/opensearch.release-notes-{version}.md"),
-        ("opensearch-project", "OpenSearch-Dashboards", f"release-notes/opensearch-dashboards.release-notes-{version}.md"),
-    ]
+def load_release_sources(version: str) -> list[dict]:
+    """Load release-note sources for a version from config.json."""
+    with open(CONFIG_FILE) as f:
+        config = json.load(f)
     
-    items = []
+    sources = []
+    for key, repo_config in config.get("repositories", {}).items():
+        sources.append({
+            "key": key,
+            "owner": repo_config["owner"],
+            "repo": repo_config["repo"],
+            "path": repo_config["releaseNotesPath"].format(version=version),
+            "rollup": repo_config.get("rollup", False),
+        })
+    return sources
+
+
+def release_cache_dir(version: str) -> Path:
+    """Return the per-version working cache directory."""
+    return SCRIPT_DIR / ".cache" / "releases" / f"v{version}"
+
+
+def load_fetch_cache(version: str) -> dict:
+    """Load per-source validators (blob SHA / ETag) and parsed items from the last fetch."""
+    cache_file = release_cache_dir(version) / "fetch-cache.json"
+    if not cache_file.exists():
+        return {"sources": {}}
+    with open(cache_file) as f:
+        return json.load(f)
+
+
+def save_fetch_cache(version: str, cache: dict):
+    cache_dir = release_cache_dir(version)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_dir / "fetch-cache.json", "w") as f:
+        json.dump(cache, f, indent=2)
+
+
+def fetch_source(source: dict, cached: dict | None = None) -> dict:
+    """Fetch a single release-notes file. Returns content or error with timing.
+    
+    With a cached entry the request is conditional on its ETag; an unchanged file
+    (HTTP 304, or same blob SHA) comes back with `unchanged` set and no content.
+    """
+    start = time.monotonic()
+    fetched = {"source": source, "content": None, "error": None, "unchanged": False, "sha": None, "etag": None}
+    try:
+        data, etag, modified = get_client().get_conditional(
+            f"repos/{source['owner']}/{source['repo']}/contents/{source['path']}",
+            cached.get("etag") if cached else None,
+        )
+    except (GitHubError, OSError) as e:
+        fetched["error"] = str(e)
+        fetched["elapsed"] = time.monotonic() - start
+        return fetched
+    
+    fetched["etag"] = etag
+    if not modified or (cached and data["sha"] == cached.get("sha")):
+        fetched["unchanged"] = True
+        fetched["sha"] = cached.get("sha")
+    else:
+        fetched["sha"] = data["sha"]
+        fetched["content"] = base64.b64decode(data["content"]).decode("utf-8")
+    fetched["elapsed"] = time.monotonic() - start
+    return fetched
+
+
+def fetch_release_notes(version: str, workers: int = FETCH_WORKERS, force: bool = False,
+                        executor: ThreadPoolExecutor | None = None) -> dict:
+    """Fetch and parse release notes from GitHub. Sources are fetched concurrently.
+    
+    Sources whose blob SHA / ETag match the fetch cache are neither downloaded nor
+    re-parsed unless `force` is set. Pass a shared `executor` to bound concurrency
+    across several versions. Each source's markdown is parsed and released as soon
+    as it is its turn, so only sources fetched ahead of it are held unparsed.
+    """
+    sources = load_release_sources(version)
+    cache = {"sources": {}} if force else load_fetch_cache(version)
+    
+    parsed_sources = []
     fetched_sources = []
+    failed_sources = []
+    stale_sources = []
+    unchanged_sources = []
+    timings = {}
     
-    for owner, repo, path in sources:
-        cmd = ["gh", "api", f"repos/{owner}/{repo}/contents/{path}", "--jq", ".content"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
+    def fetch(source):
+        return fetch_source(source, cache["sources"].get(f"{source['repo']}/{source['path']}"))
+    
+    # map() keeps config order so items are deterministic regardless of completion order
+    def results() -> Iterator[dict]:
+        if executor:
+            yield from executor.map(fetch, sources)
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sources)))) as own_executor:
+                yield from own_executor.map(fetch, sources)
+    
+    new_cache = {"sources": {}}
+    for fetched in results():
+        source = fetched["source"]
+        source_name = f"{source['repo']}/{source['path']}"
+        timings[source_name] = round(fetched["elapsed"], 3)
+        cached = cache["sources"].get(source_name)
+        if fetched["error"]:
+            if not cached:
+                failed_sources.append({"source": source_name, "error": fetched["error"]})
+                continue
+            # Keep the last good copy rather than dropping the source's items
+            stale_sources.append({"source": source_name, "error": fetched["error"]})
+            fetched_sources.append(source_name)
+            parsed_sources.append((source, cached["items"]))
+            new_cache["sources"][source_name] = cached
             continue
         
-        import base64
-        content = base64.b64decode(result.stdout.strip()).decode("utf-8")
-        fetched_sources.append(f"{repo}/{path}")
+        fetched_sources.append(source_name)
         
-        # Parse release notes
-        parsed = parse_release_notes(content, repo)
-        items.extend(parsed)
+        if fetched["unchanged"]:
+            unchanged_sources.append(source_name)
+            parsed = cached["items"]
+        else:
+            # Parse release notes; the item dicts are shared by the fetch cache, dedupe and the output
+            parsed = parse_release_notes(fetched["content"], source["repo"])
+            fetched["content"] = None
+        parsed_sources.append((source, parsed))
+        new_cache["sources"][source_name] = {"sha": fetched["sha"], "etag": fetched["etag"], "items": parsed}
+    
+    save_fetch_cache(version, new_cache)
+    
+    items, dedup = dedupe_items(parsed_sources)
     
     # Build summary
     summary = {"total": len(items), "breaking": 0, "feature": 0, "enhancement": 0, "bugfix": 0, "deprecation": 0}
@@ -64,28 +207,134 @@ def fetch_release_notes(version: str) -> dict:
         "version": version,
         "parsed_at": datetime.now(timezone.utc).isoformat(),
         "sources": fetched_sources,
+        "failed_sources": failed_sources,
+        "stale_sources": stale_sources,
+        "unchanged_sources": unchanged_sources,
+        "timings": timings,
+        "dedup": dedup,
         "summary": summary,
         "items": items,
     }
 
 
+def dedupe_items(parsed_sources: list[tuple[dict, list[dict]]]) -> tuple[list[dict], dict]:
+    """Merge the same PR reported by several sources (or repeated within one).
+    
+    Items are indexed by (PR, normalized name). Repository labels are not part of
+    the key because roll-up notes mislabel components (e.g. core PRs listed under
+    "dashboards"); the kept item comes from a non-rollup source when possible.
+    Merged items record every contributing source and repository label.
+    """
+    index = {}
+    entries = []
+    stats = {"input": 0, "output": 0, "merged": 0, "by_source": {}}
+    
+    for source, parsed in parsed_sources:
+        rollup = source.get("rollup", False)
+        dropped = 0
+        for item in parsed:
+            stats["input"] += 1
+            key = (item["pr"], normalize_name(item["name"]))
+            entry = index.get(key)
+            if entry is None:
+                entry = {"item": item, "rollup": rollup, "count": 1,
+                         "sources": [source["key"]], "repositories": [item["repository"]]}
+                index[key] = entry
+                entries.append(entry)
+                continue
+            
+            dropped += 1
+            entry["count"] += 1
+            if entry["rollup"] and not rollup:
+                # Prefer the upstream repository's labelling over the roll-up
+                entry["item"] = item
+                entry["rollup"] = False
+            if source["key"] not in entry["sources"]:
+                entry["sources"].append(source["key"])
+            if item["repository"] not in entry["repositories"]:
+                entry["repositories"].append(item["repository"])
+        stats["by_source"][source["key"]] = dropped
+    
+    items = []
+    for entry in entries:
+        item = entry["item"]
+        if entry["count"] > 1:
+            item = dict(item, sources=entry["sources"])
+            if len(entry["repositories"]) > 1:
+                item["repositories"] = entry["repositories"]
+        items.append(item)
+    
+    stats["output"] = len(items)
+    stats["merged"] = stats["input"] - stats["output"]
+    return items, stats
+
+
+# Map section headers to categories (first matching keyword wins)
+CATEGORY_KEYWORDS = (
+    ("breaking", "breaking"),
+    ("feature", "feature"),
+    ("enhancement", "enhancement"),
+    ("bug fix", "bugfix"),
+    ("bugfix", "bugfix"),
+    ("deprecat", "deprecation"),
+    ("added", "feature"),
+)
+
+# Plugin names recognized anywhere in an item line
+PLUGIN_NAMES = (
+    "k-nn", "knn", "neural-search", "ml-commons", "sql", "security", "alerting", "anomaly-detection",
+    "index-management", "observability", "reporting", "notifications", "geospatial",
+    "cross-cluster-replication", "asynchronous-search",
+)
+
+
+def _trie_pattern(words) -> str:
+    """Build a prefix-factored regex alternation so the engine never rescans shared prefixes."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    
+    def build(node) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+    
+    return build(trie)
+
+
+COMPONENT_RE = re.compile(r"opensearch[- ](\w+)", re.IGNORECASE)
+PR_REF_RE = re.compile(r"#(\d+)")
+PR_BRACKET_RE = re.compile(r"\[#?(\d+)\]")
+MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+PR_PAREN_RE = re.compile(r"\(#\d+\)")
+PLUGIN_RE = re.compile(r"\b(" + _trie_pattern(PLUGIN_NAMES) + r")\b")
+
+
+def _header_category(header: str) -> str | None:
+    for key, cat in CATEGORY_KEYWORDS:
+        if key in header:
+            return cat
+    return None
+
+
 def parse_release_notes(content: str, repo: str) -> list[dict]:
     """Parse release notes markdown and extract items."""
-    items = []
+    return list(iter_release_notes(io.StringIO(content), repo))
+
+
+def iter_release_notes(lines: Iterable[str], repo: str) -> Iterator[dict]:
+    """Yield release items as lines are consumed, in a single pass."""
     current_category = None
     current_component = None
     
-    # Map section headers to categories
-    category_map = {
-        "breaking": "breaking",
-        "feature": "feature",
-        "enhancement": "enhancement",
-        "bug fix": "bugfix",
-        "bugfix": "bugfix",
-        "deprecat": "deprecation",
-        "added": "feature",
-    }
-    
     # Determine repository name
     repo_lower = repo.lower()
     if repo_lower in ("opensearch", "opensearch-build"):
@@ -95,81 +344,170 @@ def parse_release_notes(content: str, repo: str) -> list[dict]:
     else:
         default_repo = repo_lower
     
-    lines = content.split("\n")
+    header_cache = {}
     for line in lines:
         line = line.strip()
+        if not line:
+            continue
+        first = line[0]
         
         # Check for section headers
-        if line.startswith("#"):
+        if first == "#":
             header = line.lstrip("#").strip().lower()
-            # Check category
-            for key, cat in category_map.items():
-                if key in header:
-                    current_category = cat
-                    break
-            # Check for component/plugin name in header
-            if "opensearch" in header and current_category:
-                # Extract component name like "OpenSearch Security", "OpenSearch k-NN"
-                match = re.search(r"opensearch[- ](\w+)", header, re.IGNORECASE)
+            if header not in header_cache:
+                header_cache[header] = _header_category(header)
+            current_category = header_cache[header] or current_category
+            # Check for component/plugin name in header, e.g. "OpenSearch Security", "OpenSearch k-NN"
+            if current_category and "opensearch" in header:
+                match = COMPONENT_RE.search(header)
                 if match:
                     current_component = match.group(1).lower()
                     if current_component in ("core", "build"):
                         current_component = None
+            continue
         
         # Parse list items with PR references
-        if line.startswith(("-", "*")) and current_category:
-            # Extract PR number
-            pr_match = re.search(r"#(\d+)", line) or re.search(r"\[#?(\d+)\]", line)
+        if (first != "-" and first != "*") or not current_category:
+            continue
+        
+        pr_match = PR_REF_RE.search(line) if "#" in line else None
+        if not pr_match:
+            pr_match = PR_BRACKET_RE.search(line) if "[" in line else None
             if not pr_match:
                 continue
-            
-            pr_num = int(pr_match.group(1))
-            
-            # Extract item name/description
-            # Remove markdown links and PR references
-            name = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", line)  # [text](url) -> text
-            name = re.sub(r"\(#\d+\)", "", name)  # (#123) -> ""
-            name = re.sub(r"#\d+", "", name)  # #123 -> ""
-            name = re.sub(r"^\s*[-*]\s*", "", name)  # Remove list marker
-            name = re.sub(r"\s+", " ", name).strip()  # Normalize whitespace
-            
-            if not name or len(name) < 5:
-                continue
-            
-            # Determine repository for this item
-            item_repo = default_repo
-            if current_component:
-                item_repo = current_component
-            # Check for plugin references in the line
-            plugin_match = re.search(r"\b(k-nn|knn|neural-search|ml-commons|sql|security|alerting|anomaly-detection|index-management|observability|reporting|notifications|geospatial|cross-cluster-replication|asynchronous-search)\b", line.lower())
-            if plugin_match:
-                item_repo = plugin_match.group(1).replace("knn", "k-nn")
-            
-            items.append({
-                "name": name[:200],  # Truncate long names
-                "category": current_category,
-                "repository": item_repo,
-                "pr": pr_num,
-                "description": name[:300],
-            })
+        pr_num = int(pr_match.group(1))
+        
+        # Extract item name: drop markdown links, PR references and the list marker
+        name = line
+        if "](" in name:
+            name = MD_LINK_RE.sub(r"\1", name)  # [text](url) -> text
+        if "#" in name:
+            name = PR_PAREN_RE.sub("", name)  # (#123) -> ""
+            name = PR_REF_RE.sub("", name)  # #123 -> ""
+        # The marker is still the first character; split()/join() normalizes whitespace like \s+
+        name = " ".join(name[1:].split())
+        
+        if len(name) < 5:
+            continue
+        
+        # Determine repository for this item
+        item_repo = current_component or default_repo
+        plugin_match = PLUGIN_RE.search(line.lower())
+        if plugin_match:
+            item_repo = plugin_match.group(1).replace("knn", "k-nn")
+        
+        yield {
+            "name": name[:200],  # Truncate long names
+            "category": current_category,
+            "repository": item_repo,
+            "pr": pr_num,
+            "description": name[:300],
+        }
+
+
+def find_raw_items(cache_dir: Path, stem: str = "raw-items") -> Path | None:
+    """Return the raw items file in whichever format exists (JSONL preferred)."""
+    for suffix in (".jsonl", ".json"):
+        path = cache_dir / f"{stem}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def write_raw_items(path: Path, data: dict):
+    """Write raw items as one JSON document, or for .jsonl a metadata header line then one item per line."""
+    if path.suffix != ".jsonl":
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return
+    with open(path, "w") as f:
+        f.write(json.dumps({k: v for k, v in data.items() if k != "items"}) + "\n")
+        for item in data["items"]:
+            f.write(json.dumps(item) + "\n")
+
+
+def read_raw_meta(path: Path) -> dict:
+    """Read raw items metadata (everything except items) plus `total`, without loading items from JSONL."""
+    if path.suffix == ".jsonl":
+        with open(path) as f:
+            meta = json.loads(f.readline())
+        meta["total"] = meta["summary"]["total"]
+        return meta
+    with open(path) as f:
+        data = json.load(f)
+    meta = {k: v for k, v in data.items() if k != "items"}
+    meta["total"] = len(data["items"])
+    return meta
+
+
+def iter_raw_items(path: Path, offset: int = 0) -> Iterator[dict]:
+    """Yield raw items starting at `offset`. JSONL files are read lazily line by line."""
+    if path.suffix != ".jsonl":
+        with open(path) as f:
+            yield from json.load(f)["items"][offset:]
+        return
+    with open(path) as f:
+        f.readline()  # metadata header
+        for line in itertools.islice(f, offset, None):
+            yield json.loads(line)
+
+
+def load_raw_items(path: Path) -> dict:
+    """Load raw items metadata and the full item list."""
+    data = read_raw_meta(path)
+    data["items"] = list(iter_raw_items(path))
+    return data
+
+
+def save_release_items(version: str, data: dict, fmt: str = "json") -> tuple[Path, bool]:
+    """Write raw-items.{fmt} unless the same sources were all unchanged. Returns (path, written)."""
+    cache_dir = release_cache_dir(version)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"raw-items.{fmt}"
+    
+    if cache_file.exists():
+        reused = set(data["unchanged_sources"]) | {s["source"] for s in data["stale_sources"]}
+        # A source added to or removed from config.json changes the items even if no file changed
+        if reused == set(data["sources"]) and read_raw_meta(cache_file).get("sources") == data["sources"]:
+            return cache_file, False
     
-    return items
+    write_raw_items(cache_file, data)
+    # Drop the other format so readers never pick up a stale copy
+    for stale in cache_dir.glob("raw-items.json*"):
+        if stale != cache_file and stale.suffix in (".json", ".jsonl"):
+            stale.unlink()
+    return cache_file, True
 
 
-def run_fetch_release(version: str) -> int:
-    """Fetch release notes and parse with Python. Saves to raw-items.json."""
+def run_fetch_release(version: str, workers: int = FETCH_WORKERS, force: bool = False, fmt: str = "json") -> int:
+    """Fetch release notes and parse with Python. Saves to raw-items.json (or .jsonl)."""
     print(f"Fetching release notes for v{version}...")
     
-    data = fetch_release_notes(version)
+    data = fetch_release_notes(version, workers, force)
     
-    cache_dir = SCRIPT_DIR / ".cache" / "releases" / f"v{version}"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / "raw-items.json"
+    for source, elapsed in data["timings"].items():
+        status = "  (unchanged)" if source in data["unchanged_sources"] else ""
+        print(f"  {elapsed:6.2f}s  {source}{status}")
+    for stale in data["stale_sources"]:
+        print(f"Warning: failed to fetch {stale['source']}: {stale['error']} (using the cached copy)")
+    for failed in data["failed_sources"]:
+        print(f"Warning: failed to fetch {failed['source']}: {failed['error']}")
+    
+    if not data["sources"]:
+        print(f"Error: no release notes could be fetched for v{version}.")
+        return 1
     
-    with open(cache_file, "w") as f:
-        json.dump(data, f, indent=2)
+    cache_file, written = save_release_items(version, data, fmt)
+    if not written:
+        print(f"Release notes unchanged. {cache_file} is up to date (use --force to refetch).")
+        return 0
     
-    print(f"Parsed {data['summary']['total']} items from {len(data['sources'])} sources")
+    total_sources = len(data["sources"]) + len(data["failed_sources"])
+    print(f"Parsed {data['summary']['total']} items from {len(data['sources'])}/{total_sources} sources")
+    dedup = data["dedup"]
+    if dedup["merged"]:
+        per_source = ", ".join(f"{k}: {v}" for k, v in dedup["by_source"].items() if v)
+        print(f"  Duplicates merged: {dedup['merged']} ({dedup['input']} -> {dedup['output']}; {per_source})")
     print(f"  Breaking: {data['summary']['breaking']}")
     print(f"  Features: {data['summary']['feature']}")
     print(f"  Enhancements: {data['summary']['enhancement']}")
@@ -178,68 +516,664 @@ def run_fetch_release(version: str) -> int:
     return 0
 
 
-def run_group_release(version: str, batch_size: int = 50, process_all: bool = False) -> int:
-    """Group raw items into feature groups using LLM. Processes in batches."""
-    cache_dir = SCRIPT_DIR / ".cache" / "releases" / f"v{version}"
-    raw_file = cache_dir / "raw-items.json"
+def version_tuple(version: str) -> tuple:
+    return tuple(int(p) for p in re.findall(r"\d+", version))
+
+
+def discover_release_versions() -> list[str]:
+    """List versions with release notes in the first configured repository.
+    
+    Falls back to versions already present under data/releases and docs/releases.
+    """
+    source = load_release_sources("{version}")[0]
+    directory, _, filename = source["path"].rpartition("/")
+    pattern = re.compile("^" + re.escape(filename).replace(re.escape("{version}"), r"(\d+\.\d+\.\d+)") + "$")
+    try:
+        entries = get_client().get(f"repos/{source['owner']}/{source['repo']}/contents/{directory}")
+        names = [e["name"] for e in entries]
+    except (GitHubError, OSError) as e:
+        print(f"Warning: could not list {source['repo']}/{directory}: {e}. Using local versions.")
+        names = []
+        pattern = re.compile(r"^v(\d+\.\d+\.\d+)$")
+        for root in (SCRIPT_DIR / "data" / "releases", SCRIPT_DIR / "docs" / "releases"):
+            if root.is_dir():
+                names.extend(p.name for p in root.iterdir() if p.is_dir())
+    versions = {m.group(1) for m in map(pattern.match, names) if m}
+    return sorted(versions, key=version_tuple)
+
+
+def expand_versions(specs: list[str]) -> list[str]:
+    """Expand version arguments: single versions, comma-separated lists and inclusive A..B ranges."""
+    versions = []
+    known = None
+    for spec in specs:
+        for part in filter(None, (p.strip().lstrip("v") for p in spec.split(","))):
+            if ".." not in part:
+                versions.append(part)
+                continue
+            start, _, end = part.partition("..")
+            if known is None:
+                known = discover_release_versions()
+            low, high = version_tuple(start.lstrip("v")), version_tuple(end.lstrip("v"))
+            versions.extend(v for v in known if low <= version_tuple(v) <= high)
+    # De-duplicate, keeping order
+    return list(dict.fromkeys(versions))
+
+
+def run_fetch_releases(versions: list[str], workers: int = FETCH_WORKERS, force: bool = False, fmt: str = "json") -> int:
+    """Fetch several versions concurrently under one shared download budget and print a summary table."""
+    if len(versions) == 1:
+        return run_fetch_release(versions[0], workers, force, fmt)
+    if not versions:
+        print("Error: no versions matched.")
+        return 1
+    
+    print(f"Fetching release notes for {len(versions)} versions ({workers} concurrent downloads)...")
+    
+    def fetch_version(version):
+        start = time.monotonic()
+        try:
+            data = fetch_release_notes(version, workers, force, executor=source_pool)
+        except Exception as e:
+            return {"version": version, "error": str(e), "elapsed": time.monotonic() - start}
+        written = False
+        if data["sources"]:
+            _, written = save_release_items(version, data, fmt)
+        return {"version": version, "data": data, "written": written, "elapsed": time.monotonic() - start}
+    
+    # The source pool is the global budget; version threads only wait on it
+    with ThreadPoolExecutor(max_workers=workers) as source_pool, \
+            ThreadPoolExecutor(max_workers=min(len(versions), workers)) as version_pool:
+        rows = list(version_pool.map(fetch_version, versions))
+    
+    print(f"\n{'Version':<10} {'Sources':>8} {'Items':>6} {'Break':>6} {'Feat':>6} {'Enh':>6} {'Fix':>6} {'Time':>7}  Status")
+    failed = 0
+    for row in rows:
+        data = row.get("data")
+        if not data or not data["sources"]:
+            failed += 1
+            error = row.get("error") or "; ".join(dict.fromkeys(f["error"] for f in data["failed_sources"])) or "no sources"
+            print(f"{row['version']:<10} {'-':>8} {'-':>6} {'-':>6} {'-':>6} {'-':>6} {'-':>6} {row['elapsed']:>6.2f}s  FAILED: {error[:60]}")
+            continue
+        summary = data["summary"]
+        total_sources = len(data["sources"]) + len(data["failed_sources"])
+        status = "saved" if row["written"] else "unchanged"
+        if data["failed_sources"]:
+            status += f" ({len(data['failed_sources'])} source(s) failed)"
+        if data["stale_sources"]:
+            status += f" ({len(data['stale_sources'])} source(s) from cache)"
+        print(f"{row['version']:<10} {len(data['sources']):>4}/{total_sources:<3} {summary['total']:>6} {summary['breaking']:>6} "
+              f"{summary['feature']:>6} {summary['enhancement']:>6} {summary['bugfix']:>6} {row['elapsed']:>6.2f}s  {status}")
+    print(f"\n{len(rows) - failed}/{len(rows)} versions fetched")
+    return 1 if failed else 0
+
+
+def item_key(item: dict) -> str:
+    """Stable identity for a release item: repository + PR + normalized name."""
+    return f"{item.get('repository', '').lower()}#{item.get('pr')}#{normalize_name(item.get('name', ''))}"
+
+
+# Fields that mark an item with the same item_key as changed
+COMPARED_FIELDS = ("category", "description")
+
+
+def diff_items(old_items: list[dict], new_items: list[dict]) -> dict:
+    """Diff two item lists by item_key. Changed = same key, different COMPARED_FIELDS."""
+    old_by_key = {item_key(i): i for i in old_items}
+    new_by_key = {item_key(i): i for i in new_items}
+    added = [i for k, i in new_by_key.items() if k not in old_by_key]
+    removed = [i for k, i in old_by_key.items() if k not in new_by_key]
+    changed = [
+        i for k, i in new_by_key.items()
+        if k in old_by_key and any(i.get(field) != old_by_key[k].get(field) for field in COMPARED_FIELDS)
+    ]
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def _save_groups(groups_file: Path, groups_data: dict):
+    """Write a groups file atomically (temp file, fsync, rename) so a crash never leaves it truncated."""
+    tmp_file = groups_file.with_name(groups_file.name + ".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(groups_data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, groups_file)
+
+
+def read_groups_journal(cache_dir: Path) -> list[dict]:
+    """Read groups.journal.jsonl records, truncating a torn trailing record left by a crash."""
+    journal_file = cache_dir / "groups.journal.jsonl"
+    if not journal_file.exists():
+        return []
+    records = []
+    valid = 0
+    with open(journal_file, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+            valid += len(line)
+    if valid < journal_file.stat().st_size:
+        with open(journal_file, "r+b") as f:
+            f.truncate(valid)
+    return records
+
+
+def append_groups_journal(cache_dir: Path, offset: int, end: int, groups: list[dict]):
+    """Durably append one batch's groups (items offset..end) to the journal."""
+    with open(cache_dir / "groups.journal.jsonl", "a") as f:
+        f.write(json.dumps({"offset": offset, "end": end, "groups": groups}, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def journal_offset(groups_data: dict, records: list[dict]) -> int:
+    """processed_offset of groups.json plus the journal."""
+    return max([groups_data.get("processed_offset", 0)] + [record["end"] for record in records])
+
+
+def materialize_groups(cache_dir: Path, meta: dict, records: list[dict] | None = None) -> dict:
+    """groups.json with the journal applied, in memory.
+    
+    Records already reflected in groups.json (end <= processed_offset, e.g. after a
+    crash between the rename and the journal removal) are skipped.
+    """
+    groups_data = _load_groups(cache_dir / "groups.json", meta)
+    for record in read_groups_journal(cache_dir) if records is None else records:
+        if record["end"] > groups_data.get("processed_offset", 0):
+            groups_data["groups"] = merge_groups(groups_data["groups"], record["groups"])
+            groups_data["processed_offset"] = record["end"]
+    return groups_data
+
+
+def compact_groups(cache_dir: Path, meta: dict) -> dict:
+    """Fold the journal into groups.json (written atomically), then drop the journal."""
+    records = read_groups_journal(cache_dir)
+    groups_data = materialize_groups(cache_dir, meta, records)
+    if not records:
+        return groups_data
+    _save_groups(cache_dir / "groups.json", groups_data)
+    (cache_dir / "groups.journal.jsonl").unlink()
+    return groups_data
+
+
+def run_compact_groups(version: str) -> int:
+    cache_dir = release_cache_dir(version)
+    raw_file = find_raw_items(cache_dir)
+    if not raw_file:
+        print(f"Error: {cache_dir / 'raw-items.json'} not found. Run fetch-release first.")
+        return 1
+    records = len(read_groups_journal(cache_dir))
+    groups_data = compact_groups(cache_dir, read_raw_meta(raw_file))
+    print(f"Compacted {records} journal records into {cache_dir / 'groups.json'} "
+          f"({len(groups_data['groups'])} groups, processed_offset {groups_data.get('processed_offset', 0)})")
+    return 0
+
+
+def _mark_grouped(cache_dir: Path, raw_file: Path):
+    """Snapshot the raw items groups.json now reflects, as the baseline for --incremental."""
+    for old in cache_dir.glob("raw-items.grouped.json*"):
+        old.unlink()
+    shutil.copyfile(raw_file, cache_dir / f"raw-items.grouped{raw_file.suffix}")
+
+
+def start_incremental_grouping(cache_dir: Path, raw_file: Path) -> int:
+    """Apply removed/changed items to groups.json locally and queue added items for the agent."""
     groups_file = cache_dir / "groups.json"
+    pending_file = cache_dir / "pending-items.json"
+    baseline_file = find_raw_items(cache_dir, "raw-items.grouped")
     
-    if not raw_file.exists():
-        print(f"Error: {raw_file} not found. Run fetch-release first.")
+    if pending_file.exists():
+        print("Resuming incremental grouping from pending-items.json")
+        return 0
+    if not groups_file.exists():
+        print(f"Error: {groups_file} not found. Run group-release without --incremental first.")
         return 1
     
-    with open(raw_file) as f:
-        data = json.load(f)
+    with open(groups_file) as f:
+        groups_data = json.load(f)
     
-    items = data["items"]
-    total = len(items)
+    if baseline_file:
+        baseline = list(iter_raw_items(baseline_file))
+        if groups_data.get("processed_offset", 0) < len(baseline):
+            print("Error: previous grouping is unfinished. Run group-release --all first.")
+            return 1
+    else:
+        # Groups created before baseline snapshots existed: the grouped items are the baseline
+        baseline = [item for group in groups_data["groups"] for item in group["items"]]
     
-    while True:
-        # Load current state
-        if groups_file.exists():
+    data = load_raw_items(raw_file)
+    diff = diff_items(baseline, data["items"])
+    print(f"Incremental diff: {len(diff['added'])} added, {len(diff['changed'])} changed, {len(diff['removed'])} removed")
+    
+    # Removed items are dropped and changed items updated in place; neither needs the agent
+    removed_keys = {item_key(i) for i in diff["removed"]}
+    changed_by_key = {item_key(i): i for i in diff["changed"]}
+    groups = []
+    for group in groups_data["groups"]:
+        group_items = []
+        for item in group["items"]:
+            key = item_key(item)
+            if key in removed_keys:
+                continue
+            if key in changed_by_key:
+                for field in COMPARED_FIELDS:
+                    item[field] = changed_by_key[key].get(field)
+            group_items.append(item)
+        if group_items:
+            group["items"] = group_items
+            group["repositories"] = sorted({i["repository"] for i in group_items})
+            groups.append(group)
+    dropped = len(groups_data["groups"]) - len(groups)
+    if dropped:
+        print(f"  Removed {dropped} empty groups")
+    groups_data["groups"] = groups
+    groups_data["sources"] = data["sources"]
+    
+    if diff["added"]:
+        with open(pending_file, "w") as f:
+            json.dump({"items": diff["added"], "total": data["total"]}, f, indent=2)
+        groups_data["processed_offset"] = 0
+    else:
+        groups_data["processed_offset"] = data["total"]
+        _mark_grouped(cache_dir, raw_file)
+    
+    _save_groups(groups_file, groups_data)
+    return 0
+
+
+def write_candidate_groups(cache_dir: Path, raw_file: Path, token_budget: int = TOKEN_BUDGET,
+                           batch_size: int | None = None) -> dict:
+    """Pre-cluster raw items locally and save candidate-groups.json."""
+    data = load_raw_items(raw_file)
+    result = precluster(data["items"])
+    with open(cache_dir / "candidate-groups.json", "w") as f:
+        json.dump({"version": data["version"], "sources": data["sources"], **result}, f, indent=2, ensure_ascii=False)
+    
+    stats = result["stats"]
+    before = count_batches(data["items"], token_budget, batch_size)
+    after = count_batches(result["ambiguous"], token_budget, batch_size)
+    print(f"Pre-clustered {stats['clustered_items']}/{stats['items']} items into "
+          f"{stats['prefix_groups']} prefix and {stats['similarity_groups']} similarity groups")
+    print(f"  Ambiguous items for the agent: {stats['ambiguous_items']} ({before} -> {after} batches of ~{token_budget} tokens)")
+    return {"data": data, **result}
+
+
+def start_preclustered_grouping(cache_dir: Path, raw_file: Path, token_budget: int, batch_size: int | None) -> int:
+    """Seed groups.json with candidate groups and queue only ambiguous items for the agent."""
+    groups_file = cache_dir / "groups.json"
+    pending_file = cache_dir / "pending-items.json"
+    
+    if pending_file.exists():
+        print("Resuming grouping from pending-items.json")
+        return 0
+    if groups_file.exists():
+        print(f"Error: {groups_file} already exists. --precluster only seeds a new grouping (use --incremental to update).")
+        return 1
+    
+    result = write_candidate_groups(cache_dir, raw_file, token_budget, batch_size)
+    data = result["data"]
+    groups_data = {
+        "version": data["version"],
+        "sources": data["sources"],
+        "groups": result["groups"],
+        "processed_offset": 0,
+    }
+    if result["ambiguous"]:
+        with open(pending_file, "w") as f:
+            json.dump({"items": result["ambiguous"], "total": data["total"]}, f, indent=2)
+    else:
+        groups_data["processed_offset"] = data["total"]
+        _mark_grouped(cache_dir, raw_file)
+    _save_groups(groups_file, groups_data)
+    return 0
+
+
+def run_precluster(version: str, token_budget: int = TOKEN_BUDGET, batch_size: int | None = None) -> int:
+    """Write candidate-groups.json without touching groups.json."""
+    cache_dir = release_cache_dir(version)
+    raw_file = find_raw_items(cache_dir)
+    if not raw_file:
+        print(f"Error: {cache_dir / 'raw-items.json'} not found. Run fetch-release first.")
+        return 1
+    write_candidate_groups(cache_dir, raw_file, token_budget, batch_size)
+    print(f"Saved to: {cache_dir / 'candidate-groups.json'}")
+    return 0
+
+
+def _finish_grouping(cache_dir: Path, raw_file: Path, total: int):
+    """Record that groups.json covers every raw item; closes out an incremental run."""
+    pending_file = cache_dir / "pending-items.json"
+    if pending_file.exists():
+        groups_file = cache_dir / "groups.json"
+        with open(groups_file) as f:
+            groups_data = json.load(f)
+        groups_data["processed_offset"] = total
+        _save_groups(groups_file, groups_data)
+        pending_file.unlink()
+    _mark_grouped(cache_dir, raw_file)
+
+
+def _load_groups(groups_file: Path, meta: dict) -> dict:
+    if groups_file.exists():
+        with open(groups_file) as f:
+            return json.load(f)
+    return {
+        "version": meta["version"],
+        "sources": meta["sources"],
+        "groups": [],
+        "processed_offset": 0
+    }
+
+
+def _items_from(raw_file: Path, pending_items: list[dict] | None, offset: int) -> Iterator[dict]:
+    if pending_items is not None:
+        return itertools.islice(pending_items, offset, None)
+    return iter_raw_items(raw_file, offset)
+
+
+def journal_note(version: str, close_groups: bool = False) -> str:
+    note = (f". Groups from earlier batches are in .cache/releases/v{version}/groups.json and "
+            f".cache/releases/v{version}/groups.journal.jsonl (read-only); reuse their names where an item fits.")
+    if close_groups:
+        # Lets closed_groups() hand groups of finished repositories to the planner mid-run
+        note += (" Only add an item to an existing group if that group already has an item from the same "
+                 "repository; otherwise create a new group with a different name.")
+    return note
+
+
+def hold_back_extensions(groups: list[dict], batch_groups: list[dict]) -> list[dict]:
+    """Rename batch groups that would extend a group without sharing one of its repositories.
+    
+    Enforces the close_groups contract in code rather than trusting the agent: a
+    renamed group is kept as a new group (qualified by repository), so a group the
+    planner may already have taken never gains items.
+    """
+    taken = {normalize_name(g["name"]): g for g in groups}
+    result = []
+    for group in batch_groups:
+        target = taken.get(normalize_name(group["name"]))
+        repositories = {i["repository"] for i in group["items"]}
+        if target is not None and not repositories <= {i["repository"] for i in target["items"]}:
+            base = f"{group['name']} ({sorted(repositories)[0]})"
+            name, n = base, 2
+            while normalize_name(name) in taken:
+                name, n = f"{base} {n}", n + 1
+            print(f"  Warning: group '{group['name']}' extended with other repositories; kept as '{name}'")
+            group = dict(group, name=name)
+        taken.setdefault(normalize_name(group["name"]), group)
+        result.append(group)
+    return result
+
+
+def journal_batch(cache_dir: Path, meta: dict, offset: int, end: int, batch_groups: list[dict], close_groups: bool):
+    """Append a finished batch to the journal, holding back closed-group extensions if `close_groups`."""
+    if close_groups:
+        batch_groups = hold_back_extensions(materialize_groups(cache_dir, meta)["groups"], batch_groups)
+    append_groups_journal(cache_dir, offset, end, batch_groups)
+
+
+def ungrouped_items(batch: list[dict], groups: list[dict]) -> list[dict]:
+    """Items of `batch` that appear in none of `groups` (matched by repository and PR, else by name)."""
+    def key(item: dict) -> tuple:
+        repository = (item.get("repository") or "").lower()
+        return (repository, item["pr"]) if item.get("pr") else (repository, normalize_name(item.get("name", "")))
+    
+    grouped = {key(item) for group in groups for item in group.get("items", [])}
+    return [item for item in batch if key(item) not in grouped]
+
+
+def run_group_batch(version: str, batch: list[dict], offset: int, total: int, batch_file: Path, groups_file: Path,
+                    log_file: Path | None = None, note: str = "", memo: bool = False) -> int:
+    """Run the group-release agent on one batch, splitting it in half and retrying on failure.
+    
+    The agent writes only this batch's groups to `groups_file`, which is reset to
+    no groups before every attempt. An attempt that leaves items of the batch
+    ungrouped counts as failed. The groups of split halves are combined, so on
+    success `groups_file` holds the whole batch with processed_offset at its end.
+    With `memo`, the batch, groups.json and the journal are the memo inputs.
+    """
+    with open(groups_file) as f:
+        base = {key: value for key, value in json.load(f).items() if key not in ("groups", "processed_offset")}
+    _save_groups(groups_file, {**base, "groups": [], "processed_offset": offset})
+    with open(batch_file, "w") as f:
+        json.dump({"items": batch, "offset": offset, "total": total}, f, indent=2)
+    prompt = (f"Group the items in {batch_file.relative_to(SCRIPT_DIR).as_posix()} into feature groups. "
+              f"Write this batch's groups to {groups_file.relative_to(SCRIPT_DIR).as_posix()}{note}")
+    cache_dir = release_cache_dir(version)
+    memo_io = ([batch_file, cache_dir / "groups.json", cache_dir / "groups.journal.jsonl"], [groups_file]) if memo else None
+    result = run_kiro("group-release", prompt, no_interactive=True, log_file=log_file, memo_io=memo_io)
+    if result == 0:
+        try:
             with open(groups_file) as f:
-                groups_data = json.load(f)
+                groups = json.load(f)["groups"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"  Batch of {len(batch)} items (offset {offset}): unreadable {groups_file.name}: {e}")
+            result = 1
         else:
-            groups_data = {
-                "version": data["version"],
-                "sources": data["sources"],
-                "groups": [],
-                "processed_offset": 0
-            }
-        
-        offset = groups_data.get("processed_offset", 0)
+            missing = ungrouped_items(batch, groups)
+            if not missing:
+                _save_groups(groups_file, {**base, "groups": groups, "processed_offset": offset + len(batch)})
+                return 0
+            print(f"  Batch of {len(batch)} items (offset {offset}): {len(missing)} item(s) left ungrouped")
+            result = 1
+    if len(batch) == 1 or stopping():
+        return result
+    
+    half = len(batch) // 2
+    print(f"  Batch of {len(batch)} items (offset {offset}) {agent_status(result)} (exit {result}); "
+          f"retrying as {half} + {len(batch) - half}")
+    groups = []
+    for part_offset, part in ((offset, batch[:half]), (offset + half, batch[half:])):
+        result = run_group_batch(version, part, part_offset, total, batch_file, groups_file, log_file, note, memo)
+        if result != 0:
+            return result
+        # Each half overwrites groups_file, so keep its groups before running the next one
+        with open(groups_file) as f:
+            groups = merge_groups(groups, json.load(f)["groups"])
+    _save_groups(groups_file, {**base, "groups": groups, "processed_offset": offset + len(batch)})
+    return 0
+
+
+def run_group_release_parallel(version: str, raw_file: Path, meta: dict, pending_items: list[dict] | None,
+                               token_budget: int, batch_size: int | None, workers: int, process_all: bool,
+                               memo: bool = False, close_groups: bool = False) -> int:
+    """Run grouping batches concurrently, then merge partial results into groups.json in offset order.
+    
+    Each worker gets a disjoint item range with its own batch and partial groups
+    file under partials/ (named by range). Only the contiguous run of finished
+    batches from the current offset is appended to the groups journal; finished
+    partials after a failed batch are kept and their ranges reused on the next run.
+    """
+    cache_dir = release_cache_dir(version)
+    groups_file = cache_dir / "groups.json"
+    partials_dir = cache_dir / "partials"
+    partials_dir.mkdir(exist_ok=True)
+    
+    start = journal_offset(_load_groups(groups_file, meta), read_groups_journal(cache_dir))
+    total = len(pending_items) if pending_items is not None else meta["total"]
+    
+    # Plan token-packed ranges, keeping the ranges of partials left by an earlier run
+    existing = {}
+    for path in partials_dir.glob("groups-*-*.json"):
+        first, end = path.stem.split("-")[1:]
+        existing[int(first)] = int(end)
+    sizes = [estimate_tokens(item) for item in _items_from(raw_file, pending_items, start)]
+    ranges = []
+    position = start
+    while position < total and (process_all or len(ranges) < workers):
+        end = existing.get(position) or position + batch_length(
+            itertools.islice(sizes, position - start, None), token_budget, batch_size)
+        ranges.append((position, end))
+        position = end
+    
+    def partial_file(first: int, end: int) -> Path:
+        return partials_dir / f"groups-{first:06d}-{end:06d}.json"
+    
+    def partial_done(first: int, end: int) -> bool:
+        if not partial_file(first, end).exists():
+            return False
+        with open(partial_file(first, end)) as f:
+            return json.load(f).get("processed_offset", 0) >= end
+    
+    def run_batch_worker(batch_range: tuple[int, int]) -> int:
+        first, end = batch_range
+        if partial_done(first, end):
+            return 0
+        _save_groups(partial_file(first, end),
+                     {"version": meta["version"], "sources": meta["sources"], "groups": [], "processed_offset": first})
+        batch = list(itertools.islice(_items_from(raw_file, pending_items, first), end - first))
+        result = run_group_batch(version, batch, first, total, partials_dir / f"batch-{first:06d}.json",
+                                 partial_file(first, end), partials_dir / f"batch-{first:06d}.log",
+                                 journal_note(version, close_groups), memo)
+        print(f"  Items {first+1}-{end}: {'done' if result == 0 else f'{agent_status(result)} (exit {result})'}")
+        return result
+    
+    print(f"\nProcessing {len(ranges)} batches (budget ~{token_budget} tokens each) with {workers} workers "
+          f"(logs in .cache/releases/v{version}/partials/)...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            results = list(executor.map(run_batch_worker, ranges))
+        except KeyboardInterrupt:
+            # Running agents were stopped by the interrupt handler; don't start queued batches
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    
+    # Deterministic merge: journal partials in offset order, stopping at the first unfinished batch
+    merged = 0
+    processed = start
+    for (first, end), result in zip(ranges, results):
+        if result != 0 or not partial_done(first, end):
+            break
+        with open(partial_file(first, end)) as f:
+            journal_batch(cache_dir, meta, first, end, json.load(f)["groups"], close_groups)
+        partial_file(first, end).unlink()
+        (partials_dir / f"batch-{first:06d}.json").unlink(missing_ok=True)
+        processed = end
+        merged += 1
+    
+    failed = [first for (first, _), result in zip(ranges, results) if result != 0]
+    timed_out = sum(1 for result in results if result == TIMEOUT_EXIT)
+    remaining = total - processed
+    print(f"\nMerged {merged}/{len(ranges)} batches into the groups journal.")
+    if failed:
+        print(f"Error: {len(failed)} batch(es) failed{f', {timed_out} timed out' if timed_out else ''} "
+              f"(offsets {', '.join(map(str, failed))}). Re-run to retry.")
+        return 1
+    if remaining <= 0:
+        groups_data = compact_groups(cache_dir, meta)
+        _finish_grouping(cache_dir, raw_file, meta["total"])
+        print(f"\nAll {total} items processed. {len(groups_data['groups'])} groups created.")
+    else:
+        print(f"\n{remaining} items remaining. Run with --all to process all.")
+    return 0
+
+
+def run_group_release(version: str, token_budget: int = TOKEN_BUDGET, process_all: bool = False,
+                      incremental: bool = False, preclustered: bool = False, workers: int = 1,
+                      batch_size: int | None = None, memo: bool = False, close_groups: bool = False) -> int:
+    """Group raw items into feature groups using LLM. Processes in batches.
+    
+    Each batch holds as many items as fit in `token_budget` estimated tokens
+    (capped at `batch_size` items if given); a failed batch is split in half and
+    retried. Each finished batch is appended to groups.journal.jsonl, from which
+    processed_offset is derived; groups.json is compacted from the journal once
+    all items are grouped (or by compact-groups). Batches are read lazily by offset (line by line for raw-items.jsonl). With
+    `incremental`, only items added since the last completed grouping are sent
+    to the agent; removed items are dropped from groups.json locally. With
+    `preclustered`, a new grouping starts from local candidate groups and the
+    agent only places the ambiguous items. With `workers` > 1, batches run
+    concurrently (see run_group_release_parallel). With `memo`, batches are
+    memoized (see run_kiro). With `close_groups`, the agent may only extend a
+    group with items from repositories it already has, so groups of
+    repositories the (repository-sorted) pending items have moved past are final.
+    """
+    cache_dir = release_cache_dir(version)
+    raw_file = find_raw_items(cache_dir)
+    groups_file = cache_dir / "groups.json"
+    pending_file = cache_dir / "pending-items.json"
+    
+    if not raw_file:
+        print(f"Error: {cache_dir / 'raw-items.json'} not found. Run fetch-release first.")
+        return 1
+    
+    meta = read_raw_meta(raw_file)
+    
+    if incremental or preclustered:
+        # Both rewrite groups.json from a consistent base
+        compact_groups(cache_dir, meta)
+    if incremental:
+        result = start_incremental_grouping(cache_dir, raw_file)
+        if result != 0:
+            return result
+    elif preclustered:
+        result = start_preclustered_grouping(cache_dir, raw_file, token_budget, batch_size)
+        if result != 0:
+            return result
+    
+    # An in-progress incremental or pre-clustered run groups only its pending items
+    pending_items = None
+    if pending_file.exists():
+        with open(pending_file) as f:
+            pending_items = json.load(f)["items"]
+        total = len(pending_items)
+    else:
+        total = meta["total"]
+    
+    if workers > 1:
+        return run_group_release_parallel(version, raw_file, meta, pending_items, token_budget, batch_size, workers,
+                                          process_all, memo, close_groups)
+    
+    groups_data = _load_groups(groups_file, meta)
+    grouped = False
+    while True:
+        # The journal holds batches appended since groups.json was last compacted
+        offset = journal_offset(groups_data, read_groups_journal(cache_dir))
         
         if offset >= total:
+            groups_data = compact_groups(cache_dir, meta)
+            if grouped or pending_file.exists():
+                _finish_grouping(cache_dir, raw_file, meta["total"])
             print(f"\nAll {total} items processed. {len(groups_data['groups'])} groups created.")
             return 0
         
-        # Process next batch
-        batch = items[offset:offset + batch_size]
-        print(f"\nProcessing items {offset+1}-{min(offset+batch_size, total)} of {total}...")
+        # Pack the next batch up to the token budget
+        sizes, items = itertools.tee(_items_from(raw_file, pending_items, offset))
+        count = batch_length(map(estimate_tokens, sizes), token_budget, batch_size)
+        batch = list(itertools.islice(items, count))
+        print(f"\nProcessing items {offset+1}-{offset+count} of {total} "
+              f"(~{sum(map(estimate_tokens, batch))} tokens)...")
         
-        # Save batch to temp file for LLM
-        batch_file = cache_dir / "batch.json"
-        with open(batch_file, "w") as f:
-            json.dump({"items": batch, "offset": offset, "total": total}, f, indent=2)
-        
-        # Call LLM to group this batch
-        prompt = f"Group the items in .cache/releases/v{version}/batch.json into feature groups. Append results to .cache/releases/v{version}/groups.json"
-        result = run_kiro("group-release", prompt, no_interactive=True)
+        # The agent writes only this batch's groups; they are journaled, not merged into groups.json
+        batch_groups_file = cache_dir / "batch-groups.json"
+        _save_groups(batch_groups_file,
+                     {"version": meta["version"], "sources": meta["sources"], "groups": [], "processed_offset": offset})
+        result = run_group_batch(version, batch, offset, total, cache_dir / "batch.json", batch_groups_file,
+                                 note=journal_note(version, close_groups), memo=memo)
         
         if result != 0:
-            print(f"Error processing batch. Stopping.")
+            print(f"Error processing batch ({agent_status(result)}, exit {result}). Stopping.")
             return result
         
-        if not process_all:
-            # Reload to get updated offset
-            with open(groups_file) as f:
-                groups_data = json.load(f)
-            remaining = total - groups_data.get("processed_offset", offset + batch_size)
-            if remaining > 0:
-                print(f"\n{remaining} items remaining. Run with --all to process all.")
+        with open(batch_groups_file) as f:
+            journal_batch(cache_dir, meta, offset, offset + count, json.load(f)["groups"], close_groups)
+        batch_groups_file.unlink()
+        grouped = True
+        remaining = total - (offset + count)
+        if remaining > 0 and not process_all:
+            print(f"\n{remaining} items remaining. Run with --all to process all.")
             return 0
 
 
+def translation_path(feature: str, lang: str) -> str:
+    """Repository-relative path of a feature report's translation (English reports have no suffix)."""
+    suffix = f".{lang}.md" if lang != "en" else ".md"
+    return f"docs/features/{feature}{suffix}"
+
+
 def build_prompt(mode: str, args: argparse.Namespace) -> str:
     """Build initial prompt based on mode and arguments."""
     lang_instruction = ""
@@ -281,9 +1215,9 @@ def build_prompt(mode: str, args: argparse.Namespace) -> str:
         return f"Create release summary for OpenSearch v{args.version}.{lang_instruction}"
     
     if mode == "translate":
-        suffix = f".{args.to}.md" if args.to != "en" else ".md"
         if args.feature:
-            return f'Translate "docs/features/{args.feature}.md" to "{args.to}". Save as "docs/features/{args.feature}{suffix}"'
+            return (f'Translate "docs/features/{args.feature}.md" to "{args.to}". '
+                    f'Save as "{translation_path(args.feature, args.to)}"')
         if args.release:
             return f'Translate reports in "docs/releases/v{args.release}/" to "{args.to}".'
         return ""
@@ -303,10 +1237,67 @@ def build_prompt(mode: str, args: argparse.Namespace) -> str:
     return ""
 
 
-def run_kiro(mode: str, prompt: str, no_interactive: bool = False) -> int:
-    """Run kiro-cli with the appropriate agent. Returns exit code."""
+def memo_paths(mode: str, args: argparse.Namespace) -> tuple[list[Path], list[Path]] | None:
+    """(inputs, outputs) a memoized run of `mode` depends on and produces; None if not memoizable."""
+    if mode == "review-groups":
+        groups_file = release_cache_dir(args.version) / "groups.json"
+        return [groups_file], [groups_file]
+    if mode == "summarize":
+        release_dir = SCRIPT_DIR / "docs" / "releases" / f"v{args.version}"
+        return [release_dir / "features"], [release_dir]
+    if mode == "translate":
+        if args.feature:
+            source = SCRIPT_DIR / "docs" / "features" / f"{args.feature}.md"
+            return [source], [SCRIPT_DIR / translation_path(args.feature, args.to)]
+        if args.release:
+            release_dir = SCRIPT_DIR / "docs" / "releases" / f"v{args.release}"
+            return [release_dir], [release_dir]
+    return None
+
+
+def agent_limits(mode: str) -> dict:
+    """Watchdog limits for `mode`: AGENT_LIMITS overridden by config.json agents.default and agents.{mode}."""
+    with open(CONFIG_FILE) as f:
+        agents = json.load(f).get("agents", {})
+    return {**AGENT_LIMITS, **agents.get("default", {}), **agents.get(mode, {})}
+
+
+def agent_status(exit_code: int) -> str:
+    if exit_code == 0:
+        return "success"
+    return "timed out" if exit_code == TIMEOUT_EXIT else "failed"
+
+
+def run_kiro(mode: str, prompt: str, no_interactive: bool = False, log_file: Path | None = None,
+             cwd: Path | None = None, memo_io: tuple[list[Path], list[Path]] | None = None,
+             issue: int | None = None, outcome: dict | None = None) -> int:
+    """Run kiro-cli with the appropriate agent. Returns exit code.
+    
+    With `log_file`, output goes to that file instead of the terminal (for concurrent runs).
+    `cwd` runs the agent in another checkout, e.g. a pool worktree. With `memo_io`
+    (input paths, output paths), a run whose agent config, prompt and inputs match
+    an earlier successful run restores that run's output files instead (see memo.Memo).
+    Every call is recorded in the metrics file (see metrics.py), tagged with `issue`.
+    
+    Non-interactive runs are watched (see agent_watchdog.py): the process group is
+    killed after the mode's `timeout` seconds, or `idleTimeout` seconds without
+    output, and the run returns TIMEOUT_EXIT. Timed-out runs and failures whose
+    output matches TRANSIENT_RE are retried up to `retries` times with exponential
+    backoff. The number of attempts is stored in `outcome["attempts"]`.
+    """
     agent_name = AGENTS[mode].replace(".json", "")
     
+    if memo_io:
+        memo = Memo(SCRIPT_DIR)
+        inputs, outputs = memo_io
+        key = memo.key(AGENTS_DIR / AGENTS[mode], prompt, inputs)
+        restored = memo.replay(key)
+        if restored is not None:
+            print(f"Memo hit ({mode}): restored {restored} output file(s) without running kiro-cli")
+            metrics.record("agent", mode, 0, exit_code=0, issue=issue, memo="hit")
+            return 0
+        before = memo.file_hashes(outputs)
+    
     cmd = [
         "kiro-cli", "chat",
         "--agent", agent_name,
@@ -319,120 +1310,621 @@ def run_kiro(mode: str, prompt: str, no_interactive: bool = False) -> int:
     if prompt:
         cmd.append(prompt)
     
-    result = subprocess.run(cmd, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr)
-    return result.returncode
+    limits = agent_limits(mode)
+    max_attempts = 1 + limits["retries"] if no_interactive else 1
+    for attempt in range(1, max_attempts + 1):
+        watched = None
+        with metrics.timed("agent", mode, issue=issue, attempt=attempt if attempt > 1 else None) as fields:
+            if not no_interactive:
+                returncode = subprocess.run(cmd, stdin=sys.stdin, stdout=sys.stdout, stderr=sys.stderr, cwd=cwd).returncode
+            elif log_file:
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(log_file, "ab") as log:
+                    start_size = log.tell()
+                    watched = run_watched(cmd, log, cwd, limits["timeout"], limits["idleTimeout"])
+                fields["output_bytes"] = log_file.stat().st_size - start_size
+            else:
+                sys.stdout.flush()
+                watched = run_watched(cmd, sys.stdout.buffer, cwd, limits["timeout"], limits["idleTimeout"])
+            if watched:
+                returncode = TIMEOUT_EXIT if watched.timed_out else watched.returncode
+                fields["timeout"] = watched.timed_out
+            fields["exit_code"] = returncode
+        
+        if (returncode == 0 or attempt == max_attempts or stopping()
+                or not (watched.timed_out or TRANSIENT_RE.search(watched.tail))):
+            break
+        if watched.timed_out == "wall":
+            reason = f"timed out after {limits['timeout']}s"
+        elif watched.timed_out:
+            reason = f"no output for {limits['idleTimeout']}s"
+        else:
+            reason = f"transient failure (exit {returncode})"
+        delay = limits["retryBackoff"] * 2 ** (attempt - 1)
+        delay += random.uniform(0, delay / 2)
+        message = f"{mode}{f' #{issue}' if issue else ''}: {reason}; retrying in {delay:.0f}s ({attempt + 1}/{max_attempts})"
+        if log_file:
+            with open(log_file, "a") as log:
+                log.write(f"\n{message}\n")
+        else:
+            print(message)
+        time.sleep(delay)
+    if outcome is not None:
+        outcome["attempts"] = attempt
+    
+    if memo_io and returncode == 0:
+        recorded = memo.record(key, mode, prompt, inputs, before, outputs)
+        print(f"Memo recorded ({mode}): {recorded} output file(s)")
+    return returncode
 
 
-def get_open_issues(labels: list[str], limit: int | None = None) -> list[dict]:
-    """Get open issues with specified labels using gh CLI."""
-    import json
-    label_filter = ",".join(labels)
-    cmd = [
-        "gh", "issue", "list",
-        "--state", "open",
-        "--label", label_filter,
-        "--json", "number,title",
-        "--limit", str(limit) if limit else "1000",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        return []
-    return json.loads(result.stdout)
+def run_stats(since_hours: float | None = None, kind: str | None = None) -> int:
+    """Print per-call latency percentiles and throughput from the metrics file."""
+    since = datetime.now(timezone.utc) - timedelta(hours=since_hours) if since_hours else None
+    records = [r for r in metrics.load(since=since) if not kind or r["kind"] == kind]
+    if not records:
+        print(f"No metrics recorded in {metrics.METRICS_FILE}")
+        return 0
+    
+    def fmt(seconds: float) -> str:
+        return f"{seconds:.1f}s" if seconds < 120 else f"{seconds / 60:.1f}m"
+    
+    print(f"{'Kind':<7} {'Name':<40} {'Calls':>6} {'Fail':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'Max':>8} {'Total':>9} {'/hour':>7}")
+    for row in metrics.aggregate(records):
+        per_hour = f"{row['per_hour']:.1f}" if row["per_hour"] else "-"
+        print(f"{row['kind']:<7} {row['name'][:40]:<40} {row['calls']:>6} {row['failed']:>5} {fmt(row['p50']):>8} "
+              f"{fmt(row['p90']):>8} {fmt(row['p99']):>8} {fmt(row['max']):>8} {fmt(row['total']):>9} {per_hour:>7}")
+    first = min(r["ts"] for r in records)
+    print(f"\n{len(records)} calls since {first[:19]}")
+    return 0
+
+
+def run_memo(action: str, mode: str | None = None, path: str | None = None) -> int:
+    """List or invalidate memoized agent runs."""
+    memo = Memo(SCRIPT_DIR)
+    if action == "list":
+        entries = memo.entries()
+        for key, entry in entries:
+            print(f"{key[:12]}  {entry['created_at'][:19]}  {entry['mode']:<14} {len(entry['outputs']):>3} file(s)  {entry['prompt'][:60]}")
+        print(f"{len(entries)} memo entries")
+        return 0
+    dropped = memo.invalidate(mode, path)
+    print(f"Invalidated {dropped} memo entries")
+    return 0
+
+
+def get_open_issues(labels: list[str], limit: int | None = None) -> list[dict] | None:
+    """Get open issues with specified labels from this repository. Returns None if listing failed."""
+    owner, repo = current_repo()
+    params = {"state": "open", "labels": ",".join(labels)}
+    with metrics.timed("call", "get_open_issues") as fields:
+        try:
+            # The issues endpoint also returns pull requests
+            issues = get_client().paginate(f"repos/{owner}/{repo}/issues", params, limit=limit or 1000,
+                                           keep=lambda i: "pull_request" not in i)
+        except (GitHubError, OSError) as e:
+            print(f"Error listing issues: {e}", file=sys.stderr)
+            fields["error"] = type(e).__name__
+            return None
+        fields["count"] = len(issues)
+    return [{"number": i["number"], "title": i["title"], "labels": [label["name"] for label in i.get("labels", [])]}
+            for i in issues]
+
+
+def prefetch_issues(numbers: list[int]) -> dict:
+    """Prefetch GitHub context bundles for investigation Issues (see prefetch.py). Returns {number: path}.
+    
+    A failed prefetch is reported and skipped; agents then fetch context themselves.
+    """
+    if not numbers:
+        return {}
+    with metrics.timed("call", "prefetch_context", count=len(numbers)) as fields:
+        try:
+            bundles = prefetch_context(numbers, SCRIPT_DIR / ".cache")
+        except (GitHubError, OSError) as e:
+            print(f"Warning: context prefetch failed: {e}")
+            fields["error"] = type(e).__name__
+            return {}
+    print(f"Prefetched GitHub context for {len(bundles)}/{len(numbers)} Issues")
+    return bundles
+
+
+def cache_note() -> str:
+    """Prompt sentence pointing an agent in a pool worktree at the primary checkout's .cache.
+    
+    A worktree's own .cache is not shared with other workers and is removed with the pool.
+    """
+    return f" Cache directory: {(SCRIPT_DIR / '.cache').resolve()} (use it for every .cache/ path)."
+
+
+def context_note(bundles: dict, number: int) -> str:
+    """Prompt sentence pointing the agent at a prefetched bundle (absolute, since agents may run in worktrees)."""
+    path = bundles.get(number)
+    return f" Prefetched GitHub context: {path.resolve()}." if path else ""
+
+
+def run_prefetch(version: str | None = None, numbers: list[int] | None = None) -> int:
+    """Prefetch context for the given Issues, or every open status/todo Issue (of `version`)."""
+    if not numbers:
+        labels = ["status/todo"] + ([f"release/v{version}"] if version else [])
+        numbers = [issue["number"] for issue in get_open_issues(labels) or []]
+    if not numbers:
+        print("No Issues to prefetch")
+        return 0
+    bundles = prefetch_issues(numbers)
+    for number, path in sorted(bundles.items()):
+        print(f"  #{number}: {path.relative_to(SCRIPT_DIR).as_posix()}")
+    return 0 if bundles else 1
+
+
+def print_batch_summary(title: str, results: list[tuple[int, str, str, int]]):
+    """Print per-issue outcomes: (number, title, status, attempts)."""
+    print(f"\n{'='*50}")
+    print(title)
+    print(f"{'='*50}")
+    success = sum(1 for _, _, status, _ in results if status == "success")
+    timed_out = sum(1 for _, _, status, _ in results if status == "timed out")
+    retried = sum(1 for _, _, _, attempts in results if attempts > 1)
+    print(f"Success: {success}/{len(results)}" + (f", timed out: {timed_out}" if timed_out else "")
+          + (f", retried: {retried}" if retried else ""))
+    for issue_num, issue_title, status, attempts in results:
+        retries = f" ({attempts} attempts)" if attempts > 1 else ""
+        print(f"  #{issue_num}: {status}{retries} - {issue_title}")
+
 
+def run_issue_pool(mode: str, issues: Iterable[dict], prompt_for, workers: int,
+                   on_result=None, total: int | None = None) -> list[tuple[int, str, str, int]]:
+    """Run one agent per issue with up to `workers` at a time. Returns results in issue order.
+    
+    Each run works in its own git worktree (see worktrees.WorktreePool), reset to
+    main between issues. Output goes to .cache/logs/{mode}/issue-{number}.log; the
+    terminal shows a single live progress line. Workers take the next issue only
+    when they are free, so `issues` may be a generator that yields issues as they
+    become available or claims them from a work queue; `on_result` is called with
+    each (number, title, status, attempts) as runs finish, except runs cut short by
+    Ctrl-C (their queue leases simply expire). After Ctrl-C no further issue is taken.
+    """
+    log_dir = LOG_DIR / mode
+    if total is None:
+        total = len(issues) if isinstance(issues, list) else "?"
+    running = []
+    counts = {"success": 0, "failed": 0, "timed out": 0}
+    lock = threading.Lock()
+    interactive = sys.stdout.isatty()
+    
+    def show_progress():
+        done = sum(counts.values())
+        active = " ".join(f"#{n}" for n in running[:8]) + (" ..." if len(running) > 8 else "")
+        line = (f"[{done}/{total}] success {counts['success']}, failed {counts['failed']}, "
+                f"timed out {counts['timed out']} | running: {active or '-'}")
+        if interactive:
+            print(f"\r\033[K{line}", end="", flush=True)
+        else:
+            print(line, flush=True)
+    
+    def run_one(issue: dict) -> tuple[int, str, str, int]:
+        with lock:
+            running.append(issue["number"])
+            show_progress()
+        log_file = log_dir / f"issue-{issue['number']}.log"
+        outcome = {"attempts": 1}
+        try:
+            with pool.worktree() as worktree:
+                exit_code = run_kiro(mode, prompt_for(issue) + cache_note(), no_interactive=True, log_file=log_file,
+                                     cwd=worktree, issue=issue["number"], outcome=outcome)
+        except RuntimeError as e:
+            # Worktree reset failed; record it in the issue log
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_file, "a") as log:
+                log.write(f"{e}\n")
+            exit_code = 1
+        status = agent_status(exit_code)
+        result = (issue["number"], issue["title"], status, outcome["attempts"])
+        with lock:
+            running.remove(issue["number"])
+            counts[status] += 1
+            show_progress()
+            if on_result and not stopping():
+                on_result(result)
+        return result
+    
+    pending = enumerate(iter(issues))
+    next_lock = threading.Lock()
+    stop = threading.Event()
+    results = []
+    
+    def worker():
+        while True:
+            # Separate lock: the next issue may take a while to arrive (streaming) or claim
+            with next_lock:
+                # stopping() also covers pools run from a stage thread, which never sees KeyboardInterrupt
+                if stop.is_set() or stopping():
+                    return
+                index, issue = next(pending, (None, None))
+            if issue is None:
+                return
+            results.append((index, run_one(issue)))
+    
+    print(f"Running {total} issues with {workers} workers (logs in {log_dir.relative_to(SCRIPT_DIR).as_posix()}/)")
+    with WorktreePool(SCRIPT_DIR, workers) as pool, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        try:
+            for future in futures:
+                future.result()
+        except KeyboardInterrupt:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            raise
+    if interactive:
+        print()
+    return [result for _, result in sorted(results, key=lambda r: r[0])]
+
+
+def run_issues_sequentially(label: str, mode: str, issues: Iterable[dict], total: int, prompt_for,
+                            on_result) -> list[tuple[int, str, str, int]]:
+    """Run one agent per issue in this checkout, with its output on the terminal."""
+    results = []
+    for i, issue in enumerate(issues, 1):
+        print(f"\n{'='*50}")
+        print(f"{label} {i}/{total}: Issue #{issue['number']}")
+        print(f"  {issue['title']}")
+        print(f"{'='*50}\n")
+        
+        outcome = {"attempts": 1}
+        exit_code = run_kiro(mode, prompt_for(issue), no_interactive=True, issue=issue["number"], outcome=outcome)
+        results.append((issue["number"], issue["title"], agent_status(exit_code), outcome["attempts"]))
+        on_result(results[-1])
+    return results
+
+
+def fill_queue(queue: WorkQueue, name: str, labels: list[str], refresh: bool = False) -> int | None:
+    """Sync queue `name` with open Issues, unless it still has pending work and not `refresh`.
+    
+    Failed, timed-out and exhausted Issues are requeued before syncing, so each
+    new run retries them once (those no longer open are dropped by the sync).
+    Returns the number of pending Issues, or None if Issues could not be listed.
+    """
+    pending = queue.pending(name)
+    if pending and not refresh:
+        print(f"Resuming queue '{name}': {pending} pending Issues (--refresh to re-sync with GitHub)")
+        return pending
+    issues = get_open_issues(labels)
+    if issues is None:
+        return None
+    retried = queue.retry(name)
+    added, dropped = queue.sync(name, issues)
+    print(f"Queue '{name}': {added} Issues added, {retried} failed Issues requeued, {dropped} no longer open")
+    return queue.pending(name)
+
+
+def queue_finisher(queue: WorkQueue, name: str, owner: str):
+    """on_result callback recording each outcome in the queue."""
+    def finish(result: tuple[int, str, str, int]):
+        if not queue.finish(name, result[0], owner, result[2]):
+            print(f"Warning: lease on #{result[0]} was lost; its outcome is not recorded")
+    return finish
+
+
+def claimable(queue: WorkQueue, name: str, limit: int) -> list[int]:
+    """Issue numbers the next `limit` claims would most likely return."""
+    items = [item["issue"] for item in queue.items(name)
+             if item["outcome"] is None and item["attempts"] < queue.max_attempts]
+    return items[:limit]
 
-def run_batch(count: int | None, lang: str | None = None, no_pr: bool = False, version: str | None = None):
-    """Run investigate in batch mode. If count is None, process all open issues."""
+
+def run_batch(count: int | None, lang: str | None = None, no_pr: bool = False, version: str | None = None,
+              workers: int = 1, prefetch: bool = True, refresh: bool = False):
+    """Run investigate in batch mode. If count is None, process all open issues.
+    
+    Issues are claimed from the local work queue (see workqueue.py) named
+    "investigate" or "investigate:v{version}", which is filled from GitHub only
+    when it has no pending work (or with `refresh`). Several batch processes
+    can share the queue; a crashed process's Issues are reclaimed when their
+    lease expires. With `workers` > 1, issues are investigated concurrently
+    (see run_issue_pool). With `prefetch`, the PRs and Issues each issue
+    references are fetched up front in bulk and the agent is pointed at the
+    resulting context bundle.
+    """
     lang_instruction = f" Output in language code '{lang}'." if lang else ""
     pr_mode = " Push directly to main." if no_pr else " Use PR workflow (create branch, pull request, and auto-merge)."
     
-    # Get open issues first
     labels = ["status/todo"]
     if version:
         labels.append(f"release/v{version}")
-    issues = get_open_issues(labels, count)
-    if not issues:
+    queue = WorkQueue(QUEUE_FILE)
+    queue_name = f"investigate:v{version}" if version else "investigate"
+    pending = fill_queue(queue, queue_name, labels, refresh)
+    if not pending:
         print(f"No open issues found with labels: {', '.join(labels)}")
         return
     
-    total = len(issues)
+    total = min(pending, count) if count else pending
     results = []
+    bundles = prefetch_issues(claimable(queue, queue_name, total)) if prefetch else {}
+    owner = worker_id()
+    finish = queue_finisher(queue, queue_name, owner)
     
-    for i, issue in enumerate(issues, 1):
-        issue_num = issue["number"]
-        issue_title = issue["title"]
-        
-        print(f"\n{'='*50}")
-        print(f"Batch {i}/{total}: Issue #{issue_num}")
-        print(f"  {issue_title}")
-        print(f"{'='*50}\n")
-        
-        prompt = f"Investigate GitHub Issue #{issue_num}.{pr_mode}{lang_instruction}"
-        exit_code = run_kiro("investigate", prompt, no_interactive=True)
-        results.append((issue_num, issue_title, "success" if exit_code == 0 else "failed"))
+    with queue.heartbeat(owner):
+        issues = queue.claims(queue_name, owner, count)
+        if workers > 1:
+            try:
+                results = run_issue_pool(
+                    "investigate", issues,
+                    lambda issue: (f"Investigate GitHub Issue #{issue['number']}.{pr_mode}{lang_instruction}"
+                                   f"{context_note(bundles, issue['number'])}"), workers, finish, total)
+            except RuntimeError as e:
+                print(f"Error setting up worktrees: {e}")
+                return
+        else:
+            results = run_issues_sequentially("Batch", "investigate", issues, total, lambda issue: (
+                f"Investigate GitHub Issue #{issue['number']}.{pr_mode}{lang_instruction}"
+                f"{context_note(bundles, issue['number'])}"), finish)
     
-    # Summary
-    print(f"\n{'='*50}")
-    print("Batch Summary")
-    print(f"{'='*50}")
-    success = sum(1 for _, _, status in results if status == "success")
-    print(f"Success: {success}/{total}")
-    for issue_num, issue_title, status in results:
-        print(f"  #{issue_num}: {status} - {issue_title}")
+    print_batch_summary("Batch Summary", results)
+
 
+def run_queue(action: str, name: str | None = None) -> int:
+    """Show or reset the work queue of batch-investigate / batch-refactor."""
+    queue = WorkQueue(QUEUE_FILE)
+    if action in ("retry", "clear") and not name:
+        print(f"Error: queue {action} needs --queue")
+        return 1
+    if action == "retry":
+        print(f"Requeued {queue.retry(name)} Issues in '{name}'")
+        return 0
+    if action == "clear":
+        print(f"Removed {queue.clear(name)} Issues from '{name}'")
+        return 0
+    
+    now = time.time()
+    by_queue = {}
+    for item in queue.items(name):
+        by_queue.setdefault(item["queue"], []).append(item)
+    if not by_queue:
+        print(f"No queued Issues in {QUEUE_FILE.relative_to(SCRIPT_DIR).as_posix()}")
+    for queue_name, items in by_queue.items():
+        leased = [i for i in items if i["outcome"] is None and i["lease_expires"] and i["lease_expires"] >= now]
+        exhausted = [i for i in items if i["outcome"] is None and i not in leased and i["attempts"] >= queue.max_attempts]
+        waiting = [i for i in items if i["outcome"] is None and i not in leased and i not in exhausted]
+        outcomes = {}
+        for item in items:
+            if item["outcome"]:
+                outcomes[item["outcome"]] = outcomes.get(item["outcome"], 0) + 1
+        print(f"{queue_name}: {len(waiting)} pending, {len(leased)} leased, {len(exhausted)} exhausted"
+              + "".join(f", {count} {outcome}" for outcome, count in sorted(outcomes.items())))
+        for item in leased:
+            print(f"  #{item['issue']}: {item['lease_owner']} (attempt {item['attempts']}, "
+                  f"lease expires in {item['lease_expires'] - now:.0f}s)")
+        for item in exhausted:
+            print(f"  #{item['issue']}: abandoned after {item['attempts']} attempts (queue retry to requeue)")
+    return 0
 
-def run_batch_refactor():
-    """Process all open refactor-labeled Issues."""
-    issues = get_open_issues(["refactor"])
-    if not issues:
+
+def run_batch_refactor(refresh: bool = False):
+    """Process all open refactor-labeled Issues, claimed from the "refactor" work queue (see run_batch)."""
+    queue = WorkQueue(QUEUE_FILE)
+    pending = fill_queue(queue, "refactor", ["refactor"], refresh)
+    if not pending:
         print("No open issues found with label: refactor")
         return
     
-    total = len(issues)
-    results = []
+    owner = worker_id()
+    with queue.heartbeat(owner):
+        results = run_issues_sequentially(
+            "Refactor", "refactor", queue.claims("refactor", owner), pending,
+            lambda issue: f"Process refactor Issue #{issue['number']}. Read Issue body for transformation rules and target files.",
+            queue_finisher(queue, "refactor", owner))
     
-    for i, issue in enumerate(issues, 1):
-        issue_num = issue["number"]
-        issue_title = issue["title"]
-        
-        print(f"\n{'='*50}")
-        print(f"Refactor {i}/{total}: Issue #{issue_num}")
-        print(f"  {issue_title}")
-        print(f"{'='*50}\n")
-        
-        prompt = f"Process refactor Issue #{issue_num}. Read Issue body for transformation rules and target files."
-        exit_code = run_kiro("refactor", prompt, no_interactive=True)
-        results.append((issue_num, issue_title, "success" if exit_code == 0 else "failed"))
+    print_batch_summary("Batch Refactor Summary", results)
+
+
+def closed_groups(version: str) -> tuple[list[dict], bool]:
+    """Groups no later grouping batch can change, and whether grouping is complete.
     
-    # Summary
-    print(f"\n{'='*50}")
-    print("Batch Refactor Summary")
-    print(f"{'='*50}")
-    success = sum(1 for _, _, status in results if status == "success")
-    print(f"Success: {success}/{total}")
-    for issue_num, issue_title, status in results:
-        print(f"  #{issue_num}: {status} - {issue_title}")
+    Mid-run, groups are only final for a close_groups run over repository-sorted
+    pending items (group-release --precluster): a group is closed once all its
+    repositories sort before the repository of the next ungrouped item. Batches
+    are journaled through hold_back_extensions, so a closed group never changes.
+    """
+    cache_dir = release_cache_dir(version)
+    raw_file = find_raw_items(cache_dir)
+    if not raw_file:
+        return [], False
+    meta = read_raw_meta(raw_file)
+    groups_data = materialize_groups(cache_dir, meta)
+    pending_file = cache_dir / "pending-items.json"
+    if not pending_file.exists():
+        complete = groups_data.get("processed_offset", 0) >= meta["total"] and (cache_dir / "groups.json").exists()
+        return (groups_data["groups"], True) if complete else ([], False)
+    
+    with open(pending_file) as f:
+        remaining = [item["repository"] for item in json.load(f)["items"][groups_data.get("processed_offset", 0):]]
+    if not remaining:
+        return groups_data["groups"], False
+    if remaining != sorted(remaining):
+        return [], False
+    return [g for g in groups_data["groups"] if all(i["repository"] < remaining[0] for i in g["items"])], False
 
 
-def run_release_investigate(version: str, lang: str | None = None, no_pr: bool = False) -> int:
-    """Full release investigation using release-investigate agent."""
-    print(f"=== Release Investigation: v{version} ===\n")
+def _load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path) as f:
+        return json.load(f)
 
-    # Step 1: Fetch (Python - no LLM needed)
-    print("Step 1: Fetching release notes...")
-    if run_fetch_release(version) != 0:
-        return 1
 
-    # Step 2: Group (all batches)
-    print("\nStep 2: Grouping items...")
-    if run_group_release(version, batch_size=50, process_all=True) != 0:
-        return 1
+def _save_json(path: Path, data):
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, path)
+
+
+def run_plan_stage(version: str, scheduler: StageScheduler) -> int:
+    """Create Issues for groups as they close, recording {group name: issue number} in issues.json.
+    
+    The planner works on plan-groups.json (closed groups without an Issue) so it
+    never writes groups.json while grouping is still appending to the journal.
+    Once grouping is done, issue numbers are written into groups.json, which is
+    copied to data/releases/v{version}/ and committed and pushed (the planner's
+    own commit step is skipped in staged mode).
+    """
+    cache_dir = release_cache_dir(version)
+    issues_file = cache_dir / "issues.json"
+    plan_file = cache_dir / "plan-groups.json"
+    issued = _load_json(issues_file, {})
+    
+    while True:
+        upstream_finished = scheduler.finished("group")
+        groups, complete = closed_groups(version)
+        pending = [g for g in groups if g["name"] not in issued]
+        if pending:
+            _save_json(plan_file, {"version": version, "groups": pending})
+            print(f"[plan] Creating Issues for {len(pending)} closed groups ({len(issued)} created so far)")
+            prompt = (f"Staged mode: create GitHub Project and Issues for OpenSearch v{version} from "
+                      f".cache/releases/v{version}/plan-groups.json. Create max 20 Issues per run. "
+                      f"Resume from where left off.")
+            result = run_kiro("planner", prompt, no_interactive=True, log_file=LOG_DIR / "planner" / f"v{version}.log")
+            created = {g["name"]: g["issue_number"] for g in _load_json(plan_file, {"groups": []})["groups"]
+                       if g.get("issue_number")}
+            issued.update(created)
+            _save_json(issues_file, issued)
+            if result != 0:
+                return result
+            if not created:
+                print("[plan] Error: planner created no Issues")
+                return 1
+            continue
+        if upstream_finished:
+            if not (scheduler.succeeded("group") and complete):
+                return 1
+            break
+        time.sleep(STAGE_POLL_INTERVAL)
+    
+    plan_file.unlink(missing_ok=True)
+    groups_file = cache_dir / "groups.json"
+    groups_data = _load_json(groups_file, {})
+    for group in groups_data["groups"]:
+        if group["name"] in issued:
+            group["issue_number"] = issued[group["name"]]
+    _save_groups(groups_file, groups_data)
+    data_dir = SCRIPT_DIR / "data" / "releases" / f"v{version}"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(groups_file, data_dir / "groups.json")
+    print(f"[plan] {len(issued)} Issues; progress saved to {data_dir / 'groups.json'}")
+    return commit_progress(data_dir / "groups.json",
+                           f"data: update v{version} progress ({len(issued)}/{len(groups_data['groups'])} issues)")
+
+
+def commit_progress(path: Path, message: str) -> int:
+    """Commit `path` in this checkout (if it changed) and push, like the planner's commit step."""
+    def git(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", *args], cwd=SCRIPT_DIR, capture_output=True, text=True)
+    
+    relative = str(path.relative_to(SCRIPT_DIR))
+    git("add", relative)
+    if git("diff", "--cached", "--quiet", "--", relative).returncode == 0:
+        return 0
+    for args in (("commit", "--quiet", "-m", message, "--", relative), ("push", "--quiet")):
+        result = git(*args)
+        if result.returncode != 0:
+            print(f"Error: git {args[0]} of {relative} failed: {result.stderr.strip()}")
+            return 1
+    return 0
+
+
+def run_investigate_stage(version: str, scheduler: StageScheduler, workers: int, lang: str | None,
+                          no_pr: bool, prefetch: bool = True) -> int:
+    """Investigate Issues as the plan stage creates them; outcomes are kept in investigated.json.
+    
+    Each set of newly created Issues is prefetched in bulk before it is handed to the workers.
+    """
+    cache_dir = release_cache_dir(version)
+    issues_file = cache_dir / "issues.json"
+    state_file = cache_dir / "investigated.json"
+    state = _load_json(state_file, {})
+    lang_instruction = f" Output in language code '{lang}'." if lang else ""
+    pr_mode = " Push directly to main." if no_pr else " Use PR workflow (create branch, pull request, and auto-merge)."
+    
+    bundles = {}
+    
+    def new_issues() -> Iterator[dict]:
+        seen = set()
+        while True:
+            upstream_finished = scheduler.finished("plan")
+            fresh = [{"number": number, "title": name} for name, number in _load_json(issues_file, {}).items()
+                     if number not in seen and state.get(str(number)) != "success"]
+            seen.update(issue["number"] for issue in fresh)
+            if prefetch:
+                bundles.update(prefetch_issues([issue["number"] for issue in fresh]))
+            yield from fresh
+            if upstream_finished:
+                return
+            time.sleep(STAGE_POLL_INTERVAL)
+    
+    def record(result: tuple[int, str, str, int]):
+        state[str(result[0])] = result[2]
+        _save_json(state_file, state)
+    
+    results = run_issue_pool(
+        "investigate", new_issues(),
+        lambda issue: (f"Investigate GitHub Issue #{issue['number']}.{pr_mode}{lang_instruction}"
+                       f"{context_note(bundles, issue['number'])}"), workers, record)
+    failed = [number for number, _, status, _ in results if status != "success"]
+    if failed:
+        print(f"[investigate] {len(failed)} Issues failed: {', '.join(f'#{n}' for n in failed)} (re-run to retry)")
+    return 1 if failed or not scheduler.succeeded("plan") else 0
+
 
-    # Step 3-8: Agent handles planner → investigate → summarize
-    print("\nStep 3: Starting release-investigate agent...")
+def run_summarize_stage(version: str, lang: str | None) -> int:
+    """Summarize in a fresh worktree so the release reports merged by investigations are present."""
     lang_instruction = f" Output in language code '{lang}'." if lang else ""
-    pr_mode = " Use --no-pr mode." if no_pr else ""
-    prompt = f"Investigate OpenSearch v{version}.{pr_mode}{lang_instruction}"
-    return run_kiro("release-investigate", prompt, no_interactive=True)
+    with WorktreePool(SCRIPT_DIR, 1) as pool, pool.worktree() as worktree:
+        return run_kiro("summarize", f"Create release summary for OpenSearch v{version}.{lang_instruction}{cache_note()}",
+                        no_interactive=True, log_file=LOG_DIR / "summarize" / f"v{version}.log", cwd=worktree)
+
+
+def run_release_investigate(version: str, lang: str | None = None, no_pr: bool = False, workers: int = 1,
+                            restart_from: str | None = None, prefetch: bool = True) -> int:
+    """Full release investigation as a pipeline of checkpointed stages.
+    
+    fetch -> group -> plan -> investigate -> summarize. plan streams from group
+    (Issues are created for groups as they close) and investigate streams from
+    plan (Issues are investigated as they are created). Stage outcomes are
+    checkpointed in .cache/releases/v{version}/stages.json; a re-run resumes
+    from the first stage not done, or from `restart_from`.
+    """
+    print(f"=== Release Investigation: v{version} ===\n")
+    cache_dir = release_cache_dir(version)
+    
+    def group() -> int:
+        # A new grouping is pre-clustered so pending items are repository-sorted and groups can close mid-run
+        fresh = not (cache_dir / "groups.json").exists() and not read_groups_journal(cache_dir)
+        return run_group_release(version, process_all=True, preclustered=fresh, close_groups=True)
+    
+    def timed_stage(name: str, run, **kwargs) -> Stage:
+        def run_timed() -> int:
+            with metrics.timed("stage", name, version=version) as fields:
+                fields["exit_code"] = run()
+            return fields["exit_code"]
+        return Stage(name, run_timed, **kwargs)
+    
+    scheduler = StageScheduler([
+        timed_stage("fetch", lambda: run_fetch_release(version)),
+        timed_stage("group", group, deps=("fetch",)),
+        timed_stage("plan", lambda: run_plan_stage(version, scheduler), streams_from=("group",)),
+        timed_stage("investigate", lambda: run_investigate_stage(version, scheduler, workers, lang, no_pr, prefetch),
+                    streams_from=("plan",)),
+        timed_stage("summarize", lambda: run_summarize_stage(version, lang), deps=("investigate",)),
+    ], cache_dir / "stages.json")
+    if restart_from:
+        scheduler.reset(RELEASE_STAGES[RELEASE_STAGES.index(restart_from):])
+    
+    done = [name for name in scheduler.stages if scheduler.succeeded(name)]
+    if done:
+        print(f"Resuming; already done: {', '.join(done)}")
+    return scheduler.run()
 
 
 def run_feature_investigate(feature: str, pr: int | None = None, lang: str | None = None, no_pr: bool = False) -> int:
@@ -456,6 +1948,7 @@ def main():
         epilog="""
 Examples:
   python run.py fetch-release 3.0.0
+  python run.py fetch-release 2.16.0..3.6.0
   python run.py group-release 3.0.0 --all
   python run.py planner 3.0.0
   python run.py create-issues --tracking 123
@@ -473,17 +1966,48 @@ Examples:
     
     # fetch-release
     fr = subparsers.add_parser("fetch-release", help="Fetch release notes and save to raw-items.json")
-    fr.add_argument("version", help="Version to fetch (e.g., 3.0.0)")
+    fr.add_argument("version", nargs="+", help="Version(s) to fetch: 3.0.0, 3.0.0,3.1.0 or a range 2.16.0..3.6.0")
+    fr.add_argument("--jobs", type=int, default=FETCH_WORKERS, help=f"Max concurrent source downloads across all versions (default: {FETCH_WORKERS})")
+    fr.add_argument("--force", action="store_true", help="Ignore the fetch cache and re-download every source")
+    fr.add_argument("--format", choices=["json", "jsonl"], default="json", help="raw-items output format (default: json)")
     
     # group-release
     gr_rel = subparsers.add_parser("group-release", help="Group raw items into feature groups (runs in batches)")
     gr_rel.add_argument("version", help="Version to group (e.g., 3.0.0)")
-    gr_rel.add_argument("--batch-size", type=int, default=50, help="Items per batch (default: 50)")
+    gr_rel.add_argument("--token-budget", type=int, default=TOKEN_BUDGET, help=f"Estimated tokens per batch (default: {TOKEN_BUDGET})")
+    gr_rel.add_argument("--batch-size", type=int, help="Max items per batch (default: no limit)")
     gr_rel.add_argument("--all", action="store_true", help="Process all remaining batches")
+    gr_rel.add_argument("--workers", type=int, default=1, help="Run N grouping batches concurrently (default: 1)")
+    gr_rel.add_argument("--memo", action="store_true", help="Replay memoized batch results when inputs are unchanged")
+    group_mode = gr_rel.add_mutually_exclusive_group()
+    group_mode.add_argument("--incremental", action="store_true", help="Only group items added since the last completed grouping")
+    group_mode.add_argument("--precluster", action="store_true", help="Seed groups locally by prefix/similarity; agent handles the rest")
+    
+    # precluster
+    pc = subparsers.add_parser("precluster", help="Write candidate-groups.json from raw items (no LLM)")
+    pc.add_argument("version", help="Version to pre-cluster (e.g., 3.0.0)")
+    pc.add_argument("--token-budget", type=int, default=TOKEN_BUDGET, help=f"Token budget used for the agent batch estimate (default: {TOKEN_BUDGET})")
+    pc.add_argument("--batch-size", type=int, help="Max items per batch used for the estimate (default: no limit)")
+    
+    # compact-groups
+    cg = subparsers.add_parser("compact-groups", help="Fold groups.journal.jsonl into groups.json (no LLM)")
+    cg.add_argument("version", help="Version to compact (e.g., 3.0.0)")
+    
+    # stats
+    st = subparsers.add_parser("stats", help="Latency percentiles and throughput from .cache/metrics.jsonl (no LLM)")
+    st.add_argument("--since", type=float, metavar="HOURS", help="Only calls in the last N hours")
+    st.add_argument("--kind", choices=["agent", "github", "call", "stage"], help="Only this kind of call")
+    
+    # memo
+    mm = subparsers.add_parser("memo", help="List or invalidate memoized agent runs (no LLM)")
+    mm.add_argument("action", choices=["list", "clear"])
+    mm.add_argument("--agent", help="Only entries of this agent mode (e.g., summarize)")
+    mm.add_argument("--path", help="Only entries reading or writing this path (e.g., docs/releases/v3.0.0)")
     
     # review-groups
     rg = subparsers.add_parser("review-groups", help="Review and refine groups.json")
     rg.add_argument("version", help="Version to review (e.g., 3.0.0)")
+    rg.add_argument("--memo", action="store_true", help="Replay a memoized result when groups.json is unchanged")
     
     # planner
     pl = subparsers.add_parser("planner", help="Create tracking Issue from groups.json")
@@ -513,17 +2037,28 @@ Examples:
     ba.add_argument("--all", action="store_true", help="Process all open issues")
     ba.add_argument("--lang", help="Output language code (e.g., ja)")
     ba.add_argument("--no-pr", action="store_true", help="Push directly to main instead of creating PR")
+    ba.add_argument("--workers", type=int, default=1, help="Investigate N issues concurrently (default: 1)")
+    ba.add_argument("--no-prefetch", action="store_true", help="Let agents fetch PR/Issue context themselves")
+    ba.add_argument("--refresh", action="store_true", help="Re-sync the work queue with open GitHub Issues "
+                    "(and requeue failed ones) even if it has pending Issues")
+    
+    # prefetch
+    pf = subparsers.add_parser("prefetch", help="Fetch PR/Issue context of open investigation Issues in bulk (no LLM)")
+    pf.add_argument("version", nargs="?", help="Only Issues of this version (e.g., 3.0.0)")
+    pf.add_argument("--issue", type=int, action="append", help="Issue number (repeatable; default: open status/todo Issues)")
     
     # summarize
     su = subparsers.add_parser("summarize", help="Create release summary from feature reports")
     su.add_argument("version", help="Version to summarize (e.g., 3.0.0)")
     su.add_argument("--lang", help="Output language code (e.g., ja)")
+    su.add_argument("--memo", action="store_true", help="Replay a memoized result when release reports are unchanged")
     
     # translate
     tr = subparsers.add_parser("translate", help="Translate existing reports")
     tr.add_argument("--feature", help="Feature name to translate")
     tr.add_argument("--release", help="Release version to translate")
     tr.add_argument("--to", required=True, help="Target language code (e.g., ja)")
+    tr.add_argument("--memo", action="store_true", help="Replay a memoized result when the source is unchanged")
     
     # generate-release-docs
     gr = subparsers.add_parser("generate-release-docs", help="Generate release docs from existing feature documents")
@@ -538,12 +2073,23 @@ Examples:
     # batch-refactor
     brf = subparsers.add_parser("batch-refactor", help="Process all refactor-labeled Issues")
     brf.add_argument("--all", action="store_true", help="Process all open refactor Issues")
+    brf.add_argument("--refresh", action="store_true", help="Re-sync the work queue with open GitHub Issues "
+                     "(and requeue failed ones) even if it has pending Issues")
+    
+    # queue
+    qu = subparsers.add_parser("queue", help="Inspect or reset the local work queue of batch runs (no LLM)")
+    qu.add_argument("action", choices=["status", "retry", "clear"],
+                    help="status: counts and leases; retry: requeue failed/timed-out/exhausted Issues; clear: drop the queue")
+    qu.add_argument("--queue", help="Queue name (e.g., investigate:v3.0.0, refactor); status defaults to all")
     
     # release-investigate (orchestrator)
     ri = subparsers.add_parser("release-investigate", help="Full release investigation (fetch → group → plan → investigate → summarize)")
     ri.add_argument("version", help="Version to investigate (e.g., 3.0.0)")
     ri.add_argument("--lang", help="Output language code (e.g., ja)")
     ri.add_argument("--no-pr", action="store_true", help="Push directly to main instead of creating PR")
+    ri.add_argument("--workers", type=int, default=1, help="Investigate N issues concurrently (default: 1)")
+    ri.add_argument("--restart-from", choices=RELEASE_STAGES, help="Re-run this stage and all later ones")
+    ri.add_argument("--no-prefetch", action="store_true", help="Let agents fetch PR/Issue context themselves")
     
     # feature-investigate (deprecated wrapper)
     fi = subparsers.add_parser("feature-investigate", help="[DEPRECATED] Use 'investigate --feature' instead")
@@ -556,22 +2102,39 @@ Examples:
     subparsers.add_parser("dev", help="Development mode - interactive tool development")
     
     args = parser.parse_args()
+    # Agents run in their own sessions, so Ctrl-C must be forwarded to them explicitly
+    install_interrupt_handler()
     
     if args.mode == "dev":
         run_kiro("dev", "", no_interactive=False)
     elif args.mode == "release-investigate":
-        sys.exit(run_release_investigate(args.version, getattr(args, "lang", None), getattr(args, "no_pr", False)))
+        sys.exit(run_release_investigate(args.version, getattr(args, "lang", None), getattr(args, "no_pr", False),
+                                         args.workers, args.restart_from, not args.no_prefetch))
     elif args.mode == "feature-investigate":
         sys.exit(run_feature_investigate(args.feature, getattr(args, "pr", None), getattr(args, "lang", None), getattr(args, "no_pr", False)))
     elif args.mode == "batch-investigate":
         count = None if getattr(args, "all", False) else (args.count or 5)
-        run_batch(count, getattr(args, "lang", None), getattr(args, "no_pr", False), getattr(args, "version", None))
+        run_batch(count, getattr(args, "lang", None), getattr(args, "no_pr", False), getattr(args, "version", None),
+                  args.workers, not args.no_prefetch, args.refresh)
     elif args.mode == "batch-refactor":
-        run_batch_refactor()
+        run_batch_refactor(args.refresh)
     elif args.mode == "fetch-release":
-        run_fetch_release(args.version)
+        sys.exit(run_fetch_releases(expand_versions(args.version), args.jobs, args.force, args.format))
     elif args.mode == "group-release":
-        run_group_release(args.version, args.batch_size, getattr(args, "all", False))
+        sys.exit(run_group_release(args.version, args.token_budget, getattr(args, "all", False), args.incremental,
+                                   args.precluster, args.workers, args.batch_size, args.memo))
+    elif args.mode == "precluster":
+        sys.exit(run_precluster(args.version, args.token_budget, args.batch_size))
+    elif args.mode == "compact-groups":
+        sys.exit(run_compact_groups(args.version))
+    elif args.mode == "prefetch":
+        sys.exit(run_prefetch(args.version, args.issue))
+    elif args.mode == "queue":
+        sys.exit(run_queue(args.action, args.queue))
+    elif args.mode == "stats":
+        sys.exit(run_stats(args.since, args.kind))
+    elif args.mode == "memo":
+        sys.exit(run_memo(args.action, args.agent, args.path))
     else:
         prompt = build_prompt(args.mode, args)
         # These modes run non-interactively by default, except investigate without args (Mode 4)
@@ -582,7 +2145,8 @@ Examples:
         if args.mode == "refactor":
             # File mode (no --issue) is interactive
             no_interactive = bool(getattr(args, "issue", None))
-        run_kiro(args.mode, prompt, no_interactive=no_interactive)
+        memo_io = memo_paths(args.mode, args) if getattr(args, "memo", False) else None
+        run_kiro(args.mode, prompt, no_interactive=no_interactive, memo_io=memo_io)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,12 @@
 import json
 import os
 import re
-import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from github_client import GitHubError, get_client  # noqa: E402
+
 CACHE_DIR = Path(".cache/prs")
 DOCS_DIR = Path("docs")
 
@@ -25,11 +28,7 @@ def get_pr_related_issue(owner: str, repo: str, pr_number: int) -> int | None:
             return data.get("related_issue")
     
     try:
-        result = subprocess.run(
-            ["gh", "api", f"/repos/{owner}/{repo}/pulls/{pr_number}"],
-            capture_output=True, text=True, check=True
-        )
-        data = json.loads(result.stdout)
+        data = get_client().get(f"repos/{owner}/{repo}/pulls/{pr_number}")
         
         if data.get("merged"):
             body = data.get("body") or ""
@@ -45,7 +44,7 @@ def get_pr_related_issue(owner: str, repo: str, pr_number: int) -> int | None:
                 json.dump({"number": pr_number, "owner": owner, "repo": repo, 
                           "merged": True, "related_issue": related_issue}, f, indent=2)
             return related_issue
-    except subprocess.CalledProcessError:
+    except (GitHubError, OSError):
         pass
     return None
 
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark run.parse_release_notes against the original per-line regex parser.
+
+Generates synthetic release notes (10k-200k lines by default), checks that both
+parsers produce identical items, and prints timings.
+
+Usage:
+    python scripts/bench_release_parser.py
+    python scripts/bench_release_parser.py --lines 10000 50000 --repeat 5
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from run import parse_release_notes  # noqa: E402
+
+
+def legacy_parse_release_notes(content: str, repo: str) -> list[dict]:
+    """Original parse_release_notes implementation, kept as the reference."""
+    items = []
+    current_category = None
+    current_component = None
+
+    category_map = {
+        "breaking": "breaking",
+        "feature": "feature",
+        "enhancement": "enhancement",
+        "bug fix": "bugfix",
+        "bugfix": "bugfix",
+        "deprecat": "deprecation",
+        "added": "feature",
+    }
+
+    repo_lower = repo.lower()
+    if repo_lower in ("opensearch", "opensearch-build"):
+        default_repo = "opensearch"
+    elif repo_lower == "opensearch-dashboards":
+        default_repo = "opensearch-dashboards"
+    else:
+        default_repo = repo_lower
+
+    lines = content.split("\n")
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith("#"):
+            header = line.lstrip("#").strip().lower()
+            for key, cat in category_map.items():
+                if key in header:
+                    current_category = cat
+                    break
+            if "opensearch" in header and current_category:
+                match = re.search(r"opensearch[- ](\w+)", header, re.IGNORECASE)
+                if match:
+                    current_component = match.group(1).lower()
+                    if current_component in ("core", "build"):
+                        current_component = None
+
+        if line.startswith(("-", "*")) and current_category:
+            pr_match = re.search(r"#(\d+)", line) or re.search(r"\[#?(\d+)\]", line)
+            if not pr_match:
+                continue
+
+            pr_num = int(pr_match.group(1))
+
+            name = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", line)
+            name = re.sub(r"\(#\d+\)", "", name)
+            name = re.sub(r"#\d+", "", name)
+            name = re.sub(r"^\s*[-*]\s*", "", name)
+            name = re.sub(r"\s+", " ", name).strip()
+
+            if not name or len(name) < 5:
+                continue
+
+            item_repo = default_repo
+            if current_component:
+                item_repo = current_component
+            plugin_match = re.search(r"\b(k-nn|knn|neural-search|ml-commons|sql|security|alerting|anomaly-detection|index-management|observability|reporting|notifications|geospatial|cross-cluster-replication|asynchronous-search)\b", line.lower())
+            if plugin_match:
+                item_repo = plugin_match.group(1).replace("knn", "k-nn")
+
+            items.append({
+                "name": name[:200],
+                "category": current_category,
+                "repository": item_repo,
+                "pr": pr_num,
+                "description": name[:300],
+            })
+
+    return items
+
+
+HEADERS = [
+    "## Breaking Changes", "### Features", "### Enhancements", "### Bug Fixes", "### Bugfixes",
+    "### Deprecations", "### Added", "### Changed", "## [Unreleased 3.x]", "## Infrastructure",
+    "### Opensearch k-NN", "### OpenSearch Security", "### OpenSearch Core", "### Opensearch Build",
+    "### Opensearch Neural Search", "#### OpenSearch-Dashboards Reporting",
+]
+WORDS = [
+    "Add", "Fix", "Support", "Remove", "Upgrade", "index", "query", "cluster", "segment", "replication",
+    "k-NN", "knn", "security", "SQL", "ml-commons", "star-tree", "aggregation", "setting", "NPE",
+    "remote", "store", "[Lucene On Faiss]", "`code`", "dashboards", "geospatial", "alerting",
+]
+
+
+def synthetic_release_notes(lines: int, seed: int = 42) -> str:
+    """Generate release notes that exercise every parser branch."""
+    rng = random.Random(seed)
+    out = []
+    while len(out) < lines:
+        roll = rng.random()
+        if roll < 0.03:
+            out.append(rng.choice(HEADERS))
+        elif roll < 0.06:
+            out.append("")
+        elif roll < 0.08:
+            out.append(" ".join(rng.choices(WORDS, k=rng.randint(3, 12))))
+        else:
+            marker = rng.choice(["-", "*", "  -", "- "])
+            text = " ".join(rng.choices(WORDS, k=rng.randint(1, 14)))
+            pr = rng.randint(1, 20000)
+            ref = rng.choice([
+                f"([#{pr}](https://github.com/opensearch-project/OpenSearch/pull/{pr}))",
+                f"(#{pr})",
+                f"[{pr}]",
+                f"#{pr} #{pr + 1}",
+                f"[#{pr}](https://github.com/opensearch-project/k-NN/pull/{pr})",
+                "",
+            ])
+            out.append(f"{marker} {text} {ref}")
+    return "\n".join(out[:lines])
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the release-notes parser")
+    parser.add_argument("--lines", type=int, nargs="+", default=[10_000, 50_000, 100_000, 200_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; best time is reported")
+    args = parser.parse_args()
+
+    print(f"{'Lines':>8} {'Items':>8} {'Legacy (s)':>11} {'Current (s)':>12} {'Speedup':>8}")
+    for n in args.lines:
+        content = synthetic_release_notes(n)
+        for repo in ("opensearch-build", "OpenSearch-Dashboards"):
+            expected = legacy_parse_release_notes(content, repo)
+            actual = parse_release_notes(content, repo)
+            if actual != expected:
+                print(f"MISMATCH at {n} lines ({repo}): {len(actual)} vs {len(expected)} items")
+                return 1
+        legacy = best_of(lambda: legacy_parse_release_notes(content, "opensearch-build"), args.repeat)
+        current = best_of(lambda: parse_release_notes(content, "opensearch-build"), args.repeat)
+        print(f"{n:>8} {len(expected):>8} {legacy:>11.3f} {current:>12.3f} {legacy / current:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
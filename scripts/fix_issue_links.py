@@ -24,10 +24,12 @@ Usage:
     python scripts/fix_issue_links.py --issue 140 --apply --comments
 """
 import argparse
-import json
 import re
-import subprocess
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from github_client import GitHubError, current_repo, get_client  # noqa: E402
 
 # Short name -> GitHub repo name mapping
 REPO_MAP = {
@@ -67,21 +69,18 @@ REPO_MAP = {
 OWNER = "opensearch-project"
 
 
-def gh(*args):
-    result = subprocess.run(["gh"] + list(args), capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  gh error: {result.stderr.strip()}", file=sys.stderr)
+def gh(method, path, **kwargs):
+    """Call the GitHub API. Returns decoded JSON or None on error."""
+    try:
+        return get_client().request(method, path, **kwargs)
+    except (GitHubError, OSError) as e:
+        print(f"  gh error: {e}", file=sys.stderr)
         return None
-    return result.stdout.strip()
 
 
 def get_repo_info():
     """Get owner/repo for this repository."""
-    out = gh("repo", "view", "--json", "owner,name")
-    if not out:
-        return "tkykenmt", "opensearch-feature-explorer"
-    data = json.loads(out)
-    return data["owner"]["login"], data["name"]
+    return current_repo()
 
 
 def github_url(repo_short, pr_num):
@@ -147,27 +146,26 @@ def fix_body(body, issue_number=None):
 
 def get_all_issues(owner, repo):
     """Get all issues (not PRs) with their numbers."""
-    out = gh("issue", "list", "-R", f"{owner}/{repo}",
-             "--state", "all", "--limit", "5000",
-             "--json", "number,title,state")
-    if not out:
+    try:
+        items = get_client().paginate(f"repos/{owner}/{repo}/issues", {"state": "all"}, limit=5000,
+                                      keep=lambda i: "pull_request" not in i)
+    except (GitHubError, OSError) as e:
+        print(f"  gh error: {e}", file=sys.stderr)
         return []
-    return json.loads(out)
+    return [{"number": i["number"], "title": i["title"], "state": i["state"].upper()} for i in items]
 
 
 def process_issue(owner, repo, number, apply=False, fix_comments=False):
     """Process a single issue."""
-    out = gh("issue", "view", str(number), "-R", f"{owner}/{repo}",
-             "--json", "number,title,body,state,comments")
-    if not out:
+    data = gh("GET", f"repos/{owner}/{repo}/issues/{number}")
+    if not data:
         return False
 
-    data = json.loads(out)
-    body = data["body"]
+    body = data["body"] or ""
     title = data["title"]
 
     print(f"\n{'='*60}")
-    print(f"Issue #{number}: {title} ({data['state']})")
+    print(f"Issue #{number}: {title} ({data['state'].upper()})")
     print(f"{'='*60}")
 
     new_body, changes = fix_body(body, number)
@@ -179,28 +177,27 @@ def process_issue(owner, repo, number, apply=False, fix_comments=False):
         for c in changes:
             print(f"    {c}")
         if apply:
-            gh("issue", "edit", str(number), "-R", f"{owner}/{repo}",
-               "--body", new_body)
+            gh("PATCH", f"repos/{owner}/{repo}/issues/{number}", body={"body": new_body})
             print("  ✅ Body updated.")
 
     # Fix comments
     if fix_comments and data.get("comments"):
-        for i, comment in enumerate(data["comments"]):
-            cbody = comment.get("body", "")
+        try:
+            comments = get_client().paginate(f"repos/{owner}/{repo}/issues/{number}/comments")
+        except (GitHubError, OSError) as e:
+            print(f"  gh error: {e}", file=sys.stderr)
+            comments = []
+        for i, comment in enumerate(comments):
+            cbody = comment.get("body") or ""
             new_cbody, cchanges = fix_body(cbody)
             if cchanges:
                 print(f"  Comment #{i} changes ({len(cchanges)}):")
                 for c in cchanges:
                     print(f"    {c}")
                 if apply:
-                    comment_url = comment.get("url", "")
-                    if comment_url:
-                        cid_match = re.search(r'issuecomment-(\d+)', comment_url)
-                        if cid_match:
-                            cid = cid_match.group(1)
-                            gh("api", f"repos/{owner}/{repo}/issues/comments/{cid}",
-                               "-X", "PATCH", "-f", f"body={new_cbody}")
-                            print(f"  ✅ Comment #{i} updated.")
+                    gh("PATCH", f"repos/{owner}/{repo}/issues/comments/{comment['id']}",
+                       body={"body": new_cbody})
+                    print(f"  ✅ Comment #{i} updated.")
 
     return bool(changes)
 
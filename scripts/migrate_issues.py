@@ -21,19 +21,32 @@ Usage:
 """
 import argparse
 import json
-import subprocess
 import sys
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from github_client import GitHubError, get_client  # noqa: E402
 
 MIGRATION_FILE = "scripts/migration.json"
 
 
-def gh(*args):
-    result = subprocess.run(["gh"] + list(args), capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"    gh error: {result.stderr.strip()}", file=sys.stderr)
+def gh(method, path, **kwargs):
+    """Call the GitHub API. Returns decoded JSON or None on error."""
+    try:
+        return get_client().request(method, path, **kwargs)
+    except (GitHubError, OSError) as e:
+        print(f"    gh error: {e}", file=sys.stderr)
+        return None
+
+
+def graphql(query, variables=None):
+    """Run a GraphQL query. Returns data or None on error."""
+    try:
+        return get_client().graphql(query, variables)
+    except (GitHubError, OSError) as e:
+        print(f"    gh error: {e}", file=sys.stderr)
         return None
-    return result.stdout.strip()
 
 
 def load_migration():
@@ -47,54 +60,50 @@ def save_migration(data):
 
 
 def get_node_id(owner, repo, number):
-    out = gh("api", f"repos/{owner}/{repo}/issues/{number}", "--jq", ".node_id")
-    return out
+    data = gh("GET", f"repos/{owner}/{repo}/issues/{number}")
+    return data["node_id"] if data else None
 
 
 def create_issue(owner, repo, title, body, labels):
     """Create issue and return new number. Handles secondary rate limits."""
-    label_args = []
-    for label in labels:
-        label_args.extend(["--label", label])
-
     for attempt in range(5):
-        result = subprocess.run(
-            ["gh", "api", f"repos/{owner}/{repo}/issues",
-             "-f", f"title={title}", "-f", f"body={body}"]
-            + [item for label in labels for item in ("-f", f"labels[]={label}")],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
+        try:
+            data = get_client().post(f"repos/{owner}/{repo}/issues",
+                                     {"title": title, "body": body, "labels": labels})
             return data["number"]
-        if "secondary rate limit" in result.stderr.lower() or "HTTP 403" in result.stderr:
-            wait = 60 * (attempt + 1)
-            print(f"    Secondary rate limit hit. Waiting {wait}s (attempt {attempt+1}/5)...")
-            time.sleep(wait)
-        else:
-            print(f"    gh error: {result.stderr.strip()}", file=sys.stderr)
+        except OSError as e:
+            print(f"    gh error: {e}", file=sys.stderr)
             return None
+        except GitHubError as e:
+            if e.status in (403, 429):
+                wait = 60 * (attempt + 1)
+                print(f"    Secondary rate limit hit. Waiting {wait}s (attempt {attempt+1}/5)...")
+                time.sleep(wait)
+            else:
+                print(f"    gh error: {e}", file=sys.stderr)
+                return None
     return None
 
 
 def add_comment(owner, repo, number, body):
     for attempt in range(3):
-        result = subprocess.run(
-            ["gh", "issue", "comment", str(number), "-R", f"{owner}/{repo}", "--body", body],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0:
+        try:
+            get_client().post(f"repos/{owner}/{repo}/issues/{number}/comments", {"body": body})
             return
-        if "secondary rate limit" in result.stderr.lower() or "submitted too quickly" in result.stderr.lower():
-            wait = 30 * (attempt + 1)
-            print(f"    Comment rate limited. Waiting {wait}s...")
-            time.sleep(wait)
-        else:
-            break
+        except OSError as e:
+            print(f"    gh error: {e}", file=sys.stderr)
+            return
+        except GitHubError as e:
+            if e.rate_limited or "submitted too quickly" in e.message.lower():
+                wait = 30 * (attempt + 1)
+                print(f"    Comment rate limited. Waiting {wait}s...")
+                time.sleep(wait)
+            else:
+                break
 
 
 def close_issue(owner, repo, number):
-    gh("issue", "close", str(number), "-R", f"{owner}/{repo}")
+    gh("PATCH", f"repos/{owner}/{repo}/issues/{number}", body={"state": "closed"})
 
 
 def delete_issue(owner, repo, number):
@@ -102,7 +111,8 @@ def delete_issue(owner, repo, number):
     if not node_id:
         print(f"    Could not get node_id for #{number}")
         return False
-    out = gh("api", "graphql", "-f", f"query=mutation {{ deleteIssue(input: {{issueId: \"{node_id}\"}}) {{ clientMutationId }} }}")
+    out = graphql("mutation($id: ID!) { deleteIssue(input: {issueId: $id}) { clientMutationId } }",
+                  {"id": node_id})
     return out is not None
 
 
@@ -129,16 +139,16 @@ def add_to_project(owner, repo, new_number, version):
     """Add new issue to the corresponding GitHub Project."""
     # Find project by version
     project_title = f"{version} Investigation"
-    out = gh("api", "graphql", "-f", f"""query={{
-  user(login: "{owner}") {{
-    projectsV2(first: 50) {{
-      nodes {{ id title }}
-    }}
-  }}
-}}""")
+    out = graphql("""query($login: String!) {
+  user(login: $login) {
+    projectsV2(first: 50) {
+      nodes { id title }
+    }
+  }
+}""", {"login": owner})
     if not out:
         return
-    projects = json.loads(out)["data"]["user"]["projectsV2"]["nodes"]
+    projects = out["user"]["projectsV2"]["nodes"]
     project_id = None
     for p in projects:
         if p["title"] == project_title:
@@ -152,8 +162,8 @@ def add_to_project(owner, repo, new_number, version):
     if not node_id:
         return
 
-    gh("api", "graphql", "-f",
-       f'query=mutation {{ addProjectV2ItemById(input: {{projectId: "{project_id}", contentId: "{node_id}"}}) {{ item {{ id }} }} }}')
+    graphql("mutation($project: ID!, $content: ID!) { addProjectV2ItemById(input: {projectId: $project, contentId: $content}) { item { id } } }",
+            {"project": project_id, "content": node_id})
 
 
 def migrate_one(entry, owner, repo, groups_files, dry_run=False):
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""On-disk cache of docs search results, shared across processes.
+
+Used by mcp_server.py and .kiro/skills/opensearch-docs-search/scripts/search.py
+so that the same search repeated by hundreds of agent runs hits local storage
+after the first call. Entries live in a SQLite database in WAL mode, so
+concurrent readers and a writer from several processes do not block each
+other.
+
+Freshness is stale-while-revalidate: an entry younger than `ttl` is served
+as is; one within the following `stale_ttl` is served immediately while a
+background thread refreshes it (one process at a time per key); older
+entries are fetched synchronously, falling back to the old value if the
+fetch fails. The database is trimmed to `max_bytes` by evicting the least
+recently used entries.
+
+The database is .cache/search-cache.db in the primary checkout, also when
+this module runs from a linked worktree (whose .cache is discarded with it);
+set OSFE_SEARCH_CACHE to another path, or to 0 to disable caching.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+CACHE_NAME = Path(".cache") / "search-cache.db"
+TTL = 24 * 3600
+STALE_TTL = 7 * 24 * 3600
+MAX_BYTES = 64 * 1024 * 1024
+# A key being revalidated is not revalidated again by another process for this long
+REVALIDATE_LOCK_SECONDS = 60
+# accessed_at is rewritten at most this often per entry
+TOUCH_INTERVAL = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    revalidating_until REAL NOT NULL DEFAULT 0
+)
+"""
+
+
+def search_key(query: str, version: str, types: str) -> str:
+    """Normalize case, whitespace and type order so equivalent searches share an entry."""
+    normalized_types = ",".join(sorted({t.strip().lower() for t in types.split(",") if t.strip()}))
+    return json.dumps([" ".join(query.lower().split()), version.strip(), normalized_types])
+
+
+def default_path() -> Path:
+    """CACHE_NAME under the primary checkout (the parent of git's common dir), else next to this module."""
+    here = Path(__file__).resolve().parent
+    try:
+        result = subprocess.run(["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
+                                cwd=here, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return here / CACHE_NAME
+    common_dir = Path(result.stdout.strip())
+    if result.returncode != 0 or common_dir.name != ".git":
+        return here / CACHE_NAME
+    return common_dir.parent / CACHE_NAME
+
+
+class DiskCache:
+    def __init__(self, path: Path | None = None, ttl: float = TTL, stale_ttl: float = STALE_TTL,
+                 max_bytes: int = MAX_BYTES):
+        path = path or default_path()
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._threads = []
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps it safe across threads
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    # -- storage -----------------------------------------------------------
+
+    def _load(self, key: str) -> tuple[object, float] | None:
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT value, fetched_at, accessed_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[2] > TOUCH_INTERVAL:
+                db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0]), row[1]
+
+    def _store(self, key: str, value):
+        data = json.dumps(value)
+        now = time.time()
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO entries (key, value, size, fetched_at, accessed_at, revalidating_until) "
+                       "VALUES (?, ?, ?, ?, ?, 0)", (key, data, len(data), now, now))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(db, total)
+
+    def _evict(self, db: sqlite3.Connection, total: int):
+        """Drop least recently used entries until the cache is at 90% of max_bytes."""
+        target = self.max_bytes * 0.9
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def _claim_revalidation(self, key: str) -> bool:
+        now = time.time()
+        with self._connect() as db:
+            return db.execute("UPDATE entries SET revalidating_until = ? WHERE key = ? AND revalidating_until < ?",
+                              (now + REVALIDATE_LOCK_SECONDS, key, now)).rowcount == 1
+
+    # -- lookup ------------------------------------------------------------
+
+    def get_or_fetch(self, key: str, fetch):
+        """Cached value of `key`, calling `fetch()` when missing or expired (see module docstring)."""
+        try:
+            cached = self._load(key)
+        except sqlite3.Error as e:
+            print(f"search cache unavailable: {e}", file=sys.stderr)
+            return fetch()
+        age = time.time() - cached[1] if cached else None
+        if cached and age < self.ttl:
+            with self._lock:
+                self.hits += 1
+            return cached[0]
+        if cached and age < self.ttl + self.stale_ttl:
+            with self._lock:
+                self.stale_hits += 1
+            if self._claim_revalidation(key):
+                thread = threading.Thread(target=self._revalidate, args=(key, fetch), daemon=True)
+                thread.start()
+                with self._lock:
+                    self._threads.append(thread)
+            return cached[0]
+        with self._lock:
+            self.misses += 1
+        try:
+            value = fetch()
+        except Exception:
+            if cached:
+                return cached[0]
+            raise
+        try:
+            self._store(key, value)
+        except sqlite3.Error as e:
+            print(f"search cache: storing {key} failed: {e}", file=sys.stderr)
+        return value
+
+    def _revalidate(self, key: str, fetch):
+        try:
+            self._store(key, fetch())
+        except Exception as e:
+            print(f"search cache: revalidating {key} failed: {e}", file=sys.stderr)
+
+    def wait(self, timeout: float | None = None):
+        """Wait for background revalidations (before a short-lived process exits)."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
+
+
+def open_cache() -> DiskCache | None:
+    """The shared cache at OSFE_SEARCH_CACHE or default_path(); None if disabled or unusable."""
+    setting = os.environ.get("OSFE_SEARCH_CACHE")
+    if setting == "0":
+        return None
+    try:
+        return DiskCache(Path(setting) if setting else None)
+    except (OSError, sqlite3.Error) as e:
+        print(f"search cache unavailable: {e}", file=sys.stderr)
+        return None
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Minimal DAG scheduler for multi-stage pipelines with checkpoints.
+
+A stage starts once every stage in `deps` is done and every stage in
+`streams_from` has at least started. Streaming stages consume their
+upstream's output while it is still running and poll `finished()` /
+`succeeded()` to know when no more input will arrive.
+
+Stage outcomes are checkpointed to a JSON file; a re-run skips stages already
+recorded as done and retries the rest.
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class Stage:
+    def __init__(self, name: str, run: Callable[[], int], deps: tuple[str, ...] = (),
+                 streams_from: tuple[str, ...] = ()):
+        self.name = name
+        self.run = run
+        self.deps = deps
+        self.streams_from = streams_from
+
+
+class StageScheduler:
+    """Run stages concurrently in dependency order, checkpointing each outcome."""
+
+    def __init__(self, stages: list[Stage], checkpoint_file: Path):
+        self.stages = {stage.name: stage for stage in stages}
+        self.checkpoint_file = checkpoint_file
+        self._status = {}
+        self._cond = threading.Condition()
+        if checkpoint_file.exists():
+            with open(checkpoint_file) as f:
+                checkpoints = json.load(f)
+            self._status = {name: "done" for name, cp in checkpoints.items()
+                            if name in self.stages and cp.get("status") == "done"}
+
+    # -- state -------------------------------------------------------------
+
+    def status(self, name: str) -> str | None:
+        """None (pending), "running", "done", "failed" or "skipped" (upstream failed)."""
+        with self._cond:
+            return self._status.get(name)
+
+    def finished(self, name: str) -> bool:
+        return self.status(name) in ("done", "failed")
+
+    def succeeded(self, name: str) -> bool:
+        return self.status(name) == "done"
+
+    def reset(self, names: list[str]):
+        """Forget checkpoints so these stages run again."""
+        with self._cond:
+            for name in names:
+                self._status.pop(name, None)
+            self._save()
+
+    def _save(self):
+        checkpoints = {}
+        if self.checkpoint_file.exists():
+            with open(self.checkpoint_file) as f:
+                checkpoints = json.load(f)
+        for name in self.stages:
+            status = self._status.get(name)
+            if status in ("done", "failed"):
+                if checkpoints.get(name, {}).get("status") != status:
+                    checkpoints[name] = {"status": status, "finished_at": datetime.now(timezone.utc).isoformat()}
+            else:
+                checkpoints.pop(name, None)
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.checkpoint_file.with_name(self.checkpoint_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(checkpoints, f, indent=2)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    # -- execution ---------------------------------------------------------
+
+    def _ready(self, stage: Stage) -> bool:
+        return (all(self._status.get(dep) == "done" for dep in stage.deps)
+                and all(self._status.get(dep) in ("running", "done") for dep in stage.streams_from))
+
+    def _blocked(self, stage: Stage) -> bool:
+        return any(self._status.get(dep) in ("failed", "skipped") for dep in stage.deps + stage.streams_from)
+
+    def _run_stage(self, stage: Stage):
+        try:
+            result = stage.run()
+        except Exception as e:
+            print(f"[{stage.name}] failed: {e}")
+            result = 1
+        with self._cond:
+            self._status[stage.name] = "done" if result == 0 else "failed"
+            self._save()
+            print(f"[{stage.name}] {'done' if result == 0 else f'failed (exit {result})'}")
+            self._cond.notify_all()
+
+    def run(self) -> int:
+        """Run all pending stages. Returns 0 if every stage is done."""
+        threads = []
+        with self._cond:
+            while True:
+                launched = False
+                for stage in self.stages.values():
+                    if stage.name in self._status:
+                        continue
+                    if self._blocked(stage):
+                        self._status[stage.name] = "skipped"
+                        launched = True
+                        continue
+                    if self._ready(stage):
+                        self._status[stage.name] = "running"
+                        print(f"[{stage.name}] started")
+                        thread = threading.Thread(target=self._run_stage, args=(stage,), name=stage.name)
+                        thread.start()
+                        threads.append(thread)
+                        launched = True
+                if launched:
+                    self._cond.notify_all()
+                    continue
+                if all(status in ("done", "failed", "skipped") for status in
+                       (self._status.get(name) for name in self.stages)):
+                    break
+                self._cond.wait()
+        for thread in threads:
+            thread.join()
+        skipped = [name for name, status in self._status.items() if status == "skipped"]
+        if skipped:
+            print(f"Skipped (upstream failed): {', '.join(skipped)}")
+        return 0 if all(self._status.get(name) == "done" for name in self.stages) else 1
@@ -0,0 +1,25 @@
+import io
+import sys
+
+import agent_watchdog
+
+
+def test_idle_process_group_is_killed():
+    output = io.BytesIO()
+    cmd = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(30)"]
+
+    result = agent_watchdog.run_watched(cmd, output, idle_timeout=0.5, poll_interval=0.1)
+
+    assert result.timed_out == "idle"
+    assert result.returncode != 0
+    assert result.tail.strip() == "started"
+
+
+def test_finished_process_keeps_its_exit_code():
+    output = io.BytesIO()
+    cmd = [sys.executable, "-c", "import sys; print('done'); sys.exit(3)"]
+
+    result = agent_watchdog.run_watched(cmd, output, wall_timeout=30, idle_timeout=30, poll_interval=0.1)
+
+    assert (result.returncode, result.timed_out) == (3, None)
+    assert output.getvalue().strip() == b"done"
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+import run
+
+MAX_BATCH = 3
+
+
+def items(count, offset=0):
+    return [{"repository": "opensearch", "pr": pr, "name": f"item {pr}", "category": "feature"}
+            for pr in range(offset + 1, offset + count + 1)]
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Paths for run_group_batch under a temporary SCRIPT_DIR, plus the list of batch sizes the agent saw."""
+    monkeypatch.setattr(run, "SCRIPT_DIR", tmp_path)
+    cache_dir = run.release_cache_dir("3.0.0")
+    cache_dir.mkdir(parents=True)
+    groups_file = cache_dir / "batch-groups.json"
+    run._save_groups(groups_file, {"version": "3.0.0", "sources": ["opensearch"], "groups": [], "processed_offset": 0})
+    return {"batch_file": cache_dir / "batch.json", "groups_file": groups_file, "calls": []}
+
+
+def fake_agent(workspace, drop_pr=None):
+    """run_kiro stand-in that fails on batches over MAX_BATCH items and otherwise groups items in pairs."""
+    def run_kiro(mode, prompt, **kwargs):
+        with open(workspace["batch_file"]) as f:
+            batch = json.load(f)["items"]
+        workspace["calls"].append(len(batch))
+        if len(batch) > MAX_BATCH:
+            return 1
+        grouped = [item for item in batch if item["pr"] != drop_pr]
+        groups = [{"name": f"Group {i // 2}", "items": grouped[i:i + 2], "repositories": ["opensearch"]}
+                  for i in range(0, len(grouped), 2)]
+        with open(workspace["groups_file"]) as f:
+            data = json.load(f)
+        run._save_groups(workspace["groups_file"], {**data, "groups": groups})
+        return 0
+    return run_kiro
+
+
+def run_batch(workspace, batch, offset=0):
+    return run.run_group_batch("3.0.0", batch, offset, offset + len(batch), workspace["batch_file"],
+                               workspace["groups_file"])
+
+
+def test_failed_batch_is_split_until_it_fits(workspace, monkeypatch):
+    monkeypatch.setattr(run, "run_kiro", fake_agent(workspace))
+    batch = items(10, offset=20)
+
+    assert run_batch(workspace, batch, offset=20) == 0
+
+    with open(workspace["groups_file"]) as f:
+        data = json.load(f)
+    assert data["processed_offset"] == 30
+    assert data["sources"] == ["opensearch"]
+    assert run.ungrouped_items(batch, data["groups"]) == []
+    assert workspace["calls"] == [10, 5, 2, 3, 5, 2, 3]
+
+
+def test_split_halves_keep_groups_of_the_same_name(workspace, monkeypatch):
+    monkeypatch.setattr(run, "run_kiro", fake_agent(workspace))
+    batch = items(4)
+
+    assert run_batch(workspace, batch) == 0
+
+    with open(workspace["groups_file"]) as f:
+        groups = json.load(f)["groups"]
+    # Both halves name their first pair "Group 0"; the merge keeps all four items
+    assert [g["name"] for g in groups] == ["Group 0"]
+    assert [i["pr"] for i in groups[0]["items"]] == [1, 2, 3, 4]
+
+
+def test_ungrouped_item_fails_the_batch(workspace, monkeypatch):
+    monkeypatch.setattr(run, "run_kiro", fake_agent(workspace, drop_pr=2))
+
+    assert run_batch(workspace, items(3)) == 1
+    # 3 items, then halves of 1 and 2; the second half splits again and stops at item 2
+    assert workspace["calls"] == [3, 1, 2, 1]
@@ -0,0 +1,53 @@
+import json
+
+import run
+
+META = {"version": "3.0.0", "sources": ["opensearch"], "total": 4}
+
+
+def group(name, *prs, repository="opensearch"):
+    return {"name": name, "items": [{"repository": repository, "pr": pr, "name": f"item {pr}"} for pr in prs],
+            "repositories": [repository]}
+
+
+def test_torn_trailing_record_is_truncated(tmp_path):
+    run.append_groups_journal(tmp_path, 0, 2, [group("Star Tree", 1, 2)])
+    journal = tmp_path / "groups.journal.jsonl"
+    valid_size = journal.stat().st_size
+    with open(journal, "a") as f:
+        f.write('{"offset": 2, "end": 4, "groups": [')
+
+    records = run.read_groups_journal(tmp_path)
+
+    assert [record["end"] for record in records] == [2]
+    assert journal.stat().st_size == valid_size
+    # The truncated journal accepts the retried batch
+    run.append_groups_journal(tmp_path, 2, 4, [group("Star Tree", 3), group("Remote Store", 4)])
+    assert [record["end"] for record in run.read_groups_journal(tmp_path)] == [2, 4]
+
+
+def test_replay_merges_records_in_order(tmp_path):
+    run.append_groups_journal(tmp_path, 0, 2, [group("Star Tree", 1, 2)])
+    run.append_groups_journal(tmp_path, 2, 4, [group("star-tree", 3), group("Remote Store", 4)])
+
+    groups_data = run.materialize_groups(tmp_path, META)
+
+    assert groups_data["processed_offset"] == 4
+    assert [g["name"] for g in groups_data["groups"]] == ["Star Tree", "Remote Store"]
+    assert [i["pr"] for i in groups_data["groups"][0]["items"]] == [1, 2, 3]
+
+
+def test_replay_skips_records_already_compacted(tmp_path):
+    # A crash between writing groups.json and removing the journal leaves both
+    run.append_groups_journal(tmp_path, 0, 2, [group("Star Tree", 1, 2)])
+    run.compact_groups(tmp_path, META)
+    run.append_groups_journal(tmp_path, 0, 2, [group("Star Tree", 1, 2)])
+    run.append_groups_journal(tmp_path, 2, 4, [group("Remote Store", 3, 4)])
+
+    groups_data = run.compact_groups(tmp_path, META)
+
+    assert not (tmp_path / "groups.journal.jsonl").exists()
+    with open(tmp_path / "groups.json") as f:
+        assert json.load(f) == groups_data
+    assert groups_data["processed_offset"] == 4
+    assert [len(g["items"]) for g in groups_data["groups"]] == [2, 2]
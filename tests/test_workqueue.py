@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from workqueue import WorkQueue
+
+ISSUES = [{"number": 1, "title": "[feature] Star Tree"}, {"number": 2, "title": "[bugfix] Remote Store"}]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.db", lease_seconds=1, max_attempts=2)
+    queue.sync("investigate", ISSUES[:1])
+    return queue
+
+
+def test_leased_issue_is_not_claimed_twice(queue):
+    assert queue.claim("investigate", "a")["number"] == 1
+    assert queue.claim("investigate", "b") is None
+
+
+def test_expired_lease_is_reclaimed(queue, monkeypatch):
+    claimed_at = time.time()
+    assert queue.claim("investigate", "a")["attempt"] == 1
+    monkeypatch.setattr(time, "time", lambda: claimed_at + 2)
+
+    issue = queue.claim("investigate", "b")
+
+    assert issue == {"number": 1, "title": ISSUES[0]["title"], "attempt": 2}
+    # The crashed owner's late result is not recorded over the new lease
+    assert not queue.finish("investigate", 1, "a", "success")
+    assert queue.finish("investigate", 1, "b", "success")
+
+
+def test_issue_is_abandoned_after_max_attempts(queue, monkeypatch):
+    now = time.time()
+    for attempt in range(2):
+        monkeypatch.setattr(time, "time", lambda: now + 2 * attempt)
+        assert queue.claim("investigate", "a") is not None
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+
+    assert queue.claim("investigate", "a") is None
+    assert queue.pending("investigate") == 0
+    assert queue.retry("investigate") == 1
+    assert queue.claim("investigate", "a")["attempt"] == 1
+
+
+def test_renewed_lease_does_not_expire(queue, monkeypatch):
+    claimed_at = time.time()
+    queue.claim("investigate", "a")
+    monkeypatch.setattr(time, "time", lambda: claimed_at + 0.9)
+    assert queue.renew("a") == 1
+    monkeypatch.setattr(time, "time", lambda: claimed_at + 1.5)
+
+    assert queue.claim("investigate", "b") is None
+
+
+def test_closed_issue_is_queued_again_when_reopened(queue):
+    assert queue.sync("investigate", []) == (0, 1)
+    assert queue.claim("investigate", "a") is None
+
+    assert queue.sync("investigate", ISSUES[:1]) == (1, 0)
+    assert queue.claim("investigate", "a")["attempt"] == 1
+
+
+def test_finished_issue_keeps_its_outcome(queue):
+    queue.finish("investigate", queue.claim("investigate", "a")["number"], "a", "success")
+
+    assert queue.sync("investigate", ISSUES) == (1, 0)
+
+    outcomes = {item["issue"]: item["outcome"] for item in queue.items("investigate")}
+    assert outcomes == {1: "success", 2: None}
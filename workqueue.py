@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Persistent work queue of Issues with leases, backed by SQLite.
+
+Workers (threads, processes, or machines sharing the checkout) claim one
+Issue at a time. A claim takes a lease that the claiming process renews
+while the agent runs (see `heartbeat`); the lease of a crashed worker
+expires and the Issue becomes claimable again, up to MAX_ATTEMPTS claims.
+Finished Issues keep their outcome, so a restarted batch resumes from the
+queue without re-listing Issues on GitHub.
+
+Queues are named by batch, e.g. "investigate", "investigate:v3.0.0" or
+"refactor". The database uses the rollback journal rather than WAL so it
+also works on network file systems.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+LEASE_SECONDS = 300
+MAX_ATTEMPTS = 3
+# Claim order: higher first, then lower Issue number
+PRIORITY_LABELS = {"breaking-change": 3, "new-feature": 2, "enhancement": 1}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    queue TEXT NOT NULL,
+    issue INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    outcome TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (queue, issue)
+)
+"""
+
+
+def issue_priority(labels: list[str]) -> int:
+    return max((PRIORITY_LABELS.get(label, 0) for label in labels), default=0)
+
+
+def worker_id() -> str:
+    """Lease owner name of this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    def __init__(self, path: Path, lease_seconds: int = LEASE_SECONDS, max_attempts: int = MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps it safe across threads
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+    # -- filling -----------------------------------------------------------
+
+    def pending(self, queue: str) -> int:
+        """Issues without an outcome that can still be claimed."""
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM items WHERE queue = ? AND outcome IS NULL AND attempts < ?",
+                              (queue, self.max_attempts)).fetchone()[0]
+
+    def sync(self, queue: str, issues: list[dict]) -> tuple[int, int]:
+        """Add new open Issues ({number, title, labels}) and drop unclaimed ones no longer open.
+
+        Issues dropped as closed that are open again (reopened or relabelled) are
+        queued afresh; other finished Issues keep their outcome. Returns (added, dropped).
+        """
+        now = time.time()
+        numbers = {issue["number"] for issue in issues}
+        with self._connect() as db:
+            added = 0
+            for issue in issues:
+                added += db.execute(
+                    "INSERT INTO items (queue, issue, title, priority, updated_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (queue, issue) DO UPDATE SET title = excluded.title, priority = excluded.priority, "
+                    "outcome = NULL, attempts = 0, lease_owner = NULL, lease_expires = NULL, "
+                    "updated_at = excluded.updated_at WHERE outcome = 'closed'",
+                    (queue, issue["number"], issue["title"], issue_priority(issue.get("labels", [])), now)).rowcount
+            stale = [row["issue"] for row in db.execute(
+                "SELECT issue FROM items WHERE queue = ? AND outcome IS NULL AND (lease_expires IS NULL OR lease_expires < ?)",
+                (queue, now)) if row["issue"] not in numbers]
+            db.executemany("UPDATE items SET outcome = 'closed', updated_at = ? WHERE queue = ? AND issue = ?",
+                           [(now, queue, number) for number in stale])
+        return added, len(stale)
+
+    # -- claiming ----------------------------------------------------------
+
+    def claim(self, queue: str, owner: str) -> dict | None:
+        """Lease the next unfinished Issue whose lease is free or expired. Returns None when none is left."""
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT issue, title, attempts FROM items WHERE queue = ? AND outcome IS NULL AND attempts < ? "
+                "AND (lease_expires IS NULL OR lease_expires < ?) ORDER BY priority DESC, issue LIMIT 1",
+                (queue, self.max_attempts, now)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE items SET lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? "
+                       "WHERE queue = ? AND issue = ?", (owner, now + self.lease_seconds, now, queue, row["issue"]))
+        return {"number": row["issue"], "title": row["title"], "attempt": row["attempts"] + 1}
+
+    def claims(self, queue: str, owner: str, limit: int | None = None) -> Iterator[dict]:
+        """Claim Issues one at a time as the consumer asks for them, up to `limit`."""
+        claimed = 0
+        while limit is None or claimed < limit:
+            issue = self.claim(queue, owner)
+            if issue is None:
+                return
+            claimed += 1
+            yield issue
+
+    def renew(self, owner: str) -> int:
+        """Extend every lease held by `owner`. Returns the number renewed."""
+        now = time.time()
+        with self._connect() as db:
+            return db.execute("UPDATE items SET lease_expires = ? WHERE lease_owner = ? AND outcome IS NULL "
+                              "AND lease_expires >= ?", (now + self.lease_seconds, owner, now)).rowcount
+
+    @contextmanager
+    def heartbeat(self, owner: str):
+        """Renew `owner`'s leases in the background for the duration of the block."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self.lease_seconds / 3):
+                try:
+                    self.renew(owner)
+                except sqlite3.Error as e:
+                    print(f"Warning: lease renewal failed: {e}")
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def finish(self, queue: str, issue: int, owner: str, outcome: str) -> bool:
+        """Record the outcome of a claimed Issue. False if the lease was lost to another worker."""
+        with self._connect() as db:
+            return db.execute(
+                "UPDATE items SET outcome = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE queue = ? AND issue = ? AND lease_owner = ?",
+                (outcome, time.time(), queue, issue, owner)).rowcount == 1
+
+    # -- maintenance -------------------------------------------------------
+
+    def items(self, queue: str | None = None) -> list[dict]:
+        with self._connect() as db:
+            rows = db.execute("SELECT * FROM items WHERE ? IS NULL OR queue = ? ORDER BY queue, priority DESC, issue",
+                              (queue, queue)).fetchall()
+        return [dict(row) for row in rows]
+
+    def retry(self, queue: str, outcomes: tuple[str, ...] = ("failed", "timed out")) -> int:
+        """Make finished Issues with one of `outcomes` (and exhausted ones) claimable again."""
+        placeholders = ", ".join("?" * len(outcomes))
+        with self._connect() as db:
+            return db.execute(
+                f"UPDATE items SET outcome = NULL, attempts = 0, lease_owner = NULL, lease_expires = NULL, "
+                f"updated_at = ? WHERE queue = ? AND (outcome IN ({placeholders}) "
+                f"OR (outcome IS NULL AND attempts >= ? AND (lease_expires IS NULL OR lease_expires < ?)))",
+                (time.time(), queue, *outcomes, self.max_attempts, time.time())).rowcount
+
+    def clear(self, queue: str) -> int:
+        with self._connect() as db:
+            return db.execute("DELETE FROM items WHERE queue = ?", (queue,)).rowcount
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Pool of git worktrees for concurrent agent runs.
+
+Investigations commit reports and push branches, so concurrent runs in one
+checkout would collide on the index and the checked-out branch. Each worker
+instead gets its own worktree under .cache/worktrees/ on a throwaway branch
+(pool/worker-{n}), reset to the latest `main` before every issue; worktrees
+and branches are removed when the pool is closed. `main` itself stays checked
+out in the primary checkout only, so agents branch from `origin/main` (see the
+github-workflow skill).
+"""
+
+import queue
+import shutil
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_BASE = "main"
+BRANCH_PREFIX = "pool/worker-"
+
+
+class WorktreePool:
+    """Fixed set of worktrees, each on its own throwaway branch, handed out one per concurrent agent run."""
+
+    def __init__(self, repo_dir: Path, size: int, base: str = DEFAULT_BASE, root: Path | None = None):
+        self.repo_dir = repo_dir
+        self.size = size
+        self.base = base
+        self.root = root or repo_dir / ".cache" / "worktrees"
+        self.paths: list[Path] = []
+        self._branches: dict[Path, str] = {}
+        self._free = queue.Queue()
+
+    def _git(self, *args: str, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
+        result = subprocess.run(["git", *args], cwd=cwd or self.repo_dir, capture_output=True, text=True)
+        if check and result.returncode != 0:
+            raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+        return result
+
+    def _base_ref(self, cwd: Path) -> str:
+        """Latest origin/{base} when the remote is reachable, else the local branch."""
+        self._git("fetch", "--quiet", "origin", self.base, cwd=cwd, check=False)
+        for ref in (f"origin/{self.base}", self.base):
+            if self._git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}", cwd=cwd, check=False).returncode == 0:
+                return ref
+        raise RuntimeError(f"Base branch '{self.base}' not found")
+
+    def open(self) -> "WorktreePool":
+        """Create (or adopt, after a crash) one worktree per worker."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._git("worktree", "prune")
+        ref = self._base_ref(self.repo_dir)
+        for i in range(self.size):
+            path = self.root / f"worker-{i}"
+            branch = f"{BRANCH_PREFIX}{i}"
+            if not (path / ".git").exists():
+                shutil.rmtree(path, ignore_errors=True)
+                self._git("worktree", "add", "--quiet", "-B", branch, str(path), ref)
+            self.paths.append(path)
+            self._branches[path] = branch
+            self._free.put(path)
+        return self
+
+    def reset(self, path: Path):
+        """Discard local changes and point the worktree's branch at the latest base commit (ignored files are kept)."""
+        ref = self._base_ref(path)
+        self._git("checkout", "--quiet", "--force", "-B", self._branches[path], ref, cwd=path)
+        self._git("clean", "-fdq", cwd=path)
+
+    def acquire(self) -> Path:
+        path = self._free.get()
+        try:
+            self.reset(path)
+        except RuntimeError:
+            self._free.put(path)
+            raise
+        return path
+
+    def release(self, path: Path):
+        self._free.put(path)
+
+    @contextmanager
+    def worktree(self):
+        """Borrow a freshly reset worktree for the duration of the block."""
+        path = self.acquire()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def close(self):
+        """Remove every worktree of the pool."""
+        for path in self.paths:
+            self._git("worktree", "remove", "--force", str(path), check=False)
+            shutil.rmtree(path, ignore_errors=True)
+        self._git("worktree", "prune", check=False)
+        for branch in self._branches.values():
+            self._git("branch", "--quiet", "-D", branch, check=False)
+        self.paths = []
+        self._branches = {}
+
+    def __enter__(self) -> "WorktreePool":
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()